@@ -0,0 +1,123 @@
+"""
+Measures the per-request cost of the `EsmeraldMiddleware` compared with the
+`BaseHTTPMiddleware` (used by the `BasicHTTPMiddleware`).
+
+The requests are sent straight to the ASGI application, without any server or client, so the
+numbers only show the overhead of the middleware.
+
+Run it with:
+
+    python benchmarks/middleware.py --requests 5000 --layers 5
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware as StarletteMiddleware
+from starlette.types import Message
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.middleware import BasicHTTPMiddleware, EsmeraldMiddleware
+from esmerald.requests import Request
+from esmerald.responses import Response
+
+
+class HeaderHTTPMiddleware(BasicHTTPMiddleware):
+    async def dispatch(self, request: Any, call_next: Any) -> Response:
+        response = await call_next(request)
+        response.headers["x-middleware"] = "1"
+        return response
+
+
+class HeaderMiddleware(EsmeraldMiddleware):
+    async def on_headers(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        headers["x-middleware"] = "1"
+
+
+@get("/")
+async def home() -> Dict[str, str]:
+    return {"hello": "world"}
+
+
+def create_app(middleware: Any, layers: int) -> Esmerald:
+    return Esmerald(
+        routes=[Gateway(handler=home)],
+        middleware=[StarletteMiddleware(middleware) for _ in range(layers)] if middleware else [],
+        allowed_hosts=["*"],
+        enable_openapi=False,
+    )
+
+
+async def run(app: Esmerald, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    disconnected = asyncio.Event()
+
+    async def send(message: Message) -> None:
+        ...
+
+    async def request() -> None:
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive() -> Message:
+            if messages:
+                return messages.pop()
+            # Like a server, waits for the client to disconnect.
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        await app(dict(scope), receive, send)
+
+    for _ in range(100):
+        await request()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request()
+    return (time.perf_counter() - start) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--layers", type=int, default=5)
+    args = parser.parse_args()
+
+    results: List[Any] = []
+    for name, middleware in (
+        ("no middleware", None),
+        ("BaseHTTPMiddleware", HeaderHTTPMiddleware),
+        ("EsmeraldMiddleware", HeaderMiddleware),
+    ):
+        app = create_app(middleware, args.layers)
+        results.append((name, asyncio.run(run(app, args.requests))))
+
+    baseline = results[0][1]
+    print(f"{args.requests} requests, {args.layers} middleware layers")
+    for name, elapsed in results:
+        overhead = (elapsed - baseline) / args.layers if name != "no middleware" else 0
+        print(
+            f"{name:<20} {elapsed * 1e6:9.1f} us/request"
+            f"   {overhead * 1e6:7.1f} us per middleware layer"
+        )
+
+
+if __name__ == "__main__":
+    main()
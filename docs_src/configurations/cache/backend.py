@@ -0,0 +1,36 @@
+from typing import Optional, Sequence
+
+from redis.asyncio import Redis
+
+from esmerald import CacheConfig, Esmerald
+from esmerald.cache import CachedResponse
+
+
+class RedisCache:
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        data = await self.redis.get(key)
+        return CachedResponse.decode(data) if data is not None else None
+
+    async def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        async with self.redis.pipeline() as pipeline:
+            pipeline.set(key, value.encode(), px=int(ttl * 1000))
+            for tag in value.tags:
+                pipeline.sadd(f"tag:{tag}", key)
+            await pipeline.execute()
+
+    async def delete(self, key: str) -> None:
+        await self.redis.delete(key)
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            keys = await self.redis.smembers(f"tag:{tag}")
+            await self.redis.delete(f"tag:{tag}", *keys)
+
+    async def clear(self) -> None:
+        await self.redis.flushdb()
+
+
+app = Esmerald(cache_config=CacheConfig(backend=RedisCache(Redis())))
@@ -0,0 +1,21 @@
+from typing import Dict
+
+from esmerald import Cache, CacheConfig, Esmerald, Gateway, get
+
+
+@get("/products", cache=True)
+async def products() -> Dict[str, str]:
+    return {"products": "all"}
+
+
+@get("/products/{product_id}", cache=Cache(ttl=300, tags=["product:{product_id}"]))
+async def product(product_id: int) -> Dict[str, int]:
+    return {"id": product_id}
+
+
+cache_config = CacheConfig(ttl=60, stale_while_revalidate=30, vary_headers=["accept-language"])
+
+app = Esmerald(
+    routes=[Gateway(handler=products), Gateway(handler=product)],
+    cache_config=cache_config,
+)
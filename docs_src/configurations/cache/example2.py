@@ -0,0 +1,20 @@
+from typing import Dict
+
+from esmerald import APIView, Cache, Request, get, put
+
+
+class ProductView(APIView):
+    path = "/products"
+    cache = Cache(ttl=120, tags=["product:{product_id}"])
+
+    @get("/{product_id}")
+    async def product(self, product_id: int) -> Dict[str, int]:
+        return {"id": product_id}
+
+    @get("/{product_id}/stock", cache=False)
+    async def stock(self, product_id: int) -> Dict[str, int]:
+        return {"id": product_id, "stock": 10}
+
+    @put("/{product_id}")
+    async def update(self, request: Request, product_id: int) -> None:
+        await request.app.cache_config.invalidate(f"product:{product_id}")
@@ -0,0 +1,10 @@
+from esmerald import CacheConfig, EsmeraldAPISettings
+
+
+class CustomSettings(EsmeraldAPISettings):
+    @property
+    def cache_config(self) -> CacheConfig:
+        """
+        Initial Default configuration for the cache of the responses.
+        """
+        return CacheConfig(ttl=300, vary_headers=["accept-language"])
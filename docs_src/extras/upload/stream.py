@@ -0,0 +1,25 @@
+from typing import Any, Dict
+
+from esmerald import Esmerald, Gateway, post, status
+from esmerald.datastructures import FormStream
+from esmerald.params import File
+
+
+@post("/upload", status_code=status.HTTP_200_OK)
+async def upload_files(
+    data: FormStream = File(
+        stream=True,
+        max_parts=10,
+        max_part_size=10 * 1024 * 1024,
+        json_fields=["metadata"],
+    )
+) -> Dict[str, Any]:
+    names = []
+    async for upload in data:
+        # Only this file is open, the previous one was already closed.
+        names.append(upload.filename)
+
+    return {"files": names, "metadata": data.fields.get("metadata")}
+
+
+app = Esmerald(routes=[Gateway(handler=upload_files)])
@@ -0,0 +1,30 @@
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+
+from esmerald import Esmerald, JSONResponse, Request
+from esmerald.middleware import EsmeraldMiddleware
+
+
+class TimingMiddleware(EsmeraldMiddleware):
+    async def before_request(self, request: Request) -> Optional[ASGIApp]:
+        if request.headers.get("x-api-key") is None:
+            # Returning a response sends it without calling the application.
+            return JSONResponse({"detail": "Missing API key."}, status_code=401)
+
+        request.state.started = time.perf_counter()
+        return None
+
+    async def on_headers(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        elapsed = time.perf_counter() - request.state.started
+        headers["server-timing"] = f"app;dur={elapsed * 1000:.2f}"
+
+    async def after_response(self, request: Request, status_code: int) -> None:
+        print(f"{request.method} {request.url.path} {status_code}")
+
+
+app = Esmerald(routes=[...], middleware=[TimingMiddleware])
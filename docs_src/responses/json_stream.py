@@ -0,0 +1,29 @@
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.datastructures import NDJSON, JSONStream
+
+
+class Item(BaseModel):
+    name: str
+    value: int
+
+
+async def get_items() -> AsyncIterator[Item]:
+    for value in range(100_000):
+        yield Item(name=f"item-{value}", value=value)
+
+
+@get(path="/items")
+async def items() -> JSONStream[Item]:
+    return JSONStream[Item](iterator=get_items(), batch_size=500)
+
+
+@get(path="/items/ndjson")
+async def items_ndjson() -> NDJSON[Item]:
+    return NDJSON[Item](iterator=get_items())
+
+
+app = Esmerald(routes=[Gateway(handler=items), Gateway(handler=items_ndjson)])
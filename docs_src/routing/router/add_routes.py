@@ -0,0 +1,26 @@
+from esmerald import Esmerald, Gateway, Include, get
+
+
+@get()
+async def home() -> str:
+    return "home"
+
+
+@get()
+async def plugin() -> str:
+    return "plugin"
+
+
+app = Esmerald()
+
+app.add_routes(
+    [
+        Gateway("/home", handler=home),
+        Include("/plugins", routes=[Gateway(handler=plugin)]),
+    ]
+)
+
+# Or, registering the routes one by one.
+with app.deferred_activation():
+    for path in ("/one", "/two", "/three"):
+        app.add_route(path=path, handler=plugin, name=path)
@@ -9,7 +9,15 @@ from esmerald.injector import Inject
 
 from .applications import ChildEsmerald, Esmerald
 from .backgound import BackgroundTask, BackgroundTasks
-from .config import CORSConfig, CSRFConfig, OpenAPIConfig, SessionConfig, StaticFilesConfig
+from .cache import Cache
+from .config import (
+    CacheConfig,
+    CORSConfig,
+    CSRFConfig,
+    OpenAPIConfig,
+    SessionConfig,
+    StaticFilesConfig,
+)
 from .datastructures import JSON, Redirect, Stream, Template, UploadFile
 from .exceptions import (
     HTTPException,
@@ -54,6 +62,8 @@ __all__ = [
     "BackgroundTasks",
     "Body",
     "BasePermission",
+    "Cache",
+    "CacheConfig",
     "ChildEsmerald",
     "CORSConfig",
     "CSRFConfig",
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from datetime import timezone as dtimezone
 from functools import cached_property
 from typing import (
@@ -5,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -23,7 +25,7 @@ from starlette.types import Lifespan, Receive, Scope, Send
 
 from esmerald.conf import settings as esmerald_settings
 from esmerald.conf.global_settings import EsmeraldAPISettings
-from esmerald.config import CORSConfig, CSRFConfig, SessionConfig
+from esmerald.config import CacheConfig, CORSConfig, CSRFConfig, SessionConfig
 from esmerald.config.openapi import OpenAPIConfig
 from esmerald.config.static_files import StaticFilesConfig
 from esmerald.datastructures import State
@@ -44,6 +46,7 @@ from esmerald.permissions.types import Permission
 from esmerald.pluggables import Extension, Pluggable
 from esmerald.protocols.template import TemplateEngineProtocol
 from esmerald.routing import gateways, views
+from esmerald.routing.executors import manage_process_pools
 from esmerald.routing.router import HTTPHandler, Include, Router, WebhookHandler, WebSocketHandler
 from esmerald.types import (
     APIGateHandler,
@@ -63,6 +66,7 @@ from esmerald.utils.helpers import is_class_and_subclass
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.conf import EsmeraldLazySettings
+    from esmerald.openapi.cache import OpenAPIDocument
     from esmerald.types import SettingsType, TemplateConfig
 
 AppType = TypeVar("AppType", bound="Esmerald")
@@ -77,6 +81,7 @@ class Esmerald(Starlette):
         "allow_origins",
         "allowed_hosts",
         "app_name",
+        "cache_config",
         "contact",
         "cors_config",
         "csrf_config",
@@ -92,6 +97,8 @@ class Esmerald(Starlette):
         "license",
         "middleware",
         "openapi_config",
+        "openapi_document",
+        "openapi_routes_enabled",
         "openapi_schema",
         "parent",
         "permissions",
@@ -147,6 +154,7 @@ class Esmerald(Starlette):
         static_files_config: Optional["StaticFilesConfig"] = None,
         template_config: Optional["TemplateConfig"] = None,
         session_config: Optional["SessionConfig"] = None,
+        cache_config: Optional["CacheConfig"] = None,
         response_class: Optional["ResponseType"] = None,
         response_cookies: Optional["ResponseCookies"] = None,
         response_headers: Optional["ResponseHeaders"] = None,
@@ -237,6 +245,9 @@ class Esmerald(Starlette):
             "static_files_config", static_files_config
         )
         self.session_config = self.load_settings_value("session_config", session_config)
+        self.cache_config = (
+            self.load_settings_value("cache_config", cache_config) or CacheConfig()
+        )
         self.response_class = self.load_settings_value("response_class", response_class)
         self.response_cookies = self.load_settings_value("response_cookies", response_cookies)
         self.response_headers = self.load_settings_value("response_headers", response_headers)
@@ -307,6 +318,9 @@ class Esmerald(Starlette):
         )
 
         self.openapi_schema: Optional["OpenAPI"] = None
+        self.openapi_document: Optional["OpenAPIDocument"] = None
+        self.openapi_routes_enabled: bool = False
+        self._activation_depth: int = 0
         self.state = State()
         self.async_exit_config = esmerald_settings.async_exit_config
 
@@ -476,7 +490,57 @@ class Esmerald(Starlette):
             if self.webhooks or not self.openapi_config.webhooks:
                 self.openapi_config.webhooks = self.webhooks
 
+            if self.openapi_routes_enabled:
+                self.openapi_config.invalidate(self)
+                return
+
             self.openapi_config.enable(self)
+            self.openapi_routes_enabled = True
+
+    @property
+    def is_activation_deferred(self) -> bool:
+        """
+        Returns True while inside a `deferred_activation()` block.
+        """
+        return self._activation_depth > 0
+
+    def activate(self, router: Optional["Router"] = None, activate_openapi: bool = True) -> None:
+        """
+        Sorts the routes of the router and refreshes the OpenAPI documentation.
+
+        Does nothing while the activation is deferred, the `deferred_activation()` block
+        activates the application once when it ends.
+        """
+        if self.is_activation_deferred:
+            return
+
+        # The routes were already sorted by `OpenAPIConfig.enable()` when it ran for every
+        # added route, keeping the same ordering now that it runs once per application.
+        (router or self.router).activate()
+        if activate_openapi:
+            self.activate_openapi()
+
+    @contextmanager
+    def deferred_activation(self) -> Iterator[None]:
+        """
+        Defers the sorting of the routes and the activation of the OpenAPI documentation
+        until the end of the block, making the registration of a large number of routes
+        linear instead of quadratic.
+
+        The blocks can be nested, the application is activated when the outermost one ends.
+
+        Example:
+            with app.deferred_activation():
+                for plugin in plugins:
+                    app.add_route(plugin.path, plugin.handler)
+        """
+        self._activation_depth += 1
+        try:
+            yield
+        finally:
+            self._activation_depth -= 1
+            if not self.is_activation_deferred:
+                self.activate()
 
     def get_template_engine(
         self, template_config: "TemplateConfig"
@@ -499,6 +563,39 @@ class Esmerald(Starlette):
         """
         self.router.add_apiview(value=value)
 
+    def add_routes(
+        self,
+        routes: Sequence[Union["gateways.Gateway", "gateways.WebSocketGateway", "Include"]],
+    ) -> None:
+        """
+        Adds a batch of Gateways, WebSocketGateways and Includes into the application router,
+        sorting the routes and activating the OpenAPI documentation only once at the end.
+
+        Example:
+            app.add_routes([Gateway(handler=home), Include("/api", routes=api_routes)])
+        """
+        with self.deferred_activation():
+            for route in routes:
+                if isinstance(route, Include):
+                    self.add_include(route)
+                    continue
+
+                if not isinstance(route, (gateways.Gateway, gateways.WebSocketGateway)):
+                    raise ImproperlyConfigured(
+                        "The routes must be instances of Gateway, WebSocketGateway or Include, "
+                        f"got '{route.__class__.__name__}' instead."
+                    )
+
+                if is_class_and_subclass(route.handler, views.APIView) or isinstance(
+                    route.handler, views.APIView
+                ):
+                    self.add_apiview(route)
+                    continue
+
+                self.router.validate_root_route_parent(route)
+                self.router.create_signature_models(route)
+                self.router.routes.append(route)
+
     def add_route(
         self,
         path: str,
@@ -528,9 +625,7 @@ class Esmerald(Starlette):
             name=name,
             include_in_schema=include_in_schema,
         )
-
-        if activate_openapi:
-            self.activate_openapi()
+        self.activate(router, activate_openapi=activate_openapi)
 
     def add_websocket_route(
         self,
@@ -545,7 +640,7 @@ class Esmerald(Starlette):
         name: Optional[str] = None,
     ) -> None:
         router = router or self.router
-        return router.add_websocket_route(
+        router.add_websocket_route(
             path=path,
             handler=handler,
             dependencies=dependencies,
@@ -555,6 +650,7 @@ class Esmerald(Starlette):
             middleware=middleware,
             name=name,
         )
+        self.activate(router, activate_openapi=False)
 
     def add_include(self, include: Include) -> None:
         """
@@ -566,7 +662,7 @@ class Esmerald(Starlette):
         for route in include.routes:
             self.router.create_signature_models(route)
 
-        self.activate_openapi()
+        self.activate()
 
     def add_child_esmerald(
         self,
@@ -604,7 +700,7 @@ class Esmerald(Starlette):
                 security=security,
             )
         )
-        self.activate_openapi()
+        self.activate()
 
     def add_router(self, router: "Router") -> None:
         """
@@ -655,7 +751,7 @@ class Esmerald(Starlette):
                 )
             )
 
-        self.activate_openapi()
+        self.activate()
 
     def get_default_exception_handlers(self) -> None:
         """
@@ -680,30 +776,6 @@ class Esmerald(Starlette):
 
         self.exception_handlers.setdefault(ValidationError, pydantic_validation_error_handler)
 
-    def build_routes_middleware(
-        self, route: "RouteParent", middlewares: Optional[List["Middleware"]] = None
-    ) -> List["Middleware"]:
-        """
-        Builds the middleware stack from the top to the bottom of the routes.
-
-        The includes are an exception as they are treated as an independent ASGI
-        application and therefore handles their own middlewares independently.
-        """
-        if not middlewares:
-            middlewares = []
-
-        if isinstance(route, Include):
-            app = getattr(route, "app", None)
-            if app and isinstance(app, (Esmerald, ChildEsmerald)):
-                return middlewares
-
-        if isinstance(route, (gateways.Gateway, gateways.WebSocketGateway)):
-            middlewares.extend(route.middleware)
-            if route.handler.middleware:
-                middlewares.extend(route.handler.middleware)
-
-        return middlewares
-
     def build_routes_exception_handlers(
         self,
         route: "RouteParent",
@@ -741,10 +813,10 @@ class Esmerald(Starlette):
         CORS, CSRF, TrustedHost and JWT are provided to the __init__ they will wapr the
         handler as well.
 
-        It evaluates the middleware passed into the routes from bottom up
+        The middleware of the routes (Gateways, handlers and Includes) is not part of this
+        stack, it only wraps the routes it was declared on.
         """
         user_middleware = []
-        handlers_middleware: List["Middleware"] = []
 
         if self.allowed_hosts:
             user_middleware.append(
@@ -762,11 +834,7 @@ class Esmerald(Starlette):
                 StarletteMiddleware(SessionMiddleware, **self.session_config.model_dump())
             )
 
-        handlers_middleware += self.router.middleware
-        for route in self.routes or []:
-            handlers_middleware.extend(self.build_routes_middleware(route))
-
-        self._middleware += handlers_middleware
+        self._middleware += self.router.middleware
 
         for middleware in self._middleware or []:
             if isinstance(middleware, StarletteMiddleware):
@@ -881,7 +949,7 @@ class Esmerald(Starlette):
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         scope["app"] = self
         if scope["type"] == "lifespan":
-            await self.router.lifespan(scope, receive, send)
+            await self.router.lifespan(scope, receive, manage_process_pools(self, send))
             return
         if self.root_path:
             scope["root_path"] = self.root_path
@@ -0,0 +1,4 @@
+from .backends import MemoryCache
+from .core import Cache, CachedResponse
+
+__all__ = ["Cache", "CachedResponse", "MemoryCache"]
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Set
+
+from esmerald.cache.core import CachedResponse
+
+
+class MemoryCache:
+    """
+    In-memory LRU cache of the responses, bounded by the size of the cached responses.
+
+    The least recently used responses are evicted when the total size goes over `max_size`
+    bytes, the responses bigger than `max_size` are never cached. The cache is local to the
+    process, use an external store to share it between the workers.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.tags: Dict[str, Set[str]] = {}
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        if time.time() >= entry.stale_until:
+            self.remove(key)
+            return None
+
+        self.entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        if value.size > self.max_size:
+            return
+
+        self.remove(key)
+        self.entries[key] = value
+        self.size += value.size
+        for tag in value.tags:
+            self.tags.setdefault(tag, set()).add(key)
+
+        while self.size > self.max_size:
+            self.remove(next(iter(self.entries)))
+
+    async def delete(self, key: str) -> None:
+        self.remove(key)
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            for key in self.tags.pop(tag, ()):
+                self.remove(key)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+        self.tags.clear()
+        self.size = 0
+
+    def remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+
+        self.size -= entry.size
+        for tag in entry.tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
@@ -0,0 +1,375 @@
+import time
+from hashlib import blake2b
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import orjson
+from loguru import logger
+from pydantic import BaseModel
+from starlette.responses import Response as StarletteResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from esmerald.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.config.cache import CacheConfig
+    from esmerald.requests import Request
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+NOT_MODIFIED_EXCLUDED_HEADERS = {b"content-length", b"content-type", b"content-encoding"}
+UNCACHEABLE_DIRECTIVES = ("no-store", "private")
+CREDENTIALS_HEADERS = ("authorization", "cookie")
+
+# The keys being revalidated, making sure a stale response is only refreshed once at a time.
+_revalidating: Set[str] = set()
+
+
+class Cache(BaseModel):
+    """
+    The cache of the responses of a handler. The values not declared are the ones of the
+    `CacheConfig` of the application.
+
+    The `tags` can use the path parameters, for instance `item:{item_id}`, and are used to
+    invalidate the cached responses.
+
+    The requests with an `Authorization` or a `Cookie` header are not cached, their responses
+    possibly depending on the user, unless `shared` is True.
+    """
+
+    ttl: Optional[float] = None
+    stale_while_revalidate: Optional[float] = None
+    vary_headers: List[str] = []
+    tags: List[str] = []
+    shared: bool = False
+
+
+CacheType = Union[bool, int, float, Cache]
+
+
+class CachedResponse:
+    """
+    A response stored by the cache, already rendered.
+    """
+
+    __slots__ = (
+        "status_code",
+        "headers",
+        "body",
+        "etag",
+        "tags",
+        "created_at",
+        "expires_at",
+        "stale_until",
+    )
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: RawHeaders,
+        body: bytes,
+        etag: str,
+        tags: Sequence[str] = (),
+        created_at: float = 0.0,
+        expires_at: float = 0.0,
+        stale_until: float = 0.0,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.tags = list(tags)
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(key) + len(value) for key, value in self.headers)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def encode(self) -> bytes:
+        """
+        Encodes the response in bytes, to be stored by the external stores.
+        """
+        meta = orjson.dumps(
+            {
+                "status_code": self.status_code,
+                "headers": [
+                    [key.decode("latin-1"), value.decode("latin-1")] for key, value in self.headers
+                ],
+                "etag": self.etag,
+                "tags": self.tags,
+                "created_at": self.created_at,
+                "expires_at": self.expires_at,
+                "stale_until": self.stale_until,
+            }
+        )
+        return meta + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CachedResponse":
+        meta, body = data.split(b"\n", 1)
+        values = orjson.loads(meta)
+        values["headers"] = [
+            (key.encode("latin-1"), value.encode("latin-1")) for key, value in values["headers"]
+        ]
+        return cls(body=body, **values)
+
+
+def get_cache_key(prefix: str, request: "Request", vary_headers: Sequence[str]) -> str:
+    """
+    Builds the key of the response from the path, the sorted query parameters and the values
+    of the `vary_headers`.
+    """
+    parts = [request.url.path]
+    parts.extend(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    parts.extend(f"{header}:{request.headers.get(header, '')}" for header in vary_headers)
+    digest = blake2b("\x00".join(parts).encode("utf-8"), digest_size=20).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of the `If-None-Match` header with the ETag of the response.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag[2:] if etag.startswith("W/") else etag
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if (value[2:] if value.startswith("W/") else value) == etag:
+            return True
+    return False
+
+
+def has_uncacheable_headers(headers: RawHeaders) -> bool:
+    """
+    Checks if the response sets a cookie or declares `Cache-Control: no-store` or `private`.
+    """
+    for name, value in headers:
+        if name.lower() == b"set-cookie":
+            return True
+        if name.lower() == b"cache-control" and any(
+            directive in value.decode("latin-1").lower() for directive in UNCACHEABLE_DIRECTIVES
+        ):
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Serves the responses of a handler from the cache of the application, handling the
+    ETags (`If-None-Match` answered with a `304`) and the `stale-while-revalidate`.
+
+    Only the rendered responses with a `200` are cached, the streamed ones, the ones with
+    background tasks, setting cookies or declaring `Cache-Control: no-store` or `private`
+    are always sent as they are, as well as the responses of the requests with credentials
+    unless the cache is `shared`.
+    """
+
+    __slots__ = ("options",)
+
+    def __init__(self, options: Cache) -> None:
+        self.options = options
+
+    async def __call__(
+        self,
+        config: "CacheConfig",
+        request: "Request",
+        get_response: Callable[[], Awaitable[StarletteResponse]],
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if not self.options.shared and any(
+            header in request.headers for header in CREDENTIALS_HEADERS
+        ):
+            # The dependencies are not called on a hit, the response of a user must not be
+            # sent to the others.
+            response = await get_response()
+            await response(scope, receive, send)
+            return
+
+        vary_headers = [*config.vary_headers, *self.options.vary_headers]
+        key = get_cache_key(config.key_prefix, request, vary_headers)
+        now = time.time()
+
+        entry = await config.backend.get(key)  # type: ignore[union-attr]
+        if entry is not None and now < entry.stale_until:
+            await self.send_cached(entry, request, send, now)
+            if not entry.is_fresh(now) and key not in _revalidating:
+                await self.revalidate(
+                    config, key, request, get_response, vary_headers, scope, receive
+                )
+            return
+
+        response = await get_response()
+        if not self.is_cacheable(response):
+            await response(scope, receive, send)
+            return
+
+        messages = await self.render(response, scope, receive)
+        entry = await self.store(config, key, request, messages, vary_headers)
+        if entry is None:
+            # Headers added while rendering made the response uncacheable, it is sent as
+            # rendered instead of running it again.
+            for message in messages:
+                await send(message)
+            return
+        await self.send_cached(entry, request, send, now)
+
+    async def revalidate(
+        self,
+        config: "CacheConfig",
+        key: str,
+        request: "Request",
+        get_response: Callable[[], Awaitable[StarletteResponse]],
+        vary_headers: Sequence[str],
+        scope: Scope,
+        receive: Receive,
+    ) -> None:
+        """
+        Refreshes a stale response after it was sent, as a background task would. The stale
+        response being already sent, the errors of the handler are logged and never reach the
+        exception handlers, the stale response being kept until it expires.
+        """
+        _revalidating.add(key)
+        try:
+            response = await get_response()
+            if self.is_cacheable(response):
+                messages = await self.render(response, scope, receive)
+                await self.store(config, key, request, messages, vary_headers)
+        except Exception:  # noqa
+            logger.exception(f"Failed to revalidate the cached response of {request.url.path}.")
+        finally:
+            _revalidating.discard(key)
+
+    def is_cacheable(self, response: StarletteResponse) -> bool:
+        """
+        Checks, before rendering it, if the response can be cached.
+        """
+        return (
+            response.status_code == 200
+            and isinstance(getattr(response, "body", None), bytes)
+            and response.background is None
+            and not has_uncacheable_headers(response.raw_headers)
+        )
+
+    async def render(
+        self, response: StarletteResponse, scope: Scope, receive: Receive
+    ) -> List[Message]:
+        """
+        Runs the response, capturing the ASGI messages it sends.
+        """
+        messages: List[Message] = []
+
+        async def capture(message: Message) -> None:
+            messages.append(message)
+
+        await response(scope, receive, capture)
+        return messages
+
+    async def store(
+        self,
+        config: "CacheConfig",
+        key: str,
+        request: "Request",
+        messages: List[Message],
+        vary_headers: Sequence[str],
+    ) -> Optional[CachedResponse]:
+        """
+        Stores the rendered response, returning None when its headers prevent caching it.
+        """
+        headers: RawHeaders = list(messages[0]["headers"])
+        if has_uncacheable_headers(headers):
+            return None
+
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        etag = next((value.decode("latin-1") for name, value in headers if name == b"etag"), None)
+        if etag is None:
+            etag = make_etag(body)
+            headers.append((b"etag", etag.encode("latin-1")))
+        if vary_headers and not any(name == b"vary" for name, _ in headers):
+            headers.append((b"vary", ", ".join(vary_headers).encode("latin-1")))
+
+        ttl = self.options.ttl if self.options.ttl is not None else config.ttl
+        stale_while_revalidate = (
+            self.options.stale_while_revalidate
+            if self.options.stale_while_revalidate is not None
+            else config.stale_while_revalidate
+        )
+        now = time.time()
+        entry = CachedResponse(
+            status_code=messages[0]["status"],
+            headers=headers,
+            body=body,
+            etag=etag,
+            tags=[tag.format(**request.path_params) for tag in self.options.tags],
+            created_at=now,
+            expires_at=now + ttl,
+            stale_until=now + ttl + stale_while_revalidate,
+        )
+        await config.backend.set(  # type: ignore[union-attr]
+            key, entry, ttl + stale_while_revalidate
+        )
+        return entry
+
+    async def send_cached(
+        self, entry: CachedResponse, request: "Request", send: Send, now: float
+    ) -> None:
+        age = (b"age", str(max(int(now - entry.created_at), 0)).encode("latin-1"))
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, entry.etag):
+            headers = [
+                header
+                for header in entry.headers
+                if header[0] not in NOT_MODIFIED_EXCLUDED_HEADERS
+            ]
+            await send({"type": "http.response.start", "status": 304, "headers": [*headers, age]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": entry.status_code,
+                "headers": [*entry.headers, age],
+            }
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+
+def get_cache_options(value: Any) -> Optional[Cache]:
+    """
+    Converts the `cache` of a handler (`True`, a ttl in seconds or a `Cache`) into a `Cache`.
+    """
+    if value is None or value is False:
+        return None
+    if value is True:
+        return Cache()
+    if isinstance(value, Cache):
+        return value
+    if isinstance(value, (int, float)):
+        return Cache(ttl=value)
+    raise ImproperlyConfigured(
+        f"Invalid cache {value!r}. Use either a bool, a ttl in seconds or a Cache."
+    )
@@ -1 +1,333 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import AsyncExitStack as AsyncExitStack  # noqa
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import anyio
+import anyio.to_process
+import anyio.to_thread
+import sniffio
+from anyio import CapacityLimiter
+
+from esmerald.exceptions import ImproperlyConfigured, ServiceUnavailable
+
+T = TypeVar("T")
+
+SYNC_HANDLERS_LIMITER = "sync_handlers"
+
+_limiters: Dict[Tuple[str, str], CapacityLimiter] = {}
+_thread_pools: Dict[str, float] = {}
+
+
+@dataclass(frozen=True)
+class LimiterStatistics:
+    """
+    Snapshot of a named limiter, used to size its pool.
+
+    `tasks_waiting` is the queue depth, the number of calls waiting for a free worker.
+    """
+
+    name: str
+    total_tokens: float
+    borrowed_tokens: int
+    tasks_waiting: int
+
+
+def register_thread_pool(name: str, total_tokens: float) -> None:
+    """
+    Declares the size of the thread pool `name`, once, when the handlers using it are declared.
+
+    Raises:
+        ImproperlyConfigured when the pool was already declared with another size.
+    """
+    size = _thread_pools.setdefault(name, total_tokens)
+    if size != total_tokens:
+        raise ImproperlyConfigured(
+            f"The thread pool '{name}' is already declared with {size} workers, "
+            f"it cannot be declared again with {total_tokens}."
+        )
+
+
+def get_limiter(name: str, total_tokens: float) -> CapacityLimiter:
+    """
+    Returns the limiter registered under `name`, creating it with `total_tokens` workers.
+
+    The limiters are kept per async library (asyncio, trio) since they cannot be shared between
+    them. The thread pools declared with `register_thread_pool` keep their declared size, the
+    other limiters are resized when `total_tokens` changes, following the settings.
+    """
+    total_tokens = _thread_pools.get(name, total_tokens)
+    key = (sniffio.current_async_library(), name)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = CapacityLimiter(total_tokens)
+    elif limiter.total_tokens != total_tokens:
+        limiter.total_tokens = total_tokens
+    return limiter
+
+
+def get_limiter_statistics(name: Optional[str] = None) -> List[LimiterStatistics]:
+    """
+    Returns the statistics of the limiters registered under `name`, one per async library
+    in use, or of all the registered limiters when no `name` is given.
+    """
+    statistics: List[LimiterStatistics] = []
+    for (_, limiter_name), limiter in _limiters.items():
+        if name is not None and limiter_name != name:
+            continue
+        stats = limiter.statistics()
+        statistics.append(
+            LimiterStatistics(
+                name=limiter_name,
+                total_tokens=limiter.total_tokens,
+                borrowed_tokens=stats.borrowed_tokens,
+                tasks_waiting=stats.tasks_waiting,
+            )
+        )
+    return statistics
+
+
+async def run_in_limiter(
+    name: str,
+    total_tokens: float,
+    func: Callable[..., T],
+    *args: Any,
+    process: bool = False,
+) -> T:
+    """
+    Runs the blocking `func` in a worker thread, or a worker process when `process` is True,
+    bounded by the limiter registered under `name`.
+
+    In a worker process, `func` and its arguments must be picklable.
+    """
+    limiter = get_limiter(name, total_tokens)
+    if process:
+        return await anyio.to_process.run_sync(func, *args, limiter=limiter)
+    return await anyio.to_thread.run_sync(func, *args, limiter=limiter)
+
+
+DEFAULT_PROCESS_POOL = "default"
+
+_process_pools: Dict[str, "ProcessPool"] = {}
+_process_pool_sizes: Dict[str, int] = {}
+
+
+@dataclass(frozen=True)
+class ProcessPoolStatistics:
+    """
+    Snapshot of a process pool.
+
+    `queued` is the number of calls waiting for a free worker, `completed` the number of calls
+    that ran, successfully or not, and `rejected` the number of calls refused because the queue
+    was full.
+    """
+
+    name: str
+    max_workers: int
+    max_queue_size: int
+    started: bool
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+
+
+def preload_modules(modules: Sequence[str]) -> None:
+    """
+    Imports the `modules` when a worker process starts, before it receives any call.
+    """
+    for module in modules:
+        import_module(module)
+
+
+def warm_worker() -> None:
+    """
+    Called once per worker when warming up a pool, making sure all of them are started.
+    """
+
+
+class ProcessPool:
+    """
+    A named `ProcessPoolExecutor` started on demand, or warmed up by the application startup.
+
+    The workers are spawned (never forked from a process running an event loop and threads) and
+    import the `preload` modules when starting. At most `max_workers` calls run at the same time
+    and `max_queue_size` wait for a free worker, the next ones are rejected with a
+    `ServiceUnavailable` (503) instead of piling up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 64,
+        preload: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.name = name
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+        self.preload: List[str] = list(preload or [])
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    @property
+    def statistics(self) -> ProcessPoolStatistics:
+        return ProcessPoolStatistics(
+            name=self.name,
+            max_workers=self.max_workers,
+            max_queue_size=self.max_queue_size,
+            started=self.executor is not None,
+            running=min(self.pending, self.max_workers),
+            queued=max(self.pending - self.max_workers, 0),
+            completed=self.completed,
+            rejected=self.rejected,
+        )
+
+    def add_preload(self, modules: Sequence[str]) -> None:
+        """
+        Adds the `modules` to the ones imported by the workers started from now on.
+        """
+        for module in modules:
+            if module not in self.preload:
+                self.preload.append(module)
+
+    def start(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=preload_modules,
+                initargs=(tuple(self.preload),),
+            )
+        return self.executor
+
+    async def warm_up(self) -> None:
+        """
+        Starts all the workers, paying the cost of spawning them and importing the preloaded
+        modules before the first call.
+        """
+        executor = self.start()
+        futures = [executor.submit(warm_worker) for _ in range(self.max_workers)]
+        await anyio.to_thread.run_sync(wait, futures)
+
+    async def shutdown(self) -> None:
+        """
+        Stops the workers, waiting for the calls in progress. The pool starts again on demand.
+        """
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            await anyio.to_thread.run_sync(executor.shutdown)
+
+    def finish(self, future: "Future[Any]") -> None:
+        """
+        Called by the executor once a call finished or was cancelled before starting.
+        """
+        with self.lock:
+            self.pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+
+    def discard(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Discards a broken executor, the next call starting a new one.
+        """
+        if self.executor is executor:
+            self.executor = None
+        executor.shutdown(wait=False)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs `func` in a worker, `func`, its arguments and its result must be picklable.
+
+        Raises:
+            ServiceUnavailable when the queue of the pool is full or a worker died.
+        """
+        capacity = self.max_workers + self.max_queue_size
+        if self.pending >= capacity:
+            self.rejected += 1
+            raise ServiceUnavailable(detail="The server is too busy to process the request.")
+
+        executor = self.start()
+        try:
+            future = executor.submit(func, *args)
+        except BrokenProcessPool:
+            self.discard(executor)
+            raise ServiceUnavailable(detail="The worker process stopped unexpectedly.") from None
+
+        with self.lock:
+            self.pending += 1
+        future.add_done_callback(self.finish)
+        try:
+            # The waiting threads are bounded by the capacity of the pool.
+            return await anyio.to_thread.run_sync(
+                future.result,
+                cancellable=True,
+                limiter=get_limiter(f"process_pool:{self.name}", capacity),
+            )
+        except BrokenProcessPool:
+            self.discard(executor)
+            raise ServiceUnavailable(detail="The worker process stopped unexpectedly.") from None
+        finally:
+            # Drops the call still waiting for a worker when the request is cancelled.
+            future.cancel()
+
+
+def register_process_pool(name: str, max_workers: int) -> None:
+    """
+    Declares the number of workers of the process pool `name`, once, when the handlers using it
+    are declared.
+
+    Raises:
+        ImproperlyConfigured when the pool was already declared, or started, with another size.
+    """
+    pool = _process_pools.get(name)
+    size = _process_pool_sizes.setdefault(name, pool.max_workers if pool else max_workers)
+    if size != max_workers:
+        raise ImproperlyConfigured(
+            f"The process pool '{name}' is already declared with {size} workers, "
+            f"it cannot be declared again with {max_workers}."
+        )
+
+
+def get_process_pool(
+    name: str = DEFAULT_PROCESS_POOL,
+    max_workers: Optional[int] = None,
+    max_queue_size: int = 64,
+    preload: Optional[Sequence[str]] = None,
+) -> ProcessPool:
+    """
+    Returns the process pool registered under `name`, creating it when needed.
+
+    The pools declared with `register_process_pool` keep their declared size, the `preload`
+    modules are added to the ones of the existing pool.
+    """
+    pool = _process_pools.get(name)
+    if pool is None:
+        pool = _process_pools[name] = ProcessPool(
+            name,
+            max_workers=_process_pool_sizes.get(name, max_workers),
+            max_queue_size=max_queue_size,
+            preload=preload,
+        )
+    elif preload:
+        pool.add_preload(preload)
+    return pool
+
+
+def get_process_pool_statistics(name: Optional[str] = None) -> List[ProcessPoolStatistics]:
+    """
+    Returns the statistics of the process pool registered under `name` or of all of them.
+    """
+    return [
+        pool.statistics
+        for pool_name, pool in _process_pools.items()
+        if name is None or pool_name == name
+    ]
@@ -8,8 +8,16 @@ from starlette.types import Lifespan
 
 from esmerald import __version__
 from esmerald.conf.enums import EnvironmentType
-from esmerald.config import CORSConfig, CSRFConfig, OpenAPIConfig, SessionConfig, StaticFilesConfig
+from esmerald.config import (
+    CacheConfig,
+    CORSConfig,
+    CSRFConfig,
+    OpenAPIConfig,
+    SessionConfig,
+    StaticFilesConfig,
+)
 from esmerald.config.asyncexit import AsyncExitConfig
+from esmerald.enums import ExecutorType, JSONEncoderType
 from esmerald.interceptors.types import Interceptor
 from esmerald.permissions.types import Permission
 from esmerald.pluggables import Pluggable
@@ -50,12 +58,22 @@ class EsmeraldAPISettings(BaseSettings):
     response_class: Optional[ResponseType] = None
     response_cookies: Optional[ResponseCookies] = None
     response_headers: Optional[ResponseHeaders] = None
+    json_encoder: str = JSONEncoderType.ORJSON
+    enable_response_validation: bool = False
+    request_max_body_size: Optional[int] = None
+    lazy_handlers: bool = False
+    password_hashers_workers: int = 4
+    password_hashers_executor: str = ExecutorType.THREAD
     include_in_schema: bool = True
     tags: Optional[List[Tag]] = None
     timezone: str = "UTC"
     use_tz: bool = False
     root_path: Optional[str] = ""
     enable_sync_handlers: bool = True
+    sync_handlers_workers: int = 40
+    process_pool_workers: Optional[int] = None
+    process_pool_max_queue_size: int = 64
+    process_pool_preload: List[str] = []
     enable_scheduler: bool = False
     enable_openapi: bool = True
     redirect_slashes: bool = True
@@ -228,6 +246,25 @@ class EsmeraldAPISettings(BaseSettings):
             return None
         return CORSConfig(allow_origins=self.allow_origins)
 
+    @property
+    def cache_config(self) -> Optional[CacheConfig]:
+        """
+        Initial Default configuration for the cache of the responses of the handlers declaring a
+        `cache`.
+
+        Default:
+            None, meaning an in-memory `CacheConfig()`.
+
+        Example:
+
+            class MySettings(EsmeraldAPISettings):
+
+                @property
+                def cache_config(self) -> CacheConfig:
+                    return CacheConfig(ttl=300, vary_headers=["accept-language"])
+        """
+        return None
+
     @property
     def session_config(self) -> Optional[SessionConfig]:
         """
@@ -0,0 +1,40 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from esmerald.cache.backends import MemoryCache
+from esmerald.protocols.cache import CacheBackendProtocol
+
+
+class CacheConfig(BaseModel):
+    """
+    Configuration of the cache of the responses of the handlers declaring a `cache`.
+
+    Without a `backend`, the responses are kept in memory by a `MemoryCache` bounded to
+    `max_size` bytes.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    backend: Optional[CacheBackendProtocol] = None
+    ttl: float = 60
+    stale_while_revalidate: float = 0
+    vary_headers: List[str] = []
+    max_size: int = 64 * 1024 * 1024
+    key_prefix: str = "esmerald"
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.backend is None:
+            self.backend = MemoryCache(max_size=self.max_size)
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Removes the cached responses of the `tags`.
+        """
+        await self.backend.invalidate_tags(tags)  # type: ignore[union-attr]
+
+    async def clear(self) -> None:
+        """
+        Removes all the cached responses.
+        """
+        await self.backend.clear()  # type: ignore[union-attr]
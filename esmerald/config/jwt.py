@@ -20,3 +20,6 @@ class JWTConfig(BaseModel):
     user_id_claim: str = "user_id"
     access_token_name: str = "access_token"
     refresh_token_name: str = "refresh_token"
+    token_cache_size: int = 1024
+    user_cache_ttl: float = 0
+    user_cache_size: int = 1024
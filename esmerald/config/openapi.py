@@ -1,8 +1,16 @@
 from typing import Any, Dict, List, Optional, Sequence, Union
 
+import orjson
 from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
 from pydantic import AnyUrl, BaseModel
+from starlette.responses import Response as StarletteResponse
 
+from esmerald.openapi.cache import (
+    OpenAPIDocument,
+    get_openapi_fingerprint,
+    load_openapi_document,
+    persist_openapi_document,
+)
 from esmerald.openapi.docs import (
     get_redoc_html,
     get_stoplight_html,
@@ -12,7 +20,7 @@ from esmerald.openapi.docs import (
 from esmerald.openapi.models import Contact, License, Tag
 from esmerald.openapi.openapi import get_openapi
 from esmerald.requests import Request
-from esmerald.responses import HTMLResponse, JSONResponse
+from esmerald.responses import HTMLResponse
 from esmerald.routing.handlers import get
 
 
@@ -46,41 +54,86 @@ class OpenAPIConfig(BaseModel):
     stoplight_url: Optional[str] = None
     stoplight_favicon_url: Optional[str] = None
     webhooks: Optional[Sequence[Any]] = None
+    schema_file: Optional[str] = None
+
+    def get_openapi_config(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "version": self.version,
+            "openapi_version": self.openapi_version,
+            "summary": self.summary,
+            "description": self.description,
+            "tags": self.tags,
+            "servers": self.servers,
+            "terms_of_service": self.terms_of_service,
+            "contact": self.contact,
+            "license": self.license,
+        }
+
+    def get_document(self, app: Any) -> OpenAPIDocument:
+        """
+        Returns the OpenAPI document of the application, generated only when the routes of
+        the application changed since the last time.
+
+        When `schema_file` is set, the document is loaded from the file instead if it was
+        generated for the same routes and configuration (same fingerprint).
+        """
+        document: Optional[OpenAPIDocument] = getattr(app, "openapi_document", None)
+        if document is not None and document.is_current(app.routes):
+            return document
+
+        config = self.get_openapi_config()
+        fingerprint = None
+        if self.schema_file:
+            fingerprint = get_openapi_fingerprint(
+                list(app.routes) + list(self.webhooks or []), **config
+            )
+            content = load_openapi_document(self.schema_file, fingerprint)
+            if content is not None:
+                document = OpenAPIDocument(
+                    orjson.loads(content),
+                    content=content,
+                    fingerprint=fingerprint,
+                    routes=app.routes,
+                )
+                app.openapi_schema = document.schema
+                app.openapi_document = document
+                return document
+
+        openapi_schema = get_openapi(app=app, routes=app.routes, webhooks=self.webhooks, **config)
+        document = OpenAPIDocument(openapi_schema, fingerprint=fingerprint, routes=app.routes)
+        if self.schema_file:
+            persist_openapi_document(self.schema_file, document)
+
+        app.openapi_schema = openapi_schema
+        app.openapi_document = document
+        return document
 
     def openapi(self, app: Any) -> Dict[str, Any]:
         """Loads the OpenAPI routing schema"""
-        openapi_schema = get_openapi(
-            app=app,
-            title=self.title,
-            version=self.version,
-            openapi_version=self.openapi_version,
-            summary=self.summary,
-            description=self.description,
-            routes=app.routes,
-            tags=self.tags,
-            servers=self.servers,
-            terms_of_service=self.terms_of_service,
-            contact=self.contact,
-            license=self.license,
-            webhooks=self.webhooks,
-        )
-        app.openapi_schema = openapi_schema
-        return openapi_schema
+        return self.get_document(app).schema
+
+    def invalidate(self, app: Any) -> None:
+        """Discards the OpenAPI document of the application, generating it again when needed"""
+        app.openapi_schema = None
+        app.openapi_document = None
 
     def enable(self, app: Any) -> None:
         """Enables the OpenAPI documentation"""
+        self.invalidate(app)
         if self.openapi_url:
             urls = {server.get("url") for server in self.servers}
             server_urls = set(urls)
 
             @get(path=self.openapi_url)
-            async def _openapi(request: Request) -> JSONResponse:
+            async def _openapi(request: Request) -> StarletteResponse:
                 root_path = request.scope.get("root_path", "").rstrip("/")
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi(app))
+                        self.invalidate(app)
+                return self.get_document(app).to_response(request)
 
             app.add_route(
                 path="/", handler=_openapi, include_in_schema=False, activate_openapi=False
@@ -0,0 +1,185 @@
+import time
+from collections import OrderedDict
+from copy import copy
+from hashlib import sha256
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+import anyio
+
+from esmerald.security.jwt.token import Token
+
+T = TypeVar("T")
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of the verified tokens, keyed by the hash of the encoded token.
+
+    A token is only kept until its `exp`, a verified token can therefore be reused without
+    decoding it and verifying its signature again, but never after it expired.
+    """
+
+    __slots__ = ("max_size", "tokens")
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.tokens: "OrderedDict[bytes, Tuple[Token, float]]" = OrderedDict()
+
+    @staticmethod
+    def get_key(token: str) -> bytes:
+        return sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Token]:
+        key = self.get_key(token)
+        cached = self.tokens.get(key)
+        if cached is None:
+            return None
+
+        value, expires_at = cached
+        if time.time() >= expires_at:
+            del self.tokens[key]
+            return None
+
+        self.tokens.move_to_end(key)
+        return value
+
+    def set(self, token: str, value: Token) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = self.get_key(token)
+        self.tokens[key] = (value, value.exp.timestamp())
+        self.tokens.move_to_end(key)
+        while len(self.tokens) > self.max_size:
+            self.tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        self.tokens.clear()
+
+
+class SharedLookupError(Exception):
+    """
+    Raised to the concurrent requests sharing a lookup when the loader failed with an error
+    that cannot be copied. The original error is the `__cause__`.
+    """
+
+
+class PendingLookup(Generic[T]):
+    """
+    A lookup in progress, shared by the concurrent requests for the same key.
+    """
+
+    __slots__ = ("event", "value", "error", "done")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[Exception] = None
+        self.done = False
+
+
+class UserCache(Generic[T]):
+    """
+    Cache of the users retrieved by the authentication middlewares.
+
+    The concurrent lookups of the same key (the `sub` of the token) are coalesced into a single
+    call of the loader, shared by all of them, cached or not. The users are cached during `ttl`
+    seconds, the revalidation window after which a revoked or deleted user is not accepted
+    anymore. With a `ttl` of 0 (default) the users are not cached and only the coalescing applies.
+
+    The requests sharing a lookup, or a cached user, receive the same instance: `request.user`
+    may be shared with the concurrent requests and must not be modified per request.
+
+    The storage can be replaced (Redis, memcached...) by overriding `get_user`, `set_user` and
+    `invalidate`.
+    """
+
+    def __init__(self, ttl: float = 0, max_size: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.users: "OrderedDict[Hashable, Tuple[T, float]]" = OrderedDict()
+        self.pending: Dict[Hashable, PendingLookup[T]] = {}
+
+    async def get_user(self, key: Hashable) -> Optional[T]:
+        """
+        Returns the cached user or None.
+        """
+        cached = self.users.get(key)
+        if cached is None:
+            return None
+
+        user, expires_at = cached
+        if time.monotonic() >= expires_at:
+            del self.users[key]
+            return None
+
+        self.users.move_to_end(key)
+        return user
+
+    async def set_user(self, key: Hashable, user: T) -> None:
+        """
+        Caches the user during the revalidation window.
+        """
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        self.users[key] = (user, time.monotonic() + self.ttl)
+        self.users.move_to_end(key)
+        while len(self.users) > self.max_size:
+            self.users.popitem(last=False)
+
+    async def invalidate(self, key: Hashable) -> None:
+        """
+        Removes the user from the cache, for instance when it is revoked.
+        """
+        self.users.pop(key, None)
+
+    @staticmethod
+    def copy_error(error: Exception) -> Exception:
+        """
+        Copies the error of a shared lookup, the requests raising the same instance would
+        overwrite the traceback of each other.
+        """
+        try:
+            return copy(error)
+        except Exception:  # noqa
+            return SharedLookupError(str(error))
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns the cached user or loads it, sharing the lookup with the concurrent
+        requests for the same key. The errors of the loader are raised to all of them, each
+        one receiving its own copy, and never cached. When the request doing the lookup is
+        cancelled, the next one retries it.
+        """
+        while True:
+            user = await self.get_user(key)
+            if user is not None:
+                return user
+
+            pending = self.pending.get(key)
+            if pending is None:
+                break
+
+            await pending.event.wait()
+            if pending.error is not None:
+                raise self.copy_error(pending.error) from pending.error
+            if pending.done:
+                return pending.value  # type: ignore[return-value]
+
+        pending = PendingLookup()
+        self.pending[key] = pending
+        try:
+            user = await loader()
+            if user is not None:
+                await self.set_user(key, user)
+            pending.value = user
+            pending.done = True
+            return user
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            del self.pending[key]
+            pending.event.set()
+
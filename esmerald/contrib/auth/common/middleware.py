@@ -1,10 +1,11 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from jose import JWSError, JWTError
 from starlette.requests import HTTPConnection
 from starlette.types import ASGIApp
 
 from esmerald.config.jwt import JWTConfig
+from esmerald.contrib.auth.common.cache import TokenCache, UserCache
 from esmerald.exceptions import AuthenticationError, NotAuthorized
 from esmerald.middleware.authentication import AuthResult, BaseAuthMiddleware
 from esmerald.security.jwt.token import Token
@@ -22,6 +23,9 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         app: ASGIApp,
         config: "JWTConfig",
         user_model: T,
+        *,
+        token_cache: Optional[TokenCache] = None,
+        user_cache: Optional[UserCache] = None,
     ):
         super().__init__(app)
         """
@@ -53,10 +57,18 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
 
                 app = Esmerald(routes=[...], middleware=[CustomJWTMidleware])
 
+        The verified tokens are cached until they expire (`token_cache_size` of the config)
+        and the concurrent lookups of the same user are shared (`user_cache_ttl` of the config
+        to cache them as well). Custom `token_cache` and `user_cache` can be given instead,
+        for instance to share them between middlewares.
         """
         self.app = app
         self.config = config
         self.user_model = user_model
+        self.token_cache = token_cache or TokenCache(max_size=config.token_cache_size)
+        self.user_cache = user_cache or UserCache(
+            ttl=config.user_cache_ttl, max_size=config.user_cache_size
+        )
 
     async def authenticate(self, request: HTTPConnection) -> AuthResult:
         """
@@ -76,14 +88,20 @@ class CommonJWTAuthMiddleware(BaseAuthMiddleware):  # pragma: no cover
         if token_type not in self.config.auth_header_types:
             raise NotAuthorized(detail=f"{token_type} is not an authorized header type")
 
-        try:
-            token = Token.decode(
-                token=auth_token, key=self.config.signing_key, algorithms=[self.config.algorithm]
-            )  # type: ignore
-        except (JWSError, JWTError) as e:
-            raise AuthenticationError(str(e)) from e
-
-        user = await self.retrieve_user(token.sub)
+        token = self.token_cache.get(auth_token)
+        if token is None:
+            try:
+                token = Token.decode(
+                    token=auth_token,
+                    key=self.config.signing_key,
+                    algorithms=[self.config.algorithm],
+                )  # type: ignore
+            except (JWSError, JWTError) as e:
+                raise AuthenticationError(str(e)) from e
+            self.token_cache.set(auth_token, token)
+
+        sub = token.sub
+        user = await self.user_cache.get_or_load(sub, lambda: self.retrieve_user(sub))
         if not user:
             raise AuthenticationError("User not found.")
         return AuthResult(user=user)
@@ -3,7 +3,12 @@ from typing import Any
 
 import edgy
 
-from esmerald.contrib.auth.hashers import check_password, is_password_usable, make_password
+from esmerald.contrib.auth.hashers import (
+    acheck_password,
+    amake_password,
+    is_password_usable,
+    make_password,
+)
 
 
 class AbstractUser(edgy.Model):
@@ -36,9 +41,9 @@ class AbstractUser(edgy.Model):
         return True
 
     async def set_password(self, raw_password: str) -> None:
-        self.password = make_password(raw_password)
+        self.password = await amake_password(raw_password)
         self._password = raw_password
-        await self.update(password=make_password(raw_password))
+        await self.update(password=self.password)
 
     async def check_password(self, raw_password: str) -> bool:
         """
@@ -47,12 +52,12 @@ class AbstractUser(edgy.Model):
         """
 
         async def setter(raw_password: str) -> None:
-            await self.set_password(raw_password)
             # Password hash upgrades shouldn't be considered password changes.
+            self.password = await amake_password(raw_password)
             self._password = None
             await self.update(password=self.password)
 
-        return check_password(raw_password, str(self.password), setter)
+        return await acheck_password(raw_password, str(self.password), setter)
 
     async def set_unusable_password(self) -> None:
         # Set a value that will never be a valid hash
@@ -73,7 +78,7 @@ class AbstractUser(edgy.Model):
         """
         if not username:
             raise ValueError("The given username must be set")
-        password = make_password(password)
+        password = await amake_password(password)
         user: AbstractUser = await cls.query.create(
             username=username, email=email, password=password, **extra_fields
         )
@@ -1,13 +1,16 @@
 import functools
 import hashlib
+import inspect
 import math
 import secrets
 import warnings
-from typing import Any, Callable, Dict, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 from passlib.context import CryptContext
 
+from esmerald.concurrency import run_in_limiter
 from esmerald.conf import settings
+from esmerald.enums import ExecutorType
 from esmerald.exceptions import ImproperlyConfigured
 from esmerald.utils.module_loading import import_string
 
@@ -26,6 +29,29 @@ def is_password_usable(encoded: Optional[str]) -> bool:
     return encoded is None or not encoded.startswith(UNUSABLE_PASSWORD_PREFIX)
 
 
+PASSWORD_HASHERS_LIMITER = "password_hashers"
+
+
+def verify_password(
+    password: str, encoded: str, preferred: str = "default"
+) -> Tuple[bool, bool]:
+    """
+    Return a tuple of whether the raw password matches the encoded digest
+    and whether the encoded digest must be regenerated with the preferred hasher.
+    """
+    preferred_hasher: BasePasswordHasher = get_hasher(preferred)
+    try:
+        hasher_handler = identify_hasher(encoded)
+    except ValueError:
+        # encoded is gibberish or uses a hasher that's no longer installed.
+        return False, False
+
+    hasher_changed = hasher_handler.algorithm != preferred_hasher.algorithm
+    must_update: bool = hasher_changed or preferred_hasher.must_update(encoded)
+    is_correct: bool = hasher_handler.hasher.verify(password, encoded)
+    return is_correct, must_update
+
+
 def check_password(
     password: str, encoded: str, setter: Callable[..., Any] = None, preferred: str = "default"
 ) -> bool:
@@ -39,19 +65,45 @@ def check_password(
     if password is None or not is_password_usable(encoded):
         return False
 
-    preferred_hasher: BasePasswordHasher = get_hasher(preferred)
-    try:
-        hasher_handler = identify_hasher(encoded)
-    except ValueError:
-        # encoded is gibberish or uses a hasher that's no longer installed.
+    is_correct, must_update = verify_password(password, encoded, preferred)
+
+    if setter and is_correct and must_update:
+        setter(password)
+    return is_correct
+
+
+async def run_hasher(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs the hashing in the pool of `password_hashers_workers` threads or processes,
+    depending on the `password_hashers_executor` setting, keeping the event loop free.
+    """
+    return await run_in_limiter(
+        PASSWORD_HASHERS_LIMITER,
+        settings.password_hashers_workers,
+        func,
+        *args,
+        process=settings.password_hashers_executor == ExecutorType.PROCESS,
+    )
+
+
+async def acheck_password(
+    password: str, encoded: str, setter: Callable[..., Any] = None, preferred: str = "default"
+) -> bool:
+    """
+    Async version of `check_password()` verifying the password in the hashers pool.
+
+    The setter can be sync or async and is called, in the event loop, when the password
+    needs to be regenerated.
+    """
+    if password is None or not is_password_usable(encoded):
         return False
 
-    hasher_changed = hasher_handler.algorithm != preferred_hasher.algorithm
-    must_update: bool = hasher_changed or preferred_hasher.must_update(encoded)
-    is_correct: bool = hasher_handler.hasher.verify(password, encoded)
+    is_correct, must_update = await run_hasher(verify_password, password, encoded, preferred)
 
     if setter and is_correct and must_update:
-        setter(password)
+        result = setter(password)
+        if inspect.isawaitable(result):
+            await result
     return is_correct
 
 
@@ -77,6 +129,15 @@ def make_password(password: Optional[str], hasher: str = "default") -> str:
     return hasher_handler.get_hashed_password(password)
 
 
+async def amake_password(password: Optional[str], hasher: str = "default") -> str:
+    """
+    Async version of `make_password()` hashing the password in the hashers pool.
+    """
+    if password is None:
+        return make_password(password)
+    return await run_hasher(make_password, password, hasher)  # type: ignore[no-any-return]
+
+
 @functools.lru_cache
 def get_hashers() -> Sequence["BasePasswordHasher"]:
     hashers: Sequence["BasePasswordHasher"] = []
@@ -2,7 +2,12 @@ from typing import Any
 
 import saffier
 
-from esmerald.contrib.auth.hashers import check_password, is_password_usable, make_password
+from esmerald.contrib.auth.hashers import (
+    acheck_password,
+    amake_password,
+    is_password_usable,
+    make_password,
+)
 
 
 class AbstractUser(saffier.Model):
@@ -35,9 +40,9 @@ class AbstractUser(saffier.Model):
         return True
 
     async def set_password(self, raw_password: str) -> None:
-        self.password = make_password(raw_password)  # type: ignore
+        self.password = await amake_password(raw_password)  # type: ignore
         self._password = raw_password
-        await self.update(password=make_password(raw_password))
+        await self.update(password=self.password)
 
     async def check_password(self, raw_password: str) -> bool:
         """
@@ -46,12 +51,12 @@ class AbstractUser(saffier.Model):
         """
 
         async def setter(raw_password: str) -> None:
-            await self.set_password(raw_password)
             # Password hash upgrades shouldn't be considered password changes.
+            self.password = await amake_password(raw_password)  # type: ignore
             self._password = None
             await self.update(password=self.password)
 
-        return check_password(raw_password, str(self.password), setter)
+        return await acheck_password(raw_password, str(self.password), setter)
 
     async def set_unusable_password(self) -> None:
         # Set a value that will never be a valid hash
@@ -72,7 +77,7 @@ class AbstractUser(saffier.Model):
         """
         if not username:
             raise ValueError("The given username must be set")
-        password = make_password(password)
+        password = await amake_password(password)
         user: AbstractUser = await cls.query.create(
             username=username, email=email, password=password, **extra_fields
         )
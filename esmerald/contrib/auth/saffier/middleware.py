@@ -1,9 +1,10 @@
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from saffier.exceptions import DoesNotFound
 from starlette.types import ASGIApp
 
 from esmerald.config.jwt import JWTConfig
+from esmerald.contrib.auth.common.cache import TokenCache, UserCache
 from esmerald.contrib.auth.common.middleware import CommonJWTAuthMiddleware
 from esmerald.exceptions import AuthenticationError, NotAuthorized
 
@@ -20,8 +21,11 @@ class JWTAuthMiddleware(CommonJWTAuthMiddleware):
         app: "ASGIApp",
         config: "JWTConfig",
         user_model: T,
+        *,
+        token_cache: Optional[TokenCache] = None,
+        user_cache: Optional[UserCache] = None,
     ):
-        super().__init__(app, config, user_model)
+        super().__init__(app, config, user_model, token_cache=token_cache, user_cache=user_cache)
         """
         The user is simply the class type to be queried from the Saffier ORM.
 
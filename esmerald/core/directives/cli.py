@@ -15,6 +15,7 @@ from esmerald.core.directives.constants import (
 )
 from esmerald.core.directives.env import DirectiveEnv
 from esmerald.core.directives.operations import (
+    compile,
     create_app,
     create_project,
     list,
@@ -128,3 +129,4 @@ esmerald_cli.add_command(create_project)
 esmerald_cli.add_command(create_app)
 esmerald_cli.add_command(runserver)
 esmerald_cli.add_command(shell)
+esmerald_cli.add_command(compile)
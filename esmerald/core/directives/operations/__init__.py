@@ -1,3 +1,4 @@
+from .compile import compile as compile  # noqa
 from .createapp import create_app as create_app  # noqa
 from .createproject import create_project as create_project  # noqa
 from .list import list as list  # noqa
@@ -0,0 +1,71 @@
+import os
+import sys
+from typing import TYPE_CHECKING, Union
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from esmerald.core.directives.constants import ESMERALD_DISCOVER_APP
+from esmerald.core.directives.env import DirectiveEnv
+from esmerald.core.terminal import OutputColour, Print
+from esmerald.routing.compile import compile_handlers
+
+if TYPE_CHECKING:
+    from esmerald.applications import ChildEsmerald, Esmerald
+
+printer = Print()
+console = Console()
+
+
+@click.command(name="compile")
+def compile(env: DirectiveEnv) -> None:
+    """Compiles the handlers of the application and shows how long each one of them took.
+
+    Useful to decide between the `lazy_handlers` (fast startup) and a warmed process.
+
+    How to run: `esmerald compile`
+
+    Example: `esmerald --app myproject.main:app compile`
+    """
+    if os.getenv(ESMERALD_DISCOVER_APP) is None and getattr(env, "app", None) is None:
+        error = (
+            "You cannot specify a custom directive without specifying the --app or setting "
+            "ESMERALD_DEFAULT_APP environment variable."
+        )
+        printer.write_error(error)
+        sys.exit(1)
+
+    app: Union["Esmerald", "ChildEsmerald"] = env.app
+    compiled = compile_handlers(app)
+
+    table = Table(title=app.app_name)
+    table.add_column("Path", style=OutputColour.GREEN, vertical="middle")
+    table.add_column("Name", style=OutputColour.CYAN, vertical="middle")
+    table.add_column("Type", style=OutputColour.YELLOW, vertical="middle")
+    table.add_column("Time (ms)", style=OutputColour.BRIGHT_CYAN, justify="right")
+    table.add_column("Deferred", style=OutputColour.WHITE, vertical="middle")
+    table.add_column("Error", style=OutputColour.RED, vertical="middle")
+
+    for handler in compiled:
+        table.add_row(
+            handler.path,
+            handler.name,
+            handler.type,
+            f"{handler.elapsed * 1000:.2f}",
+            "yes" if handler.deferred else "no",
+            handler.error or "",
+        )
+    console.print(table)
+
+    total = sum(handler.elapsed for handler in compiled)
+    errors = [handler for handler in compiled if handler.error]
+    printer.write_info(f"Compiled {len(compiled)} handlers in {total * 1000:.2f}ms.")
+    if not any(handler.deferred for handler in compiled):
+        printer.write_warning(
+            "The handlers were already compiled at startup, "
+            "enable `lazy_handlers` to measure them."
+        )
+    if errors:
+        printer.write_error(f"{len(errors)} handlers failed to compile.")
+        sys.exit(1)
@@ -14,9 +14,10 @@ from .base import (
     URLPath,
 )
 from .file import File
+from .form import FormStream
 from .json import JSON
 from .redirect import Redirect
-from .stream import Stream
+from .stream import NDJSON, JSONStream, Stream
 from .template import Template
 
 __all__ = [
@@ -24,9 +25,12 @@ __all__ = [
     "Cookie",
     "File",
     "FormData",
+    "FormStream",
     "Headers",
     "JSON",
+    "JSONStream",
     "MutableHeaders",
+    "NDJSON",
     "QueryParams",
     "Redirect",
     "ResponseContainer",
@@ -0,0 +1,229 @@
+from json import JSONDecodeError, loads
+from tempfile import SpooledTemporaryFile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic._internal._schema_generation_shared import GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+from starlette.datastructures import Headers
+from starlette.datastructures import UploadFile as StarletteUploadFile  # noqa
+
+from esmerald.exceptions import PayloadTooLarge, ValidationErrorException
+
+try:
+    import multipart
+    from multipart.multipart import parse_options_header
+except ImportError:  # pragma: no cover
+    multipart = None  # type: ignore
+    parse_options_header = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.requests import Request
+
+DEFAULT_SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class FormStream:
+    """
+    Parses a multipart request while it is being received, handing every file part to the
+    handler as an `UploadFile` as soon as the part is complete.
+
+    The files are spooled in memory up to `spool_max_size` bytes and written to disk after that.
+    Only the file being yielded is kept open, the previous one is closed when the iteration
+    advances. The text fields are collected in `fields` (decoded as JSON when listed in
+    `json_fields`) and are complete once the iteration ends.
+
+    Example:
+        @post("/upload")
+        async def upload(data: FormStream = File(stream=True, max_part_size=10 * 1024**2)):
+            async for upload in data:
+                await storage.save(upload.filename, upload)
+            return data.fields
+    """
+
+    def __init__(
+        self,
+        request: "Request",
+        *,
+        max_parts: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        json_fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        assert (
+            multipart is not None
+        ), "The `python-multipart` library must be installed to use form parsing."
+        self.request = request
+        self.max_parts = max_parts
+        self.max_part_size = max_part_size
+        self.spool_max_size = spool_max_size
+        self.json_fields = frozenset(json_fields or ())
+        self.fields: Dict[str, Any] = {}
+        self.charset = "utf-8"
+
+        self._parts = 0
+        self._part_size = 0
+        self._header_name = b""
+        self._header_value = b""
+        self._headers: List[Tuple[bytes, bytes]] = []
+        self._name = ""
+        self._data = bytearray()
+        self._file: Optional[StarletteUploadFile] = None
+        self._writes: List[Tuple[StarletteUploadFile, bytes]] = []
+        self._completed: List[StarletteUploadFile] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(fields={list(self.fields)})"
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "object", "additionalProperties": {"type": "string", "format": "binary"}}
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Type[Any], handler: Callable[[Any], core_schema.CoreSchema]
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+    def __aiter__(self) -> AsyncIterator[StarletteUploadFile]:
+        return self.parts()
+
+    def decode(self, value: bytes) -> str:
+        try:
+            return value.decode(self.charset)
+        except (UnicodeDecodeError, LookupError):
+            return value.decode("latin-1")
+
+    def add_field(self, name: str, value: Any) -> None:
+        if name in self.json_fields:
+            try:
+                value = loads(value)
+            except JSONDecodeError as e:
+                raise ValidationErrorException(f"The field '{name}' is not valid JSON.") from e
+
+        current = self.fields.get(name)
+        if name not in self.fields:
+            self.fields[name] = value
+        elif isinstance(current, list):
+            current.append(value)
+        else:
+            self.fields[name] = [current, value]
+
+    def on_part_begin(self) -> None:
+        self._parts += 1
+        if self.max_parts is not None and self._parts > self.max_parts:
+            raise PayloadTooLarge(f"Too many parts. Maximum number of parts is {self.max_parts}.")
+        self._part_size = 0
+        self._headers = []
+        self._data = bytearray()
+        self._file = None
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._part_size += end - start
+        if self.max_part_size is not None and self._part_size > self.max_part_size:
+            raise PayloadTooLarge(
+                f"The part '{self._name}' exceeds the maximum size of {self.max_part_size} bytes."
+            )
+        if self._file is None:
+            self._data += data[start:end]
+        else:
+            self._writes.append((self._file, data[start:end]))
+
+    def on_part_end(self) -> None:
+        if self._file is None:
+            self.add_field(self._name, self.decode(bytes(self._data)))
+        else:
+            self._completed.append(self._file)
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers.append((self._header_name.lower(), self._header_value))
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        disposition = dict(self._headers).get(b"content-disposition", b"")
+        _, options = parse_options_header(disposition)
+        try:
+            self._name = self.decode(options[b"name"])
+        except KeyError:
+            raise ValidationErrorException(
+                'The Content-Disposition header field "name" must be provided.'
+            ) from None
+
+        if b"filename" in options:
+            self._file = StarletteUploadFile(
+                file=SpooledTemporaryFile(max_size=self.spool_max_size),  # type: ignore
+                size=0,
+                filename=self.decode(options[b"filename"]),
+                headers=Headers(raw=self._headers),
+            )
+
+    def create_parser(self) -> Any:
+        content_type = self.request.headers.get("content-type", "")
+        media_type, params = parse_options_header(content_type)
+        if media_type != b"multipart/form-data" or b"boundary" not in params:
+            raise ValidationErrorException("Expected a multipart/form-data body with a boundary.")
+
+        charset = params.get(b"charset", b"utf-8")
+        self.charset = charset.decode("latin-1") if isinstance(charset, bytes) else charset
+        callbacks = {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+        return multipart.MultipartParser(params[b"boundary"], callbacks)
+
+    async def parts(self) -> AsyncIterator[StarletteUploadFile]:
+        """
+        Feeds the parser with the chunks of the request body, yielding the file parts as soon
+        as they are complete.
+
+        The file writes happen outside of the parser callbacks, through the `UploadFile` methods
+        which run in a threadpool once the file is rolled over to disk.
+        """
+        parser = self.create_parser()
+        pending: List[StarletteUploadFile] = []
+        try:
+            async for chunk in self.request.stream():
+                parser.write(chunk)
+                for upload, data in self._writes:
+                    if upload not in pending:
+                        pending.append(upload)
+                    await upload.write(data)
+                self._writes.clear()
+
+                completed, self._completed = self._completed, []
+                for upload in completed:
+                    if upload not in pending:
+                        pending.append(upload)
+                    await upload.seek(0)
+                    yield upload
+                    pending.remove(upload)
+                    await upload.close()
+            parser.finalize()
+        finally:
+            for upload in pending:
+                await upload.close()
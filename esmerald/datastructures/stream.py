@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -5,22 +6,34 @@ from typing import (
     AsyncIterable,
     AsyncIterator,
     Callable,
+    ClassVar,
     Dict,
     Generator,
+    Generic,
     Iterable,
     Iterator,
+    List,
+    Optional,
     Type,
+    TypeVar,
     Union,
 )
 
+import anyio
+import orjson
+from pydantic import SkipValidation
 from starlette.responses import StreamingResponse  # noqa
 
 from esmerald.datastructures.base import ResponseContainer  # noqa
 from esmerald.enums import MediaType
+from esmerald.responses.base import ORJSON_OPTIONS, encode_default
+from esmerald.responses.serializers import get_response_serializer
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.applications import Esmerald
 
+T = TypeVar("T")
+
 
 class Stream(ResponseContainer[StreamingResponse]):
     iterator: Union[
@@ -47,3 +60,150 @@ class Stream(ResponseContainer[StreamingResponse]):
             media_type=media_type,
             status_code=status_code,
         )
+
+
+class JSONStream(ResponseContainer[StreamingResponse], Generic[T]):
+    """
+    Streams the items (pydantic models, dataclasses, dicts...) of a sync or async iterator as a
+    JSON array without building the whole list in memory.
+
+    The items are encoded in batches of `batch_size`. When declared as `JSONStream[Item]`, the
+    items are serialized according to `Item` and the schema is documented in OpenAPI.
+
+    Example:
+        async def read_items() -> AsyncIterator[Item]:
+            for number in range(1000):
+                yield Item(name=f"item-{number}")
+
+        @get("/items")
+        async def items() -> JSONStream[Item]:
+            return JSONStream[Item](iterator=read_items())
+    """
+
+    iterator: SkipValidation[
+        Union[
+            Iterable[Any],
+            AsyncIterable[Any],
+            Callable[[], Union[Iterable[Any], AsyncIterable[Any]]],
+        ]
+    ]
+    batch_size: int = 100
+
+    media_type: ClassVar[str] = MediaType.JSON.value
+    start: ClassVar[bytes] = b"["
+    separator: ClassVar[bytes] = b","
+    end: ClassVar[bytes] = b"]"
+
+    @classmethod
+    def item_type(cls) -> Optional[Any]:
+        """
+        The type of the items declared in the container, if any.
+        """
+        args = cls.__pydantic_generic_metadata__["args"]
+        return args[0] if args else None
+
+    @classmethod
+    def schema_annotation(cls) -> Optional[Any]:
+        """
+        The annotation documented in OpenAPI for the whole response.
+        """
+        item_type = cls.item_type()
+        return List[item_type] if item_type is not None else None  # type: ignore[valid-type]
+
+    def encode(self, batch: List[Any]) -> bytes:
+        """
+        Encodes a batch of items into the comma separated elements of a JSON array.
+        """
+        item_type = self.item_type()
+        serializer = get_response_serializer(List[item_type]) if item_type else None  # type: ignore
+        if serializer is not None:
+            return serializer.dump_json(batch, warnings=False)[1:-1]
+        return orjson.dumps(batch, default=encode_default, option=ORJSON_OPTIONS)[1:-1]
+
+    async def batches(self) -> AsyncIterator[List[Any]]:
+        """
+        Groups the items of the iterator in batches. Sync iterators are consumed in a thread,
+        one batch at the time.
+        """
+        iterator = self.iterator
+        if not isinstance(iterator, (Iterable, AsyncIterable)):
+            iterator = iterator()
+
+        if isinstance(iterator, AsyncIterable):
+            batch: List[Any] = []
+            async for item in iterator:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+
+        if isinstance(iterator, (list, tuple)):
+            for position in range(0, len(iterator), self.batch_size):
+                yield list(iterator[position : position + self.batch_size])
+            return
+
+        items = iter(iterator)
+        while True:
+            batch = await anyio.to_thread.run_sync(list, islice(items, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        if self.start:
+            yield self.start
+
+        first = True
+        async for batch in self.batches():
+            chunk = self.encode(batch)
+            if not first and self.separator:
+                chunk = self.separator + chunk
+            first = False
+            yield chunk
+
+        if self.end:
+            yield self.end
+
+    def to_response(
+        self,
+        headers: Dict[str, Any],
+        media_type: Union["MediaType", str],
+        status_code: int,
+        app: Type["Esmerald"],
+    ) -> StreamingResponse:
+        return StreamingResponse(
+            background=self.background,
+            content=self.stream(),
+            headers=headers,
+            media_type=self.media_type,
+            status_code=status_code,
+        )
+
+
+class NDJSON(JSONStream[T], Generic[T]):
+    """
+    Streams the items of a sync or async iterator as newline delimited JSON, one item per
+    line.
+    """
+
+    media_type: ClassVar[str] = MediaType.NDJSON.value
+    start: ClassVar[bytes] = b""
+    separator: ClassVar[bytes] = b""
+    end: ClassVar[bytes] = b""
+
+    @classmethod
+    def schema_annotation(cls) -> Optional[Any]:
+        return cls.item_type()
+
+    def encode(self, batch: List[Any]) -> bytes:
+        item_type = self.item_type()
+        serializer = get_response_serializer(item_type) if item_type else None
+        if serializer is not None:
+            return b"".join(serializer.dump_json(item, warnings=False) + b"\n" for item in batch)
+        return b"".join(
+            orjson.dumps(item, default=encode_default, option=ORJSON_OPTIONS) + b"\n"
+            for item in batch
+        )
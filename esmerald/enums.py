@@ -14,6 +14,7 @@ class HttpMethod(str, Enum):
 
 class MediaType(str, Enum):
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     HTML = "text/html"
     TEXT = "text/plain"
     TEXT_CHARSET = "text/plain; charset=utf-8"
@@ -32,11 +33,26 @@ class EncodingType(str, Enum):
     URL_ENCODED = "application/x-www-form-urlencoded"
 
 
+class JSONEncoderType(str, Enum):
+    ORJSON = "orjson"
+    JSON = "json"
+
+
+class ExecutorType(str, Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class ScopeType(str, Enum):
     HTTP = "http"
     WEBSOCKET = "websocket"
 
 
+class InterceptorLifecycle(str, Enum):
+    SINGLETON = "singleton"
+    PER_REQUEST = "per-request"
+
+
 class ParamType(str, Enum):
     PATH = "path"
     QUERY = "query"
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Dict, Sequence, Tuple, Union
 
 from orjson import loads
 from pydantic import ValidationError
@@ -7,16 +7,53 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.requests import Request
 from starlette.responses import Response as StarletteResponse
 
-from esmerald.enums import MediaType
-from esmerald.exceptions import ExceptionErrorMap, HTTPException, ImproperlyConfigured
+from esmerald.enums import HttpMethod, MediaType
+from esmerald.exceptions import (
+    ExceptionErrorMap,
+    HTTPException,
+    ImproperlyConfigured,
+    MethodNotAllowed,
+    NotAuthenticated,
+    NotAuthorized,
+    NotFound,
+    PermissionDenied,
+)
 from esmerald.responses import JSONResponse, Response
 
 
+def encode_error_bodies(
+    exceptions: Sequence[StarletteHTTPException],
+) -> Dict[Tuple[int, str], bytes]:
+    """
+    Encodes the `{"detail": ...}` bodies of the given exceptions, keyed by status code and detail.
+    """
+    return {
+        (exc.status_code, exc.detail): JSONResponse({"detail": exc.detail}).body
+        for exc in exceptions
+    }
+
+
+ENCODED_ERROR_BODIES = encode_error_bodies(
+    [
+        NotFound(),
+        NotFound(detail="Not Found"),
+        MethodNotAllowed(),
+        *(MethodNotAllowed(detail=f"Method {method.value} not allowed.") for method in HttpMethod),
+        PermissionDenied(),
+        NotAuthorized(),
+        NotAuthenticated(),
+    ]
+)
+
+
 async def http_exception_handler(
     request: Request, exc: Union[HTTPException, StarletteHTTPException]
-) -> Union[JSONResponse, Response]:  # pragma: no cover
+) -> Union[JSONResponse, Response, StarletteResponse]:  # pragma: no cover
     """
     Default exception handler for StarletteHTTPException and Esmerald HTTPException.
+
+    The bodies of the errors raised the most by the framework (not found, method not allowed,
+    permission denied...) are encoded only once.
     """
     extra = getattr(exc, "extra", None)
     headers = getattr(exc, "headers", None)
@@ -24,6 +61,13 @@ async def http_exception_handler(
     if exc.status_code in {204, 304}:
         return JSONResponse(None, status_code=exc.status_code, headers=headers)
 
+    if not extra:
+        body = ENCODED_ERROR_BODIES.get((exc.status_code, exc.detail))
+        if body is not None:
+            return StarletteResponse(
+                body, status_code=exc.status_code, headers=headers, media_type=MediaType.JSON
+            )
+
     if headers and not extra:
         return JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
     elif headers and extra:
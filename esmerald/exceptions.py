@@ -99,6 +99,10 @@ class MethodNotAllowed(HTTPException):
     status_code = status.HTTP_405_METHOD_NOT_ALLOWED
 
 
+class PayloadTooLarge(HTTPException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
 class InternalServerError(HTTPException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -1,5 +1,8 @@
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
+from esmerald.concurrency import SYNC_HANDLERS_LIMITER, run_in_limiter
+from esmerald.conf import settings
 from esmerald.parsers import ArbitraryHashableBaseModel
 from esmerald.transformers.datastructures import Signature
 from esmerald.typing import Void
@@ -10,11 +13,18 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Inject(ArbitraryHashableBaseModel):
-    def __init__(self, dependency: "AnyCallable", use_cache: bool = False, **kwargs: Any):
+    def __init__(
+        self,
+        dependency: "AnyCallable",
+        use_cache: bool = False,
+        run_in_threadpool: bool = True,
+        **kwargs: Any,
+    ):
         super().__init__(**kwargs)
         self.dependency = dependency
         self.signature_model: Optional["Type[Signature]"] = None
         self.use_cache = use_cache
+        self.run_in_threadpool = run_in_threadpool
         self.value: Any = Void
 
     async def __call__(self, **kwargs: Dict[str, Any]) -> Any:
@@ -23,6 +33,12 @@ class Inject(ArbitraryHashableBaseModel):
 
         if is_async_callable(self.dependency):
             value = await self.dependency(**kwargs)
+        elif self.run_in_threadpool:
+            value = await run_in_limiter(
+                SYNC_HANDLERS_LIMITER,
+                settings.sync_handlers_workers,
+                partial(self.dependency, **kwargs),
+            )
         else:
             value = self.dependency(**kwargs)
 
@@ -36,5 +52,6 @@ class Inject(ArbitraryHashableBaseModel):
             isinstance(other, self.__class__)
             and other.dependency == self.dependency
             and other.use_cache == self.use_cache
+            and other.run_in_threadpool == self.run_in_threadpool
             and other.value == self.value
         )
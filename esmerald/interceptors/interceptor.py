@@ -1,6 +1,7 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from esmerald.enums import InterceptorLifecycle
 from esmerald.protocols.interceptor import InterceptorProtocol
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -8,7 +9,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class EsmeraldInterceptor(ABC, InterceptorProtocol):
-    """Base class for any Esmerald interceptor in the system."""
+    """
+    Base class for any Esmerald interceptor in the system.
+
+    By default, the interceptor is instantiated once (`singleton`) and reused by every request.
+    Set `lifecycle = InterceptorLifecycle.PER_REQUEST` to have a new instance for each request.
+    """
+
+    lifecycle: ClassVar[InterceptorLifecycle] = InterceptorLifecycle.SINGLETON
 
     async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
@@ -1,5 +1,6 @@
 from .asyncexitstack import AsyncExitStackMiddleware
 from .authentication import BaseAuthMiddleware
+from .base import EsmeraldMiddleware
 from .basic import BasicHTTPMiddleware
 from .cors import CORSMiddleware
 from .csrf import CSRFMiddleware
@@ -16,6 +17,7 @@ __all__ = [
     "BasicHTTPMiddleware",
     "CORSMiddleware",
     "CSRFMiddleware",
+    "EsmeraldMiddleware",
     "GZipMiddleware",
     "HTTPSRedirectMiddleware",
     "SessionMiddleware",
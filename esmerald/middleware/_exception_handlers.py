@@ -1,28 +1,67 @@
 import inspect
 import typing
 
-from starlette._exception_handler import (
-    ExceptionHandlers,
-    StatusHandlers,
-    _lookup_exception_handler,
-)
+from starlette._exception_handler import ExceptionHandlers, StatusHandlers
 from starlette._utils import is_async_callable
 from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
-from starlette.websockets import WebSocket
 
+from esmerald.requests import Request
+from esmerald.websockets import WebSocket
 
-def wrap_app_handling_exceptions(app: ASGIApp, conn: typing.Union[Request, WebSocket]) -> ASGIApp:
+
+class ExceptionHandlerLookup:
+    """
+    Resolves the handler of an exception type by walking its MRO, only once per type.
+
+    The resolutions are cached until `clear()` is called, which must happen every time the
+    handlers change.
+    """
+
+    __slots__ = ("handlers", "cache")
+
+    def __init__(self, handlers: typing.Mapping[typing.Any, typing.Any]) -> None:
+        self.handlers = handlers
+        self.cache: typing.Dict[typing.Type[BaseException], typing.Any] = {}
+
+    def __call__(self, exc: BaseException) -> typing.Any:
+        exc_type = type(exc)
+        try:
+            return self.cache[exc_type]
+        except KeyError:
+            handler = None
+            for klass in exc_type.__mro__:
+                if klass in self.handlers:
+                    handler = self.handlers[klass]
+                    break
+            self.cache[exc_type] = handler
+            return handler
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+def wrap_app_handling_exceptions(
+    app: ASGIApp, scope: Scope, lookup: typing.Optional[ExceptionHandlerLookup] = None
+) -> ASGIApp:
+    """
+    Wraps the app, handling the exceptions with the handlers set in the scope.
+
+    The connection (`Request` or `WebSocket`) given to the handlers is only created when an
+    exception is handled.
+    """
     exception_handlers: ExceptionHandlers
     status_handlers: StatusHandlers
     try:
-        exception_handlers, status_handlers = conn.scope["starlette.exception_handlers"]
+        exception_handlers, status_handlers = scope["starlette.exception_handlers"]
     except KeyError:  # pragma: no cover
         exception_handlers, status_handlers = {}, {}
 
+    if lookup is None:
+        lookup = ExceptionHandlerLookup(exception_handlers)
+
     async def wrapped_app(scope: Scope, receive: Receive, send: Send) -> None:
         response_started = False
 
@@ -42,7 +81,7 @@ def wrap_app_handling_exceptions(app: ASGIApp, conn: typing.Union[Request, WebSo
                 handler = status_handlers.get(exc.status_code)
 
             if handler is None:
-                handler = _lookup_exception_handler(exception_handlers, exc)
+                handler = lookup(exc)
 
             if handler is None:
                 raise exc
@@ -51,6 +90,12 @@ def wrap_app_handling_exceptions(app: ASGIApp, conn: typing.Union[Request, WebSo
                 msg = "Caught handled exception, but response already started."
                 raise RuntimeError(msg) from exc
 
+            conn: typing.Union[Request, WebSocket]
+            if scope["type"] == "http":
+                conn = Request.from_scope(scope, receive, send)
+            else:
+                conn = WebSocket(scope, receive, send)
+
             if scope["type"] == "http":
                 response: Response
                 if is_async_callable(handler):
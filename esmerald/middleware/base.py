@@ -0,0 +1,116 @@
+from typing import Any, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from esmerald.enums import ScopeType
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.protocols.middleware import MiddlewareProtocol
+from esmerald.requests import Request
+
+RESERVED_ATTRIBUTES = {
+    "before_request",
+    "on_headers",
+    "after_response",
+    "has_before_request",
+    "has_on_headers",
+    "has_after_response",
+}
+
+
+class EsmeraldMiddleware(MiddlewareProtocol):
+    """
+    Pure ASGI base middleware with hooks running around the request.
+
+    Unlike the `BaseHTTPMiddleware`, nothing is buffered and no task is spawned: the hooks work
+    directly on the ASGI messages, keeping the streaming responses and the background tasks
+    untouched. Only the hooks implemented by the subclass are wired into the request and the
+    other scopes (websockets, lifespan) go straight to the application.
+
+    Example:
+        class TimingMiddleware(EsmeraldMiddleware):
+            async def before_request(self, request: Request) -> None:
+                request.state.started = time.perf_counter()
+
+            async def on_headers(
+                self, request: Request, status_code: int, headers: MutableHeaders
+            ) -> None:
+                elapsed = time.perf_counter() - request.state.started
+                headers["server-timing"] = f"app;dur={elapsed * 1000:.2f}"
+
+    The keyword arguments given to the middleware, for instance
+    `Middleware(TimingMiddleware, header="x-timing")`, are set as attributes of the instance.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs: Any) -> None:
+        for name, value in kwargs.items():
+            if name.startswith("_") or name in RESERVED_ATTRIBUTES:
+                raise ImproperlyConfigured(
+                    f"'{name}' is reserved by {type(self).__name__} and cannot be given as "
+                    "an option of the middleware."
+                )
+            setattr(self, name, value)
+
+        self.app = app
+        cls = type(self)
+        self.has_before_request = cls.before_request is not EsmeraldMiddleware.before_request
+        self.has_on_headers = cls.on_headers is not EsmeraldMiddleware.on_headers
+        self.has_after_response = cls.after_response is not EsmeraldMiddleware.after_response
+
+    async def before_request(self, request: Request) -> Optional[ASGIApp]:
+        """
+        Runs before the request reaches the application.
+
+        Returning a response (any ASGI application) sends it instead of calling the application.
+        """
+        return None
+
+    async def on_headers(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        """
+        Runs when the response starts, before the headers are sent. The headers can be changed
+        in place.
+        """
+
+    async def after_response(self, request: Request, status_code: int) -> None:
+        """
+        Runs once the last chunk of the response body was sent.
+        """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request.from_scope(scope, receive)
+        if self.has_before_request:
+            response = await self.before_request(request)
+            if response is not None:
+                await response(scope, receive, send)
+                return
+
+        if not self.has_on_headers and not self.has_after_response:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.has_on_headers:
+                    await self.on_headers(request, status_code, MutableHeaders(scope=message))
+                await send(message)
+                return
+
+            await send(message)
+            if (
+                self.has_after_response
+                and message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+            ):
+                await self.after_response(request, status_code)
+
+        await self.app(scope, receive, send_wrapper)
@@ -13,6 +13,9 @@ Req = TypeVar("Req", Request, StarletteRequest)
 class BasicHTTPMiddleware(BaseHTTPMiddleware):
     """
     BaseHTTPMiddleware of all Esmerald applications.
+
+    Runs every request in a task group with memory streams, prefer the pure ASGI
+    `esmerald.middleware.EsmeraldMiddleware`.
     """
 
     async def dispatch(self, request: Req, call_next: RequestResponseEndpoint) -> Response:
@@ -65,7 +65,7 @@ class CSRFMiddleware(MiddlewareProtocol):
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope=scope)
+        request = Request.from_scope(scope=scope)
         csrf_cookie = request.cookies.get(self.config.cookie_name)
         current_token = request.headers.get(self.config.header_name)
 
@@ -1,7 +1,5 @@
-from inspect import getmro
-from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, cast
+from typing import Any, Callable, Dict, Mapping, Optional, Type, Union
 
-from pydantic import BaseModel
 from starlette import status
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.errors import ServerErrorMiddleware
@@ -12,11 +10,13 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 from esmerald.enums import MediaType, ScopeType
 from esmerald.exception_handlers import http_exception_handler
 from esmerald.exceptions import HTTPException, WebSocketException
-from esmerald.middleware._exception_handlers import wrap_app_handling_exceptions
+from esmerald.middleware._exception_handlers import (
+    ExceptionHandlerLookup,
+    wrap_app_handling_exceptions,
+)
 from esmerald.requests import Request
 from esmerald.responses import Response
 from esmerald.types import ExceptionHandler, ExceptionHandlerMap
-from esmerald.websockets import WebSocket
 
 
 class ExceptionMiddleware(StarletteExceptionMiddleware):
@@ -38,10 +38,19 @@ class ExceptionMiddleware(StarletteExceptionMiddleware):
             StarletteHTTPException: http_exception_handler,
             WebSocketException: self.websocket_exception,
         }
+        self._lookup = ExceptionHandlerLookup(self._exception_handlers)
         if handlers is not None:
             for key, value in handlers.items():
                 self.add_exception_handler(key, value)  # type: ignore
 
+    def add_exception_handler(
+        self,
+        exc_class_or_status_code: Union[int, Type[Exception]],
+        handler: Callable,
+    ) -> None:
+        super().add_exception_handler(exc_class_or_status_code, handler)
+        self._lookup.clear()
+
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
     ) -> None:  # pragma: no cover
@@ -54,20 +63,7 @@ class ExceptionMiddleware(StarletteExceptionMiddleware):
             self._status_handlers,
         )
 
-        conn: Union[Request, WebSocket]
-        if scope["type"] == "http":
-            conn = Request(scope, receive, send)
-        else:
-            conn = WebSocket(scope, receive, send)
-
-        await wrap_app_handling_exceptions(self.app, conn)(scope, receive, send)
-
-
-class ResponseContent(BaseModel):
-    detail: Optional[str]
-    extra: Optional[Union[Dict[str, Any], List[Any]]] = None
-    headers: Optional[Dict[str, str]] = None
-    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+        await wrap_app_handling_exceptions(self.app, scope, self._lookup)(scope, receive, send)
 
 
 class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
@@ -82,17 +78,15 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         self.exception_handlers = exception_handlers
         self.debug = debug
         self.error_handler = error_handler
+        self._lookup = ExceptionHandlerLookup(exception_handlers)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         try:
             await self.app(scope, receive, send)
         except Exception as ex:
             if scope["type"] == ScopeType.HTTP:
-                exception_handler = (
-                    self.get_exception_handler(self.exception_handlers, ex)
-                    or self.default_http_exception_handler
-                )
-                response = exception_handler(Request(scope, receive, send), ex)
+                exception_handler = self._lookup(ex) or self.default_http_exception_handler
+                response = exception_handler(Request.from_scope(scope, receive, send), ex)
                 await response(scope, receive, send)
                 return
 
@@ -124,21 +118,27 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         return self.create_exception_response(exc)
 
     def create_exception_response(self, exc: Exception) -> Response:
+        headers = None
         if isinstance(exc, (HTTPException, StarletteHTTPException)):
-            content = ResponseContent(detail=exc.detail, status_code=exc.status_code)
+            status_code = exc.status_code
+            headers = exc.headers
+            content: Dict[str, Any] = {"detail": exc.detail}
             if isinstance(exc, HTTPException):
                 extra = exc.extra.get("extra", {})
                 if extra:
-                    content.extra = extra
+                    content["extra"] = extra
         else:
-            content = ResponseContent(detail=repr(exc))
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            content = {"detail": repr(exc)}
+
+        if content["detail"] is None:
+            content.pop("detail")
+        content["status_code"] = status_code
         return Response(
             media_type=MediaType.JSON,
-            content=content.model_dump(exclude_none=True),
-            status_code=content.status_code,
-            headers=exc.headers
-            if isinstance(exc, (HTTPException, StarletteHTTPException))
-            else None,
+            content=content,
+            status_code=status_code,
+            headers=headers,
         )
 
     def get_exception_handler(
@@ -146,16 +146,12 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         exception_handlers: ExceptionHandlerMap,
         exc: Exception,
     ) -> Union[ExceptionHandler, None]:
+        """
+        Returns the handler of the closest class of the exception in the given handlers.
+        """
         if not exception_handlers:
             return None
 
-        if not isinstance(exc, HTTPException) and exc.__class__ in exception_handlers:
-            return exception_handlers[exc.__class__]
-
-        if isinstance(exc, HTTPException) and exc.__class__ in exception_handlers:
-            return exception_handlers[exc.__class__]
-
-        for klass in getmro(type(exc)):
-            if klass in exception_handlers:
-                return exception_handlers[cast("Type[Exception]", exc)]
-        return None
+        if exception_handlers is self.exception_handlers:
+            return self._lookup(exc)  # type: ignore[no-any-return]
+        return ExceptionHandlerLookup(exception_handlers)(exc)  # type: ignore[no-any-return]
@@ -0,0 +1,312 @@
+import gzip
+import inspect
+import os
+import re
+import tempfile
+from dataclasses import fields, is_dataclass
+from hashlib import sha256
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from starlette.responses import Response as StarletteResponse
+from starlette.routing import BaseRoute
+from typing_extensions import get_args
+
+from esmerald.cache.core import etag_matches
+from esmerald.enums import MediaType
+from esmerald.requests import Request
+from esmerald.routing import gateways, router
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+class OpenAPIDocument:
+    """
+    The generated OpenAPI document, serialized once (plain, gzip and, when `brotli` is
+    installed, brotli) together with its ETag, the one of the plain document, the
+    compressed ones being suffixed by their encoding.
+
+    The `routes` and `version` identify the state of the router the document was generated
+    from, when they change the document is generated again.
+    """
+
+    __slots__ = (
+        "schema",
+        "content",
+        "gzip_content",
+        "brotli_content",
+        "etag",
+        "fingerprint",
+        "routes",
+        "version",
+    )
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        *,
+        content: Optional[bytes] = None,
+        fingerprint: Optional[str] = None,
+        routes: Any = None,
+    ) -> None:
+        self.schema = schema
+        self.content = content or orjson.dumps(schema, option=orjson.OPT_NON_STR_KEYS)
+        self.gzip_content = gzip.compress(self.content, mtime=0)
+        self.brotli_content = brotli.compress(self.content) if brotli is not None else None
+        self.etag = f'"{sha256(self.content).hexdigest()[:32]}"'
+        self.fingerprint = fingerprint
+        self.routes = routes
+        self.version = getattr(routes, "version", None)
+
+    def is_current(self, routes: Any) -> bool:
+        return self.routes is routes and self.version == getattr(routes, "version", None)
+
+    def to_response(self, request: Request) -> StarletteResponse:
+        """
+        Returns a `304` when the client already has the document or the document encoded
+        according to the `Accept-Encoding` of the request.
+        """
+        encodings = parse_accept_encoding(request.headers.get("accept-encoding", ""))
+        selected: Optional[str] = None
+        content = self.content
+        quality = encodings.get("identity", encodings.get("*", 1.0))
+        for encoding, encoded in (("br", self.brotli_content), ("gzip", self.gzip_content)):
+            encoding_quality = encodings.get(encoding, encodings.get("*", 0.0))
+            if encoded is None or encoding_quality <= 0:
+                continue
+            # The compressed encodings are preferred to the identity with the same quality.
+            if encoding_quality > quality or (selected is None and encoding_quality == quality):
+                selected, content, quality = encoding, encoded, encoding_quality
+
+        # Each encoding of the document is a different representation with its own ETag.
+        etag = self.etag if selected is None else f'{self.etag[:-1]}-{selected}"'
+        headers = {"etag": etag, "vary": "accept-encoding"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            return StarletteResponse(status_code=304, headers=headers)
+
+        if selected is not None:
+            headers["content-encoding"] = selected
+        return StarletteResponse(content=content, media_type=MediaType.JSON, headers=headers)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """
+    Parses the `Accept-Encoding` header into the quality of each encoding.
+    """
+    encodings: Dict[str, float] = {}
+    for item in value.split(","):
+        encoding, *parameters = item.split(";")
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+
+        quality = 1.0
+        for parameter in parameters:
+            name, _, number = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        encodings[encoding] = quality
+    return encodings
+
+
+MEMORY_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def stable_repr(value: Any) -> str:
+    """
+    The `repr` of the value without the memory addresses, identical between processes.
+    """
+    return MEMORY_ADDRESS.sub("", repr(value))
+
+
+def describe_schema(annotation: Any) -> Optional[str]:
+    """
+    The JSON schema of a model or dataclass, including its docstring, title, configuration
+    and `json_schema_extra`, or None when it cannot be generated.
+    """
+    try:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            schema = annotation.model_json_schema()
+        else:
+            schema = TypeAdapter(annotation).json_schema()
+        return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    except Exception:  # noqa
+        return None
+
+
+def describe_annotation(annotation: Any, seen: Set[int]) -> List[str]:
+    """
+    Describes an annotation, including the schema of the models and dataclasses it contains,
+    so changing a model also changes the fingerprint of the handlers using it.
+    """
+    description = [stable_repr(annotation)]
+    if id(annotation) in seen:
+        return description
+
+    if isinstance(annotation, type) and (
+        issubclass(annotation, BaseModel) or is_dataclass(annotation)
+    ):
+        seen.add(id(annotation))
+        schema = describe_schema(annotation)
+        if schema is not None:
+            description.append(schema)
+        elif issubclass(annotation, BaseModel):
+            for name, field in annotation.model_fields.items():
+                description.append(f"{name}={stable_repr(field)}")
+                description.extend(describe_annotation(field.annotation, seen))
+        else:
+            for field in fields(annotation):
+                description.append(f"{field.name}={stable_repr(field.type)}")
+                description.extend(describe_annotation(field.type, seen))
+
+    for arg in get_args(annotation):
+        description.extend(describe_annotation(arg, seen))
+    return description
+
+
+def describe_parameters(
+    parameters: Iterable[inspect.Parameter], seen: Set[int]
+) -> List[str]:
+    """
+    Describes the names, defaults and annotations of the parameters of a handler or of a
+    dependency.
+    """
+    description: List[str] = []
+    for parameter in parameters:
+        default = parameter.default
+        if isinstance(default, FieldInfo):
+            default = list(default.__repr_args__())
+        description.append(f"{parameter.name}={stable_repr(default)}")
+        description.extend(describe_annotation(parameter.annotation, seen))
+    return description
+
+
+def describe_dependencies(handler: Any, seen: Set[int]) -> List[str]:
+    """
+    Describes the signatures of the dependencies injected in the handler, their parameters
+    being documented as the parameters of the handler.
+    """
+    dependencies: Dict[str, Any] = {}
+    for layer in getattr(handler, "parent_levels", [handler]):
+        dependencies.update(getattr(layer, "dependencies", None) or {})
+
+    description: List[str] = []
+    for name in sorted(dependencies):
+        dependency = getattr(dependencies[name], "dependency", dependencies[name])
+        description.append(f"dependency:{name}:{stable_repr(dependency)}")
+        try:
+            parameters = inspect.signature(dependency).parameters.values()
+        except (TypeError, ValueError):  # pragma: no cover
+            continue
+        description.extend(describe_parameters(parameters, seen))
+    return description
+
+
+def describe_routes(routes: Sequence[BaseRoute], prefix: str = "") -> List[str]:
+    """
+    Describes the routes documented by OpenAPI: paths, methods and the signatures, annotations,
+    dependencies and metadata of the handlers.
+    """
+    description: List[str] = []
+    seen: Set[int] = set()
+
+    for route in routes or []:
+        if isinstance(route, router.Include):
+            path = prefix + route.path
+            description.append(f"include:{path}:{route.include_in_schema}:{route.deprecated}")
+            description.extend(describe_routes(getattr(route.app, "routes", []), prefix=path))
+            continue
+
+        if not isinstance(route, (gateways.Gateway, gateways.WebhookGateway)):
+            continue
+
+        handler = route.handler
+        if getattr(handler, "fn", None) is None:  # pragma: no cover
+            continue
+
+        description.append(
+            ":".join(
+                [
+                    prefix + route.path,
+                    ",".join(sorted(getattr(handler, "methods", None) or [])),
+                    str(route.include_in_schema),
+                    getattr(handler.fn, "__module__", ""),
+                    getattr(handler.fn, "__qualname__", ""),
+                ]
+            )
+        )
+        for attribute in (
+            "operation_id",
+            "summary",
+            "description",
+            "tags",
+            "status_code",
+            "media_type",
+            "response_class",
+            "responses",
+            "security",
+            "deprecated",
+            "include_in_schema",
+        ):
+            description.append(f"{attribute}={stable_repr(getattr(handler, attribute, None))}")
+
+        signature = handler.signature
+        description.extend(describe_parameters(signature.parameters.values(), seen))
+        description.extend(describe_annotation(signature.return_annotation, seen))
+        description.extend(describe_dependencies(handler, seen))
+
+    return description
+
+
+def get_openapi_fingerprint(routes: Sequence[BaseRoute], **config: Any) -> str:
+    """
+    Returns the fingerprint of the OpenAPI document generated for the given routes and
+    configuration, without generating it.
+    """
+    from esmerald import __version__
+
+    description = [__version__, stable_repr(sorted(config.items(), key=lambda item: item[0]))]
+    description.extend(describe_routes(routes))
+    return sha256("\n".join(description).encode("utf-8")).hexdigest()
+
+
+def load_openapi_document(path: str, fingerprint: str) -> Optional[bytes]:
+    """
+    Returns the document persisted in the given file if it was generated with the same
+    fingerprint.
+    """
+    try:
+        with open(path, "rb") as file:
+            header = file.readline().strip().decode("latin-1")
+            if header != fingerprint:
+                return None
+            return file.read()
+    except OSError:
+        return None
+
+
+def persist_openapi_document(path: str, document: OpenAPIDocument) -> None:
+    """
+    Writes the document, preceded by its fingerprint, into the given file.
+
+    The file is replaced atomically, the replicas reading it never see a partial document.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(f"{document.fingerprint}\n".encode("latin-1"))
+            file.write(document.content)
+        os.replace(temporary, path)
+    except OSError:  # pragma: no cover
+        if os.path.exists(temporary):
+            os.remove(temporary)
@@ -61,6 +61,7 @@ def get_fields_from_routes(
             route, (gateways.Gateway, gateways.WebhookGateway)
         ):
             handler = cast(router.HTTPHandler, route.handler)
+            handler.ensure_signature_model()
 
             # Get the data_field
             if DATA in handler.signature_model.model_fields:
@@ -71,6 +72,9 @@ def get_fields_from_routes(
                 for _, response in handler.response_models.items():
                     response_from_routes.append(response)
 
+            if handler.stream_field is not None:
+                response_from_routes.append(handler.stream_field)
+
             # Get the params from the transformer
             params = get_flat_params(handler)
             if params:
@@ -257,6 +261,10 @@ def get_openapi_path(
         # Media type
         if route_response_media_type and is_status_code_allowed(handler.status_code):
             response_schema = {"type": "string"}
+            if handler.stream_field is not None:
+                response_schema = get_schema_from_model_field(
+                    field=handler.stream_field, field_mapping=field_mapping
+                )
 
             operation.setdefault("responses", {}).setdefault(status_code, {}).setdefault(
                 "content", {}
@@ -1,23 +1,23 @@
 from http import HTTPStatus
 from inspect import Signature
-from typing import TYPE_CHECKING, Any, Dict, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Union
 
 from typing_extensions import get_args, get_origin
 
-from esmerald.datastructures import File, Redirect, Stream, Template
+from esmerald.datastructures import File, JSONStream, Redirect, Stream, Template
 from esmerald.enums import MediaType
 from esmerald.openapi._internal import InternalResponse
 from esmerald.responses import Response as EsmeraldResponse
+from esmerald.utils.helpers import is_class_and_subclass
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.routing.router import HTTPHandler
-    from esmerald.typing import AnyCallable
 
 
 def create_internal_response(
     handler: Union["HTTPHandler", Any]
 ) -> InternalResponse:  # pragma: no cover
-    signature = Signature.from_callable(cast("AnyCallable", handler.fn))
+    signature: Signature = handler.signature
     default_descriptions: Dict[Any, str] = {
         Stream: "Stream Response",
         Redirect: "Redirect Response",
@@ -44,6 +44,8 @@ def create_internal_response(
         if signature.return_annotation is Template:
             internal_response.return_annotation = str
             internal_response.media_type = MediaType.HTML
+        elif is_class_and_subclass(signature.return_annotation, JSONStream):
+            internal_response.media_type = signature.return_annotation.media_type
         elif get_origin(signature.return_annotation) is EsmeraldResponse:
             internal_response.return_annotation = get_args(signature.return_annotation)[0] or Any
             internal_response.media_type = handler.content_media_type
@@ -1,9 +1,10 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from pydantic.dataclasses import dataclass
 from pydantic.fields import AliasChoices, AliasPath, FieldInfo
 
 from esmerald.enums import EncodingType, ParamType
+from esmerald.exceptions import ImproperlyConfigured
 from esmerald.typing import Undefined
 from esmerald.utils.constants import IS_DEPENDENCY, SKIP_VALIDATION
 
@@ -518,6 +519,11 @@ class Form(Body):
         init_var: bool = True,
         kw_only: bool = True,
         include_in_schema: bool = True,
+        stream: bool = False,
+        max_parts: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+        spool_max_size: Optional[int] = None,
+        json_fields: Optional[Sequence[str]] = None,
     ) -> None:
         super().__init__(
             default=default,
@@ -549,6 +555,16 @@ class Form(Body):
             max_digits=max_digits,
             strict=strict,
         )
+        if not stream and (max_part_size is not None or spool_max_size is not None):
+            raise ImproperlyConfigured(
+                "`max_part_size` and `spool_max_size` are only supported with `stream=True`."
+            )
+
+        self.stream = stream
+        self.max_parts = max_parts
+        self.max_part_size = max_part_size
+        self.spool_max_size = spool_max_size
+        self.json_fields = json_fields
 
 
 class File(Form):
@@ -582,6 +598,11 @@ class File(Form):
         init_var: bool = True,
         kw_only: bool = True,
         include_in_schema: bool = True,
+        stream: bool = False,
+        max_parts: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+        spool_max_size: Optional[int] = None,
+        json_fields: Optional[Sequence[str]] = None,
     ) -> None:
         super().__init__(
             default=default,
@@ -611,6 +632,11 @@ class File(Form):
             init_var=init_var,
             kw_only=kw_only,
             include_in_schema=include_in_schema,
+            stream=stream,
+            max_parts=max_parts,
+            max_part_size=max_part_size,
+            spool_max_size=spool_max_size,
+            json_fields=json_fields,
         )
 
 
@@ -81,10 +81,15 @@ def parse_form_data(
     """
     Converts, parses and transforms a multidict into a dict and tries to load them all into
     json.
+
+    When the field declares `json_fields`, only the values of those fields are loaded into json.
     """
+    json_fields = getattr(field, "json_fields", None)
     values_dict: Dict[str, Any] = {}
     for key, value in form_data.multi_items():
-        if not isinstance(value, StarletteUploadFile):
+        if not isinstance(value, StarletteUploadFile) and (
+            json_fields is None or key in json_fields
+        ):
             with suppress(JSONDecodeError):
                 value = loads(value)
         value_in_dict = values_dict.get(key)
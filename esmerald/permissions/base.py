@@ -98,8 +98,14 @@ class BasePermissionMetaclass(BaseOperationHolder, type):  # type: ignore[misc]
 class BasePermission(metaclass=BasePermissionMetaclass):
     """
     A base class from which all permission classes should inherit.
+
+    The permission is instantiated once per handler and a sync `has_permission` runs inline.
+    Set `blocking = True` if a sync `has_permission` performs blocking I/O so it runs in a
+    thread instead.
     """
 
+    blocking: bool = False
+
     def has_permission(
         self,
         request: "Request",
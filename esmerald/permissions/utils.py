@@ -1,35 +1,84 @@
-from typing import TYPE_CHECKING, Callable, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Tuple, Union
+
+import anyio
 
 from esmerald.exceptions import PermissionDenied
+from esmerald.permissions.base import AND, NOT, OR
 from esmerald.utils.helpers import is_async_callable
 
 if TYPE_CHECKING:  # pragma: no cover
-    from esmerald.permissions import BasePermission
     from esmerald.requests import Request
     from esmerald.types import APIGateHandler
 
+Evaluator = Callable[..., Union[bool, Awaitable[bool]]]
 
-async def continue_or_raise_permission_exception(
-    request: "Request",
-    apiview: "APIGateHandler",
-    permission: "BasePermission",
-) -> None:
-    has_permission: Callable = permission.has_permission
 
-    if not is_async_callable(has_permission):
-        if not has_permission(request=request, apiview=apiview):
-            permission_denied(
-                request,
-                message=getattr(permission, "message", None),
-            )
-    else:
-        is_permission = await has_permission(request=request, apiview=apiview)
-        if not is_permission:
-            permission_denied(
-                request,
-                message=getattr(permission, "message", None),
+def compile_permission(permission: Any) -> Tuple[bool, Evaluator]:
+    """
+    Compiles a permission instance, including the ones composed with `&`, `|` and `~`, into
+    a single evaluator `evaluator(request=..., apiview=...)` with short-circuiting.
+
+    Returns a tuple `(is_async, evaluator)`. The evaluator is only async when at least one of
+    the operands is async (or flagged as `blocking`), otherwise the whole permission runs inline.
+    """
+    if isinstance(permission, (AND, OR)):
+        first_async, first = compile_permission(permission.op1)
+        second_async, second = compile_permission(permission.op2)
+        is_and = isinstance(permission, AND)
+
+        if not first_async and not second_async:
+
+            def evaluate(request: "Request", apiview: "APIGateHandler") -> Any:
+                if is_and:
+                    return first(request=request, apiview=apiview) and second(
+                        request=request, apiview=apiview
+                    )
+                return first(request=request, apiview=apiview) or second(
+                    request=request, apiview=apiview
+                )
+
+            return False, evaluate
+
+        async def evaluate_async(request: "Request", apiview: "APIGateHandler") -> Any:
+            value = first(request=request, apiview=apiview)
+            if first_async:
+                value = await value  # type: ignore[misc]
+            if bool(value) is not is_and:
+                return value
+
+            value = second(request=request, apiview=apiview)
+            if second_async:
+                value = await value  # type: ignore[misc]
+            return value
+
+        return True, evaluate_async
+
+    if isinstance(permission, NOT):
+        operand_async, operand = compile_permission(permission.op1)
+
+        if not operand_async:
+            return False, lambda request, apiview: not operand(request=request, apiview=apiview)
+
+        async def evaluate_not(request: "Request", apiview: "APIGateHandler") -> bool:
+            return not await operand(request=request, apiview=apiview)  # type: ignore[misc]
+
+        return True, evaluate_not
+
+    has_permission = permission.has_permission
+    if is_async_callable(has_permission):
+        return True, has_permission
+
+    if getattr(permission, "blocking", False):
+
+        async def evaluate_blocking(request: "Request", apiview: "APIGateHandler") -> Any:
+            return await anyio.to_thread.run_sync(
+                partial(has_permission, request=request, apiview=apiview)
             )
 
+        return True, evaluate_blocking
+    return False, has_permission
+
 
 def permission_denied(request: "Request", message: Optional[str] = None) -> None:
     """
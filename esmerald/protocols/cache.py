@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from typing_extensions import Protocol, runtime_checkable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.cache.core import CachedResponse
+
+
+@runtime_checkable
+class CacheBackendProtocol(Protocol):  # pragma: no cover
+    """
+    Storage of the cached responses.
+
+    External stores (Redis, memcached...) can use `CachedResponse.encode()` and
+    `CachedResponse.decode()` to store the responses as bytes and must keep an index of the
+    keys of each tag to invalidate them.
+    """
+
+    async def get(self, key: str) -> Optional["CachedResponse"]:
+        ...
+
+    async def set(self, key: str, value: "CachedResponse", ttl: float) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
@@ -1,5 +1,5 @@
 # from json import loads
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, Union, cast
 
 from orjson import loads
 from starlette.datastructures import URL  # noqa
@@ -9,6 +9,8 @@ from starlette.requests import Request as StarletteRequest  # noqa: F401
 from starlette.requests import empty_receive, empty_send  # noqa
 from starlette.types import Receive, Scope, Send
 
+from esmerald.conf import settings
+from esmerald.exceptions import PayloadTooLarge
 from esmerald.typing import Void
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -16,6 +18,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.conf.global_settings import EsmeraldAPISettings
     from esmerald.types import HTTPMethod
 
+REQUEST_SCOPE_KEY = "esmerald.request"
+BODY_SCOPE_KEY = "_body"
+
 
 class Request(StarletteRequest):
     def __init__(
@@ -27,6 +32,55 @@ class Request(StarletteRequest):
         super().__init__(scope, receive, send)
         self._json: Any = Void
 
+    @classmethod
+    def from_scope(
+        cls,
+        scope: "Scope",
+        receive: "Receive" = empty_receive,
+        send: "Send" = empty_send,
+    ) -> "Request":
+        """
+        Returns the request shared by every Esmerald layer (middlewares, exception handlers and
+        handlers) of the given scope, creating it on the first call.
+
+        The `receive` and `send` given replace the ones of the shared request, making sure it
+        always talks to the innermost layer.
+
+        A scope copied by a layer (to change the `root_path` or the `path`...) gets a new request
+        sharing the body already read by the request of the original scope.
+        """
+        request = scope.get(REQUEST_SCOPE_KEY)
+        if not isinstance(request, cls):
+            request = cls(scope, receive, send)
+            scope[REQUEST_SCOPE_KEY] = request
+            return request
+
+        if request.scope is not scope:
+            shared = request
+            request = cls(
+                scope,
+                shared._receive if receive is empty_receive else receive,
+                shared._send if send is empty_send else send,
+            )
+            if BODY_SCOPE_KEY in shared.scope:
+                scope[BODY_SCOPE_KEY] = shared.scope[BODY_SCOPE_KEY]
+            request._json = shared._json
+            request._stream_consumed = shared._stream_consumed
+            if hasattr(shared, "_form"):
+                request._form = shared._form
+            scope[REQUEST_SCOPE_KEY] = request
+            return request
+
+        if receive is not empty_receive:
+            request._receive = receive
+        if send is not empty_send:
+            request._send = send
+
+        # The url might have changed in the meantime (root path of mounts...).
+        request.__dict__.pop("_url", None)
+        request.__dict__.pop("_base_url", None)
+        return request
+
     @property
     def app(self) -> "Esmerald":
         return cast("Esmerald", self.scope["app"])
@@ -49,13 +103,103 @@ class Request(StarletteRequest):
         ), "RequestSettingsMiddleware must be added to the middlewares"
         return cast("EsmeraldAPISettings", self.scope["app_settings"])
 
+    @property
+    def content_length(self) -> Optional[int]:
+        """
+        The `Content-Length` declared by the client, if valid.
+        """
+        value = self.headers.get("content-length")
+        if value is None or not value.isdigit():
+            return None
+        return int(value)
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        """
+        Streams the body of the request, enforcing the `request_max_body_size` setting.
+
+        If the body was already read by any request of the same scope, the body is returned
+        instead.
+        """
+        if BODY_SCOPE_KEY in self.scope:
+            yield await self.body()
+            yield b""
+            return
+
+        limit: Optional[int] = settings.request_max_body_size
+        if limit is None:
+            async for chunk in super().stream():
+                yield chunk
+            return
+
+        content_length = self.content_length
+        if content_length is not None and content_length > limit:
+            raise PayloadTooLarge()
+
+        received = 0
+        async for chunk in super().stream():
+            received += len(chunk)
+            if received > limit:
+                raise PayloadTooLarge()
+            yield chunk
+
+    async def read_body(self) -> Union[bytes, bytearray]:
+        """
+        Reads the body of the request once per scope and without copying it, when possible.
+
+        A body received in a single chunk is kept as it is. Bodies received in more chunks are
+        accumulated into a single buffer. When `request_max_body_size` is set, the buffer is
+        allocated upfront from the `Content-Length` (which is never bigger than the limit).
+        """
+        if BODY_SCOPE_KEY in self.scope:
+            return cast("Union[bytes, bytearray]", self.scope[BODY_SCOPE_KEY])
+
+        size_hint = 0
+        if settings.request_max_body_size is not None:
+            size_hint = self.content_length or 0
+
+        first: Optional[bytes] = None
+        buffer: Optional[bytearray] = None
+        position = 0
+
+        async for chunk in self.stream():
+            if not chunk:
+                continue
+
+            end = position + len(chunk)
+            if buffer is None:
+                if first is None:
+                    first = chunk
+                    position = end
+                    continue
+                buffer = bytearray(max(size_hint, end))
+                buffer[:position] = first
+                first = None
+
+            if end > len(buffer):
+                buffer[position:] = chunk
+            else:
+                buffer[position:end] = chunk
+            position = end
+
+        body: Union[bytes, bytearray]
+        if buffer is None:
+            body = first or b""
+        else:
+            del buffer[position:]
+            body = buffer
+
+        self.scope[BODY_SCOPE_KEY] = body
+        return body
+
+    async def body(self) -> bytes:
+        body = await self.read_body()
+        if isinstance(body, bytearray):
+            body = self.scope[BODY_SCOPE_KEY] = bytes(body)
+        return body
+
     async def json(self) -> Any:
         if self._json is Void:
-            if "_body" in self.scope:
-                body = self.scope["_body"]
-            else:
-                body = self.scope["_body"] = await self.body() or b"null"
-            self._json = loads(body)
+            self._json = loads(await self.read_body() or b"null")
         return self._json
 
     def url_for(self, __name: str, **path_params: Any) -> Any:
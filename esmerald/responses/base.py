@@ -1,8 +1,21 @@
 import dataclasses
 from dataclasses import is_dataclass
 from json import dumps
-from typing import TYPE_CHECKING, Any, Dict, Generic, NoReturn, Optional, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    NoReturn,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
+import orjson
 from pydantic import BaseModel
 from starlette import status
 from starlette.responses import FileResponse as FileResponse  # noqa
@@ -13,7 +26,8 @@ from starlette.responses import RedirectResponse as RedirectResponse  # noqa
 from starlette.responses import Response as StarletteResponse  # noqa
 from starlette.responses import StreamingResponse as StreamingResponse  # noqa
 
-from esmerald.enums import MediaType
+from esmerald.conf import settings
+from esmerald.enums import JSONEncoderType, MediaType
 from esmerald.exceptions import ImproperlyConfigured
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -22,8 +36,33 @@ if TYPE_CHECKING:  # pragma: no cover
 
 T = TypeVar("T")
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+Fragment = getattr(orjson, "Fragment", None)
+
+
+def encode_model(value: BaseModel) -> Any:
+    """
+    Serializes a pydantic model straight into JSON bytes using the pydantic-core serializer,
+    without building the intermediate dictionary.
+    """
+    if Fragment is None:  # pragma: no cover
+        return value.model_dump(mode="json")
+    return Fragment(value.__pydantic_serializer__.to_json(value))
+
+
+def encode_default(value: Any) -> Any:
+    """
+    The `default` hook of orjson for the values not natively supported.
+    """
+    if isinstance(value, BaseModel):
+        return encode_model(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
 
 class Response(StarletteResponse, Generic[T]):
+    # The JSON encoder of the response, the `json_encoder` setting when not declared.
+    json_encoder: ClassVar[Optional[str]] = None
+
     def __init__(
         self,
         content: T,
@@ -51,6 +90,24 @@ class Response(StarletteResponse, Generic[T]):
             return dataclasses.asdict(value)
         raise TypeError("unsupported type")  # pragma: no cover
 
+    def get_encoder_default(self) -> Callable[[Any], Any]:
+        """
+        The `default` hook of the orjson encoder.
+
+        Dataclasses, dates, UUIDs and enums are natively supported by orjson and the pydantic
+        models are serialized directly by pydantic, unless the `transform` was customised.
+        """
+        transform = self.transform
+        if type(self).transform is not Response.transform:
+            return transform
+
+        def default(value: Any) -> Any:
+            if isinstance(value, BaseModel):
+                return encode_model(value)
+            return transform(value)
+
+        return default
+
     def render(self, content: Any) -> bytes:
         try:
             if (
@@ -64,6 +121,17 @@ class Response(StarletteResponse, Generic[T]):
             ):
                 return b""
             if self.media_type == MediaType.JSON:
+                if isinstance(content, bytes):
+                    # Already serialized.
+                    return content
+                if (self.json_encoder or settings.json_encoder) == JSONEncoderType.ORJSON:
+                    try:
+                        return orjson.dumps(
+                            content, default=self.get_encoder_default(), option=ORJSON_OPTIONS
+                        )
+                    except orjson.JSONEncodeError:
+                        # Not supported by orjson, integers wider than 64 bits for instance.
+                        pass
                 return dumps(content, default=self.transform, ensure_ascii=False).encode("utf-8")
             return super().render(content)
         except (AttributeError, ValueError, TypeError) as e:  # pragma: no cover
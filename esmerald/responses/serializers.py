@@ -0,0 +1,73 @@
+from dataclasses import is_dataclass
+from typing import Any, Dict, Optional, Union
+
+from pydantic import BaseModel, PydanticUndefinedAnnotation, PydanticUserError, TypeAdapter
+from pydantic.functional_serializers import SerializeAsAny
+from typing_extensions import Annotated, get_args, get_origin
+
+# Shared by every handler, identical return annotations get the same serializer.
+_serializers: Dict[Any, Optional[TypeAdapter]] = {}
+
+
+def has_model(annotation: Any) -> bool:
+    """
+    Checks if the annotation is (or contains) a pydantic model or a dataclass.
+
+    Example: `Item`, `List[Item]`, `Dict[str, Item]`, `Optional[Item]`, `Page[Item]`...
+    """
+    if isinstance(annotation, type) and (
+        issubclass(annotation, BaseModel) or is_dataclass(annotation)
+    ):
+        return True
+    return any(has_model(arg) for arg in get_args(annotation))
+
+
+def serialize_as_any(annotation: Any) -> Any:
+    """
+    Wraps the models and dataclasses of the annotation with `SerializeAsAny`, making sure the
+    fields of the subclasses returned by the handlers are serialized as well.
+    """
+    if isinstance(annotation, type) and (
+        issubclass(annotation, BaseModel) or is_dataclass(annotation)
+    ):
+        return SerializeAsAny[annotation]  # type: ignore[valid-type]
+
+    args = get_args(annotation)
+    if not args:
+        return annotation
+
+    wrapped = tuple(serialize_as_any(arg) for arg in args)
+    if wrapped == args:
+        return annotation
+
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return Annotated[wrapped]
+    if origin is Union or type(annotation).__name__ == "UnionType":
+        return Union[wrapped]
+    if hasattr(annotation, "copy_with"):
+        return annotation.copy_with(wrapped)
+    return origin[wrapped]
+
+
+def get_response_serializer(annotation: Any) -> Optional[TypeAdapter]:
+    """
+    Returns the `TypeAdapter` used to serialize the responses declared with the given return
+    annotation or None if the annotation does not contain models or dataclasses.
+    """
+    try:
+        return _serializers[annotation]
+    except KeyError:
+        pass
+    except TypeError:  # pragma: no cover
+        return None
+
+    serializer: Optional[TypeAdapter] = None
+    if has_model(annotation):
+        try:
+            serializer = TypeAdapter(serialize_as_any(annotation))
+        except (PydanticUndefinedAnnotation, PydanticUserError):
+            serializer = None
+
+    _serializers[annotation] = serializer
+    return serializer
@@ -1,10 +1,12 @@
 from functools import cached_property
-from typing import Any, Dict, List, cast, get_args
+from typing import Any, Dict, List, Optional, cast, get_args
 
+from esmerald.datastructures import JSONStream
 from esmerald.enums import EncodingType
 from esmerald.openapi.params import ResponseParam
 from esmerald.params import Body
 from esmerald.utils.constants import DATA
+from esmerald.utils.helpers import is_class_and_subclass
 from esmerald.utils.models import create_field_model
 
 
@@ -44,6 +46,25 @@ class FieldInfoMixin:
                 )
         return responses
 
+    @cached_property
+    def stream_field(self) -> Optional[ResponseParam]:
+        """
+        The field of the items streamed by a `JSONStream` or `NDJSON` declared with an item type,
+        for example `JSONStream[Item]`, used for OpenAPI.
+        """
+        return_annotation = self.signature.return_annotation
+        if not is_class_and_subclass(return_annotation, JSONStream):
+            return None
+
+        annotation = return_annotation.schema_annotation()
+        if annotation is None:
+            return None
+
+        item_type = return_annotation.item_type()
+        return ResponseParam(
+            annotation=annotation, alias=getattr(item_type, "__name__", str(item_type))
+        )
+
     @cached_property
     def data_field(self) -> Any:  # pragma: no cover
         """
@@ -3,16 +3,22 @@ from decimal import Decimal
 from enum import Enum
 from functools import partial
 from inspect import Signature, isawaitable
+from inspect import _ParameterKind as ParameterKind
 from pathlib import Path
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
     Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     List,
+    Mapping,
+    NamedTuple,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -20,6 +26,7 @@ from typing import (
 )
 from uuid import UUID
 
+from pydantic import TypeAdapter, ValidationError
 from starlette.convertors import CONVERTOR_TYPES
 from starlette.requests import HTTPConnection
 from starlette.responses import Response as StarletteResponse
@@ -29,13 +36,17 @@ from starlette.types import Receive, Scope, Send
 from typing_extensions import TypedDict
 
 from esmerald.backgound import BackgroundTask, BackgroundTasks
+from esmerald.concurrency import SYNC_HANDLERS_LIMITER, run_in_limiter
+from esmerald.conf import settings
 from esmerald.datastructures import ResponseContainer
-from esmerald.enums import MediaType
+from esmerald.enums import ExecutorType, InterceptorLifecycle, JSONEncoderType, MediaType
 from esmerald.exceptions import ImproperlyConfigured
 from esmerald.injector import Inject
-from esmerald.permissions.utils import continue_or_raise_permission_exception
+from esmerald.permissions.utils import compile_permission, permission_denied
 from esmerald.requests import Request
 from esmerald.responses import JSONResponse, Response
+from esmerald.responses.serializers import get_response_serializer
+from esmerald.routing.executors import run_handler
 from esmerald.routing.views import APIView
 from esmerald.transformers.model import TransformerModel
 from esmerald.transformers.signature import SignatureFactory
@@ -60,6 +71,11 @@ if TYPE_CHECKING:  # pragma: no cover
     )
     from esmerald.typing import AnyCallable
 
+InterceptorChain = Callable[[Scope, Receive, Send], Awaitable[None]]
+RawHeader = Tuple[bytes, bytes]
+# (cookie key, raw set-cookie header)
+RawCookie = Tuple[str, RawHeader]
+
 param_type_map = {
     "str": str,
     "int": int,
@@ -103,11 +119,43 @@ class OpenAPIDefinitionMixin:  # pragma: no cover
         return parsed_components
 
 
+class HandlerMetadata(NamedTuple):
+    """
+    The information extracted from the function of a handler.
+
+    Computed once every time the `fn` of the handler is assigned and shared by all the
+    subsystems (validations, signature models, response handlers and OpenAPI).
+    """
+
+    signature: Signature
+    return_annotation: Any
+    parameter_kinds: Mapping[str, ParameterKind]
+    is_async: bool
+    path_parameters: FrozenSet[str]
+
+    @classmethod
+    def from_callable(
+        cls, fn: "AnyCallable", path_parameters: FrozenSet[str] = frozenset()
+    ) -> "HandlerMetadata":
+        signature = Signature.from_callable(fn)
+        return cls(
+            signature=signature,
+            return_annotation=signature.return_annotation,
+            parameter_kinds={name: param.kind for name, param in signature.parameters.items()},
+            is_async=is_async_callable(fn),
+            path_parameters=path_parameters,
+        )
+
+
 class BaseSignature:
     """
     In charge of handling the signartures of the handlers.
     """
 
+    _signature_created: bool = False
+    _signature_lock: Optional[Lock] = None
+    _signature_is_websocket: bool = False
+
     def create_signature_model(self, is_websocket: bool = False) -> None:
         """
         Creates a signature model for the given route.
@@ -118,6 +166,7 @@ class BaseSignature:
             self.signature_model = SignatureFactory(
                 fn=cast("AnyCallable", self.fn),
                 dependency_names=self.dependency_names,
+                signature=self.signature,
             ).create_signature()
 
         for dependency in list(self.get_dependencies().values()):
@@ -133,6 +182,33 @@ class BaseSignature:
                 self.route_map[method] = (self, transformer_model)
         else:
             self.websocket_parameter_model = transformer_model
+        self._signature_created = True
+
+    def defer_signature_model(self, is_websocket: bool = False) -> None:
+        """
+        Defers the creation of the signature model to the first time the handler is used.
+
+        Used when `lazy_handlers` is enabled, see `ensure_signature_model`.
+        """
+        if not self._signature_created:
+            self._signature_is_websocket = is_websocket
+            self._signature_lock = Lock()
+
+    def ensure_signature_model(self) -> None:
+        """
+        Creates the deferred signature model of the handler, if not created yet.
+
+        The lock of the handler guarantees the model is created only once when the first
+        requests are dispatched concurrently (from different threads).
+        """
+        if self._signature_created:
+            return
+        if self._signature_lock is None:
+            self.create_signature_model(is_websocket=self._signature_is_websocket)
+            return
+        with self._signature_lock:
+            if not self._signature_created:
+                self.create_signature_model(is_websocket=self._signature_is_websocket)
 
     def create_handler_transformer_model(self) -> "TransformerModel":
         """Method to create a TransformerModel for a given handler."""
@@ -146,9 +222,103 @@ class BaseSignature:
         )
 
 
+def encode_headers(headers: Optional["ResponseHeaders"]) -> Tuple[RawHeader, ...]:
+    """
+    Encodes the response headers of a handler into the raw ASGI format.
+    """
+    return tuple(
+        (name.lower().encode("latin-1"), str(header.value).encode("latin-1"))
+        for name, header in (headers or {}).items()
+    )
+
+
+def encode_cookies(cookies: Optional["ResponseCookies"]) -> Tuple[RawCookie, ...]:
+    """
+    Serializes the response cookies of a handler into raw `set-cookie` headers.
+
+    The serialization is delegated to `set_cookie` making sure the headers are exactly the
+    same as the ones generated for every response.
+    """
+    encoded: List[RawCookie] = []
+    for cookie in cookies or []:
+        response = StarletteResponse()
+        response.raw_headers = []
+        response.set_cookie(**cookie.model_dump(exclude_none=True, exclude={"description"}))
+        encoded.append((cookie.key, response.raw_headers[0]))
+    return tuple(encoded)
+
+
+def merge_headers(
+    raw_headers: List[RawHeader],
+    headers: Tuple[RawHeader, ...],
+    override: bool = False,
+) -> None:
+    """
+    Adds the encoded headers to the raw headers of a response.
+
+    By default the headers already present in the response take precedence, when `override`
+    is True, the given headers replace them.
+    """
+    present = {name for name, _ in raw_headers}
+    if override:
+        names = {name for name, _ in headers}
+        if not names.isdisjoint(present):
+            raw_headers[:] = [header for header in raw_headers if header[0] not in names]
+        raw_headers.extend(headers)
+    else:
+        raw_headers.extend(header for header in headers if header[0] not in present)
+
+
+def encode_allow_header(handler: Any) -> Tuple[RawHeader, ...]:
+    """
+    Encodes the `allow` header of the handler, if any.
+    """
+    allow_header: Mapping[str, str] = getattr(handler, "allow_header", None) or {}
+    return tuple(
+        (name.encode("latin-1"), value.encode("latin-1")) for name, value in allow_header.items()
+    )
+
+
+def set_response_cookies(
+    response: StarletteResponse,
+    local_cookies: Optional["ResponseCookies"],
+    cookies: Tuple[RawCookie, ...],
+) -> None:
+    """
+    Sets the cookies of the response followed by the encoded cookies of the handler not
+    overridden by the response.
+    """
+    if local_cookies:
+        keys = set()
+        for cookie in local_cookies:
+            response.set_cookie(**cookie.model_dump(exclude_none=True, exclude={"description"}))
+            keys.add(cookie.key)
+        response.raw_headers.extend(header for key, header in cookies if key not in keys)
+    elif cookies:
+        response.raw_headers.extend(header for _, header in cookies)
+
+
+def serialize_response(serializer: TypeAdapter, data: Any, validate: bool = False) -> bytes:
+    """
+    Serializes the data returned by a handler into JSON according to its return annotation.
+    """
+    if validate:
+        try:
+            data = serializer.validate_python(data)
+        except ValidationError as e:
+            raise ImproperlyConfigured(
+                "The response does not match the return annotation of the handler."
+            ) from e
+    return serializer.dump_json(data, warnings=False)
+
+
 class BaseResponseHandler:
     """
     In charge of handling the responses of the handlers.
+
+    The headers and cookies declared in the handler (and its parents) are static, so they
+    are encoded only once, when the response handler is created, and the responses only get
+    the raw values appended.
     """
 
     def response_container_handler(
@@ -159,20 +329,19 @@ class BaseResponseHandler:
         status_code: int,
     ) -> "AsyncAnyCallable":
         """Creates a handler for ResponseContainer Types"""
+        handler_headers = self.get_headers(headers)
+        handler_cookies = encode_cookies(cookies)
 
         async def response_content(
             data: ResponseContainer, app: Type["Esmerald"], **kwargs: Dict[str, Any]
         ) -> StarletteResponse:
-            _headers = {**self.get_headers(headers), **data.headers}
-            _cookies = self.get_cookies(data.cookies, cookies)
             response: Response = data.to_response(
                 app=app,
-                headers=_headers,
+                headers={**handler_headers, **data.headers},
                 status_code=status_code,
                 media_type=media_type,
             )
-            for cookie in _cookies:
-                response.set_cookie(**cookie)
+            set_response_cookies(response, data.cookies, handler_cookies)
             return response
 
         return response_content
@@ -184,16 +353,12 @@ class BaseResponseHandler:
         status_code: Optional[int] = None,
         media_type: Optional[str] = MediaType.TEXT,
     ) -> "AsyncAnyCallable":
-        async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
-            _cookies = self.get_cookies(data.cookies, cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
+        handler_headers = encode_headers(headers)
+        handler_cookies = encode_cookies(cookies)
+        allow_header = encode_allow_header(self)
 
-            for cookie in _cookies:
-                data.set_cookie(**cookie)
+        async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
+            set_response_cookies(data, data.cookies, handler_cookies)
 
             if status_code:
                 data.status_code = status_code
@@ -201,8 +366,9 @@ class BaseResponseHandler:
             if media_type:
                 data.media_type = media_type
 
-            for header, value in _headers.items():
-                data.headers[header] = value
+            if handler_headers:
+                merge_headers(data.raw_headers, handler_headers)
+            merge_headers(data.raw_headers, allow_header, override=True)
             return data
 
         return response_content
@@ -214,19 +380,17 @@ class BaseResponseHandler:
         headers: Optional["ResponseHeaders"] = None,
     ) -> "AsyncAnyCallable":
         """Creates a handler function for Esmerald JSON responses"""
+        handler_headers = encode_headers(headers)
+        handler_cookies = tuple(cookie for _, cookie in encode_cookies(cookies))
+        allow_header = encode_allow_header(self)
 
         async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
+            if handler_cookies:
+                data.raw_headers.extend(handler_cookies)  # pragma: no cover
+
+            if handler_headers:
+                merge_headers(data.raw_headers, handler_headers)
+            merge_headers(data.raw_headers, allow_header, override=True)
 
             if status_code:
                 data.status_code = status_code
@@ -240,21 +404,19 @@ class BaseResponseHandler:
         headers: Optional["ResponseHeaders"] = None,
     ) -> "AsyncAnyCallable":
         """Creates an handler for Starlette Responses."""
+        handler_headers = encode_headers(headers)
+        handler_cookies = tuple(cookie for _, cookie in encode_cookies(cookies))
+        allow_header = encode_allow_header(self)
 
         async def response_content(
             data: StarletteResponse, **kwargs: Dict[str, Any]
         ) -> StarletteResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
+            if handler_cookies:
+                data.raw_headers.extend(handler_cookies)  # pragma: no cover
+
+            if handler_headers:
+                merge_headers(data.raw_headers, handler_headers)
+            merge_headers(data.raw_headers, allow_header, override=True)
             return data
 
         return response_content
@@ -268,28 +430,56 @@ class BaseResponseHandler:
         response_class: Any,
         status_code: int,
     ) -> "AsyncAnyCallable":
+        handler_headers = encode_headers(headers)
+        handler_cookies = tuple(cookie for _, cookie in encode_cookies(cookies))
+        serializer = self.get_response_serializer(response_class, media_type)
+        validate = settings.enable_response_validation
+
         async def response_content(data: Any, **kwargs: Dict[str, Any]) -> StarletteResponse:
             data = await self.get_response_data(data=data)
-            _cookies = self.get_cookies(cookies, [])
             if isinstance(data, JSONResponse):
                 response = data
                 response.status_code = status_code
                 response.background = background
             else:
+                if (
+                    serializer is not None
+                    and data is not None
+                    and not isinstance(data, StarletteResponse)
+                ):
+                    data = serialize_response(serializer, data, validate)
                 response = response_class(
                     background=background,
                     content=data,
-                    headers=headers,
                     media_type=media_type,
                     status_code=status_code,
                 )
+                if handler_headers:
+                    merge_headers(response.raw_headers, handler_headers, override=True)
 
-            for cookie in _cookies:
-                response.set_cookie(**cookie)  # pragma: no cover
+            if handler_cookies:
+                response.raw_headers.extend(handler_cookies)  # pragma: no cover
             return response
 
         return response_content
 
+    def get_response_serializer(
+        self, response_class: Any, media_type: str
+    ) -> Optional[TypeAdapter]:
+        """
+        Returns the serializer of the return annotation of the handler if the response is
+        rendered by the default orjson encoder and `transform` of the Esmerald `Response`.
+        """
+        if (
+            media_type != MediaType.JSON
+            or not is_class_and_subclass(response_class, Response)
+            or response_class.render is not Response.render
+            or response_class.transform is not Response.transform
+            or (response_class.json_encoder or settings.json_encoder) != JSONEncoderType.ORJSON
+        ):
+            return None
+        return get_response_serializer(self.metadata.return_annotation)
+
     async def get_response_for_request(
         self,
         scope: "Scope",
@@ -343,10 +533,8 @@ class BaseResponseHandler:
             request_data = kwargs.get("data")
             if request_data:
                 kwargs["data"] = await request_data
-            for dependency in parameter_model.dependencies:
-                kwargs[dependency.key] = await parameter_model.get_dependencies(
-                    dependency=dependency, connection=request, **kwargs
-                )
+            if parameter_model.dependency_levels:
+                await parameter_model.resolve_dependencies(connection=request, kwargs=kwargs)
             parsed_kwargs = signature_model.parse_values_for_connection(
                 connection=request, **kwargs
             )
@@ -361,8 +549,16 @@ class BaseResponseHandler:
         else:
             fn = partial(cast("AnyCallable", route.fn), **parsed_kwargs)
 
-        if is_async_callable(fn):
+        if route.metadata.is_async:
             return await fn()
+        if route.executor == ExecutorType.PROCESS:
+            return await route.get_process_pool().run(
+                run_handler, f"{route.fn.__module__}.{route.fn.__qualname__}", parsed_kwargs
+            )
+        if route.run_in_threadpool:
+            return await run_in_limiter(
+                route.thread_pool or SYNC_HANDLERS_LIMITER, settings.sync_handlers_workers, fn
+            )
         return fn()
 
     def get_response_handler(self) -> Callable[[Any], Awaitable[StarletteResponse]]:
@@ -379,7 +575,7 @@ class BaseResponseHandler:
             headers = self.get_response_headers()
             cookies = self.get_response_cookies()
 
-            if is_class_and_subclass(self.signature.return_annotation, ResponseContainer):
+            if is_class_and_subclass(self.metadata.return_annotation, ResponseContainer):
                 handler = self.response_container_handler(
                     cookies=cookies,
                     media_type=self.media_type,
@@ -387,20 +583,20 @@ class BaseResponseHandler:
                     headers=headers,
                 )
             elif is_class_and_subclass(
-                self.signature.return_annotation,
+                self.metadata.return_annotation,
                 JSONResponse,
             ):
                 handler = self.json_response_handler(
                     status_code=self.status_code, cookies=cookies, headers=headers
                 )
-            elif is_class_and_subclass(self.signature.return_annotation, Response):
+            elif is_class_and_subclass(self.metadata.return_annotation, Response):
                 handler = self.response_handler(
                     cookies=cookies,
                     status_code=self.status_code,
                     media_type=self.media_type,
                     headers=headers,
                 )
-            elif is_class_and_subclass(self.signature.return_annotation, StarletteResponse):
+            elif is_class_and_subclass(self.metadata.return_annotation, StarletteResponse):
                 handler = self.starlette_response_handler(
                     cookies=cookies,
                     headers=headers,
@@ -426,10 +622,49 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
     Base of HTTPHandler and WebSocketHandler.
     """
 
+    _fn: Optional["AnyCallable"] = None
+    _metadata: Optional[HandlerMetadata] = None
+    _param_convertors: Dict[str, Any] = {}
+
+    @property
+    def fn(self) -> Optional["AnyCallable"]:
+        return self._fn
+
+    @fn.setter
+    def fn(self, value: Optional["AnyCallable"]) -> None:
+        """
+        Every time the function changes, the metadata of the handler is generated again.
+        """
+        self._fn = value
+        self._metadata = (
+            HandlerMetadata.from_callable(value, frozenset(self._param_convertors))
+            if value is not None
+            else None
+        )
+
+    @property
+    def param_convertors(self) -> Dict[str, Any]:
+        return self._param_convertors
+
+    @param_convertors.setter
+    def param_convertors(self, value: Dict[str, Any]) -> None:
+        self._param_convertors = value
+        if self._metadata is not None:
+            self._metadata = self._metadata._replace(path_parameters=frozenset(value))
+
+    @property
+    def metadata(self) -> HandlerMetadata:
+        """The cached metadata of 'self.fn'."""
+        if self._metadata is None:
+            if self._fn is None:
+                raise ImproperlyConfigured("The handler function is not set.")
+            self.fn = self._fn
+        return cast("HandlerMetadata", self._metadata)
+
     @property
     def signature(self) -> Signature:
         """The Signature of 'self.fn'."""
-        return Signature.from_callable(cast("AnyCallable", self.fn))
+        return self.metadata.signature
 
     @property
     def path_parameters(self) -> Set[str]:
@@ -438,10 +673,9 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
 
         Example: {'name', 'id'}
         """
-        parameters = set()
-        for param_name, _ in self.param_convertors.items():
-            parameters.add(param_name)
-        return parameters
+        if self._metadata is not None:
+            return set(self._metadata.path_parameters)
+        return set(self._param_convertors)
 
     @property
     def stringify_parameters(self) -> List[str]:  # pragma: no cover
@@ -490,19 +724,25 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
         level_dependencies = (level.dependencies or {} for level in self.parent_levels)
         return {name for level in level_dependencies for name in level.keys()}
 
-    def get_permissions(self) -> List["AsyncCallable"]:
+    def get_permissions(self) -> List["BasePermission"]:
         """
         Returns all the permissions in the handler scope from the ownsership layers.
+
+        The permissions are instantiated and compiled only once for the handler.
         """
         if self._permissions is Void:
-            self._permissions: Union[List["Permission"], "VoidType"] = []
+            permissions: List["Permission"] = []
             for layer in self.parent_levels:
-                self._permissions.extend(layer.permissions or [])
-            self._permissions = cast(
-                "List[Permission]",
-                [AsyncCallable(permissions) for permissions in self._permissions],
-            )
-        return cast("List[AsyncCallable]", self._permissions)
+                permissions.extend(layer.permissions or [])
+
+            self._permissions: Union[List["BasePermission"], "VoidType"] = [
+                permission() for permission in permissions
+            ]
+            self._permission_evaluators = [
+                (permission, *compile_permission(permission))
+                for permission in self._permissions
+            ]
+        return cast("List[BasePermission]", self._permissions)
 
     def get_dependencies(self) -> "Dependencies":
         """
@@ -577,15 +817,22 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
 
         Raises a PermissionDenied exception if not allowed..
         """
-        for permission in self.get_permissions():
-            awaitable: "BasePermission" = cast("BasePermission", await permission())
-            request: "Request" = cast("Request", connection)
-            handler = cast("APIGateHandler", self)
-            await continue_or_raise_permission_exception(request, handler, awaitable)
+        self.get_permissions()
+        request: "Request" = cast("Request", connection)
+        handler = cast("APIGateHandler", self)
+
+        for permission, is_async, evaluate in self._permission_evaluators:
+            allowed = evaluate(request=request, apiview=handler)
+            if is_async:
+                allowed = await allowed
+            if not allowed:
+                permission_denied(request, message=getattr(permission, "message", None))
 
 
 class BaseInterceptorMixin(BaseHandlerMixin):  # pragma: no cover
-    def get_interceptors(self) -> List["AsyncCallable"]:
+    _interceptor_chain: Union[Optional["InterceptorChain"], VoidType] = Void
+
+    def get_interceptors(self) -> List["Interceptor"]:
         """
         Returns all the interceptors in the handler scope from the ownsership layers.
         """
@@ -593,17 +840,61 @@ class BaseInterceptorMixin(BaseHandlerMixin):  # pragma: no cover
             self._interceptors: Union[List["Interceptor"], "VoidType"] = []
             for layer in self.parent_levels:
                 self._interceptors.extend(layer.interceptors or [])
-            self._interceptors = cast(
-                "List[Interceptor]",
-                [AsyncCallable(interceptors) for interceptors in self._interceptors],
-            )
-        return cast("List[AsyncCallable]", self._interceptors)
+        return cast("List[Interceptor]", self._interceptors)
+
+    def compile_interceptors(self) -> Optional["InterceptorChain"]:
+        """
+        Compiles all the interceptors of the handler scope into a single coroutine.
+
+        The `singleton` interceptors (default) are instantiated only once, the `per-request`
+        ones are instantiated on every call. Returns None if there are no interceptors.
+        """
+        interceptors = self.get_interceptors()
+        if not interceptors:
+            return None
+
+        intercepts: List[Callable[..., Awaitable[None]]] = []
+        factories: List[Optional[AsyncCallable]] = []
+        for interceptor in interceptors:
+            lifecycle = getattr(interceptor, "lifecycle", InterceptorLifecycle.SINGLETON)
+            if lifecycle == InterceptorLifecycle.PER_REQUEST:
+                intercepts.append(None)  # type: ignore[arg-type]
+                factories.append(AsyncCallable(interceptor))
+            else:
+                instance: "EsmeraldInterceptor" = interceptor()
+                intercepts.append(instance.intercept)
+                factories.append(None)
+
+        if not any(factories):
+            singletons = tuple(intercepts)
+
+            async def chain(scope: "Scope", receive: "Receive", send: "Send") -> None:
+                for intercept in singletons:
+                    await intercept(scope, receive, send)
+
+            return chain
+
+        steps = tuple(zip(intercepts, factories))
+
+        async def mixed_chain(scope: "Scope", receive: "Receive", send: "Send") -> None:
+            for intercept, factory in steps:
+                if factory is not None:
+                    instance: "EsmeraldInterceptor" = await factory()
+                    intercept = instance.intercept
+                await intercept(scope, receive, send)
+
+        return mixed_chain
+
+    def get_interceptor_chain(self) -> Optional["InterceptorChain"]:
+        if self._interceptor_chain is Void:
+            self._interceptor_chain = self.compile_interceptors()
+        return cast("Optional[InterceptorChain]", self._interceptor_chain)
 
     async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
         Checks for every interceptor on each level and runs them all before reaching any
         of the handlers.
         """
-        for interceptor in self.get_interceptors():
-            awaitable: "EsmeraldInterceptor" = await interceptor()
-            await awaitable.intercept(scope, receive, send)
+        chain = self.get_interceptor_chain()
+        if chain is not None:
+            await chain(scope, receive, send)
@@ -0,0 +1,62 @@
+from time import perf_counter
+from typing import Any, List, NamedTuple, Optional
+
+from esmerald.routing.gateways import Gateway, WebSocketGateway
+from esmerald.routing.views import APIView
+from esmerald.utils.url import clean_path
+
+
+class CompiledHandler(NamedTuple):
+    path: str
+    name: str
+    type: str
+    elapsed: float
+    deferred: bool
+    error: Optional[str] = None
+
+
+def compile_handlers(app: Any, prefix: str = "") -> List[CompiledHandler]:
+    """
+    Creates the signature models and response handlers of all the handlers of the application
+    (including the ones deferred by `lazy_handlers`), timing each one of them.
+
+    Only the handlers `deferred` (not compiled when the routes were registered) are fully
+    measured, the others were already compiled.
+    """
+    compiled: List[CompiledHandler] = []
+
+    for route in getattr(app, "routes", None) or []:
+        if isinstance(route, (Gateway, WebSocketGateway)):
+            if isinstance(route.handler, APIView):  # pragma: no cover
+                continue
+
+            is_websocket = isinstance(route, WebSocketGateway)
+            path = clean_path(prefix + route.path)
+            deferred = route.handler.signature_model is None
+            error = None
+            start = perf_counter()
+            try:
+                route.handler.ensure_signature_model()
+                if not is_websocket:
+                    route.handler.get_response_handler()
+            except Exception as e:
+                error = f"{e.__class__.__name__}: {e}"
+            elapsed = perf_counter() - start
+
+            compiled.append(
+                CompiledHandler(
+                    path=path,
+                    name=route.name,
+                    type="websocket" if is_websocket else ", ".join(sorted(route.handler.methods)),
+                    elapsed=elapsed,
+                    deferred=deferred,
+                    error=error,
+                )
+            )
+            continue
+
+        route_app = getattr(route, "app", None)
+        if route_app is not None and hasattr(route, "path"):
+            compiled.extend(compile_handlers(route_app, prefix=clean_path(prefix + route.path)))
+
+    return compiled
@@ -0,0 +1,65 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from starlette.types import Message, Send
+
+from esmerald.concurrency import ProcessPool
+from esmerald.enums import ExecutorType
+from esmerald.utils.module_loading import import_string
+
+
+@lru_cache(maxsize=None)
+def import_handler(path: str) -> Callable[..., Any]:
+    """
+    Imports the function of the handler declared at the module level under `path`.
+    """
+    handler = import_string(path)
+    return getattr(handler, "fn", None) or handler  # type: ignore[no-any-return]
+
+
+def run_handler(path: str, kwargs: Dict[str, Any]) -> Any:
+    """
+    Runs the handler in a worker process of a process pool.
+    """
+    return import_handler(path)(**kwargs)
+
+
+def get_process_pools(app: Any) -> List[ProcessPool]:
+    """
+    Returns the process pools used by the handlers of the application, including the ones of
+    its includes and child applications.
+    """
+    pools: Dict[str, ProcessPool] = {}
+
+    for route in getattr(app, "routes", None) or []:
+        handler = getattr(route, "handler", None)
+        if handler is not None:
+            if getattr(handler, "executor", None) == ExecutorType.PROCESS:
+                pool = handler.get_process_pool()
+                pools[pool.name] = pool
+            continue
+
+        route_app = getattr(route, "app", None)
+        if route_app is not None and hasattr(route, "path"):
+            for pool in get_process_pools(route_app):
+                pools[pool.name] = pool
+
+    return list(pools.values())
+
+
+def manage_process_pools(app: Any, send: Send) -> Send:
+    """
+    Follows the lifespan of the application, warming up the process pools of its handlers
+    before completing the startup and shutting them down before completing the shutdown.
+    """
+
+    async def wrapped_send(message: Message) -> None:
+        if message["type"] == "lifespan.startup.complete":
+            for pool in get_process_pools(app):
+                await pool.warm_up()
+        elif message["type"] == "lifespan.shutdown.complete":
+            for pool in get_process_pools(app):
+                await pool.shutdown()
+        await send(message)
+
+    return wrapped_send
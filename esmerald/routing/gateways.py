@@ -1,11 +1,13 @@
 import re
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Union, cast
 
+from starlette.middleware import Middleware as StarletteMiddleware
 from starlette.routing import Route as StarletteRoute
 from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
 from starlette.routing import compile_path
-from starlette.types import Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from esmerald.conf import settings
 from esmerald.routing.base import BaseInterceptorMixin
 from esmerald.routing.views import APIView
 from esmerald.typing import Void, VoidType
@@ -15,13 +17,55 @@ from esmerald.utils.url import clean_path
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.interceptors.types import Interceptor
     from esmerald.permissions.types import Permission
+    from esmerald.routing.base import InterceptorChain
     from esmerald.routing.router import HTTPHandler, WebhookHandler, WebSocketHandler
     from esmerald.types import Dependencies, ExceptionHandlerMap, Middleware, ParentType
 
 
-class Gateway(StarletteRoute, BaseInterceptorMixin):
+class BaseMiddlewareMixin:
+    """
+    Builds the middleware declared on a gateway and on its handler into an ASGI chain wrapping
+    only that route, instead of every request of the application.
+    """
+
+    handler: Any
+    middleware: Sequence["Middleware"]
+
+    def get_route_middleware(self) -> List[StarletteMiddleware]:
+        """
+        Returns the middleware of the gateway followed by the middleware of the handler.
+        """
+        route_middleware: List[StarletteMiddleware] = []
+        for middleware in [*self.middleware, *(getattr(self.handler, "middleware", None) or [])]:
+            if isinstance(middleware, StarletteMiddleware):
+                route_middleware.append(middleware)
+            else:
+                route_middleware.append(StarletteMiddleware(cast("Any", middleware)))
+        return route_middleware
+
+    def build_middleware_chain(self) -> Optional[ASGIApp]:
+        """
+        Instantiates the route middleware around the `dispatch` of the gateway.
+        Returns None if there is no middleware to apply.
+        """
+        if isinstance(self.handler, APIView):
+            return None
+
+        route_middleware = self.get_route_middleware()
+        if not route_middleware:
+            return None
+
+        app: ASGIApp = cast("Any", self).dispatch
+        for cls, options in reversed(route_middleware):
+            app = cls(app=app, **options)
+        return app
+
+
+class Gateway(StarletteRoute, BaseInterceptorMixin, BaseMiddlewareMixin):
     __slots__ = (
         "_interceptors",
+        "_interceptor_chain",
+        "_middleware_chain",
         "path",
         "handler",
         "name",
@@ -82,6 +126,7 @@ class Gateway(StarletteRoute, BaseInterceptorMixin):
         the Gateway bridges both functionalities and adds an extra "flair" to be compliant with both class based views and decorated function views.
         """
         self._interceptors: Union[List["Interceptor"], "VoidType"] = Void
+        self._interceptor_chain: Union[Optional["InterceptorChain"], "VoidType"] = Void
         self.name = name
         self.handler = handler
         self.dependencies = dependencies or {}
@@ -104,17 +149,31 @@ class Gateway(StarletteRoute, BaseInterceptorMixin):
             self.handler, APIView
         ):
             self.handler.name = self.name
-            self.handler.get_response_handler()
+            if not settings.lazy_handlers:
+                self.handler.get_response_handler()
 
             if not handler.operation_id:
                 handler.operation_id = self.generate_operation_id()
 
+        self._middleware_chain = self.build_middleware_chain()
+
     async def handle(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
-        Handles the interception of messages and calls from the API.
+        Handles the interception of messages and calls from the API, through the middleware
+        of the route when there is any.
+        """
+        if self._middleware_chain is not None:
+            await self._middleware_chain(scope, receive, send)
+            return
+        await self.dispatch(scope, receive, send)
+
+    async def dispatch(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """
+        Runs the interceptors and the handler.
         """
-        if self.get_interceptors():
-            await self.intercept(scope, receive, send)
+        chain = self.get_interceptor_chain()
+        if chain is not None:
+            await chain(scope, receive, send)
 
         await self.handler.handle(scope, receive, send)
 
@@ -131,9 +190,11 @@ class Gateway(StarletteRoute, BaseInterceptorMixin):
         return operation_id
 
 
-class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
+class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin, BaseMiddlewareMixin):
     __slots__ = (
         "_interceptors",
+        "_interceptor_chain",
+        "_middleware_chain",
         "path",
         "handler",
         "name",
@@ -181,6 +242,7 @@ class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
         the Gateway bridges both functionalities and adds an extra "flair" to be compliant with both class based views and decorated function views.
         """
         self._interceptors: Union[List["Interceptor"], "VoidType"] = Void
+        self._interceptor_chain: Union[Optional["InterceptorChain"], "VoidType"] = Void
         self.handler = handler
         self.dependencies = dependencies or {}
         self.interceptors = interceptors or []
@@ -194,13 +256,25 @@ class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
             handler.path_format,
             handler.param_convertors,
         ) = compile_path(self.path)
+        self._middleware_chain = self.build_middleware_chain()
 
     async def handle(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
-        Handles the interception of messages and calls from the API.
+        Handles the interception of messages and calls from the API, through the middleware
+        of the route when there is any.
+        """
+        if self._middleware_chain is not None:
+            await self._middleware_chain(scope, receive, send)
+            return
+        await self.dispatch(scope, receive, send)
+
+    async def dispatch(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """
+        Runs the interceptors and the handler.
         """
-        if self.get_interceptors():
-            await self.intercept(scope, receive, send)  # pragma: no cover
+        chain = self.get_interceptor_chain()
+        if chain is not None:
+            await chain(scope, receive, send)
 
         await self.handler.handle(scope, receive, send)
 
@@ -208,6 +282,7 @@ class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
 class WebhookGateway(StarletteRoute, BaseInterceptorMixin):
     __slots__ = (
         "_interceptors",
+        "_interceptor_chain",
         "path",
         "handler",
         "name",
@@ -245,6 +320,7 @@ class WebhookGateway(StarletteRoute, BaseInterceptorMixin):
         self.include_in_schema = include_in_schema
 
         self._interceptors: Union[List["Interceptor"], "VoidType"] = Void
+        self._interceptor_chain: Union[Optional["InterceptorChain"], "VoidType"] = Void
         self.name = name
         self.handler = handler
         self.dependencies: Any = {}
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Type, Union
 
 from starlette import status
 
-from esmerald.enums import HttpMethod, MediaType
+from esmerald.enums import ExecutorType, HttpMethod, MediaType
 from esmerald.exceptions import HTTPException, ImproperlyConfigured
 from esmerald.openapi.datastructures import OpenAPIResponse
 from esmerald.permissions.types import Permission
@@ -21,6 +21,8 @@ from esmerald.utils.constants import AVAILABLE_METHODS
 if TYPE_CHECKING:  # pragma: no cover
     from openapi_schemas_pydantic.v3_1_0 import SecurityScheme
 
+    from esmerald.cache.core import CacheType
+
 
 SUCCESSFUL_RESPONSE = "Successful response"
 
@@ -52,6 +54,12 @@ class get(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
+        cache: Optional["CacheType"] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -78,6 +86,12 @@ class get(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
+            cache=cache,
         )
 
 
@@ -108,6 +122,11 @@ class head(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -134,6 +153,11 @@ class head(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -164,6 +188,11 @@ class options(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -190,6 +219,11 @@ class options(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -220,6 +254,11 @@ class trace(HTTPHandler):  # pragma: no cover
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -246,6 +285,11 @@ class trace(HTTPHandler):  # pragma: no cover
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -276,6 +320,11 @@ class post(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -302,6 +351,11 @@ class post(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -332,6 +386,11 @@ class put(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -358,6 +417,11 @@ class put(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -388,6 +452,11 @@ class patch(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -414,6 +483,11 @@ class patch(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -444,6 +518,11 @@ class delete(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
     ) -> None:
         super().__init__(
             path=path,
@@ -470,6 +549,11 @@ class delete(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
         )
 
 
@@ -501,6 +585,12 @@ class route(HTTPHandler):
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
         response_description: Optional[str] = SUCCESSFUL_RESPONSE,
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
+        cache: Optional["CacheType"] = None,
     ) -> None:
         if not methods or not isinstance(methods, list):
             raise ImproperlyConfigured(
@@ -544,6 +634,12 @@ class route(HTTPHandler):
             raise_exceptions=raise_exceptions,
             response_description=response_description,
             responses=responses,
+            thread_pool=thread_pool,
+            max_concurrency=max_concurrency,
+            run_in_threadpool=run_in_threadpool,
+            executor=executor,
+            process_pool=process_pool,
+            cache=cache,
         )
 
 
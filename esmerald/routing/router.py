@@ -1,6 +1,7 @@
 import inspect
 from copy import copy
 from enum import IntEnum
+from functools import partial
 from inspect import Signature
 from typing import (
     TYPE_CHECKING,
@@ -29,16 +30,24 @@ from starlette.responses import Response as StarletteResponse
 from starlette.routing import BaseRoute as StarletteBaseRoute
 from starlette.routing import Host, Mount, NoMatchFound
 from starlette.routing import Route as StarletteRoute
-from starlette.routing import Router as StarletteRouter
 from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
 from starlette.routing import compile_path
 from starlette.types import ASGIApp, Lifespan, Receive, Scope, Send
 from typing_extensions import Self
 
+from esmerald.cache.core import CacheType, ResponseCache, get_cache_options
+from esmerald.concurrency import (
+    DEFAULT_PROCESS_POOL,
+    SYNC_HANDLERS_LIMITER,
+    ProcessPool,
+    get_process_pool,
+    register_process_pool,
+    register_thread_pool,
+)
 from esmerald.conf import settings
 from esmerald.core.urls import include
 from esmerald.datastructures import File, Redirect
-from esmerald.enums import HttpMethod, MediaType
+from esmerald.enums import ExecutorType, HttpMethod, MediaType
 from esmerald.exceptions import (
     ImproperlyConfigured,
     MethodNotAllowed,
@@ -55,13 +64,14 @@ from esmerald.routing._internal import FieldInfoMixin
 from esmerald.routing.base import BaseHandlerMixin
 from esmerald.routing.events import handle_lifespan_events
 from esmerald.routing.gateways import Gateway, WebhookGateway, WebSocketGateway
+from esmerald.routing.tree import TreeRouter
 from esmerald.routing.views import APIView
 from esmerald.transformers.datastructures import EsmeraldSignature as SignatureModel
 from esmerald.transformers.model import TransformerModel
 from esmerald.transformers.utils import get_signature
 from esmerald.typing import Void, VoidType
 from esmerald.utils.constants import DATA, REDIRECT_STATUS_CODES, REQUEST, SOCKET
-from esmerald.utils.helpers import is_async_callable, is_class_and_subclass
+from esmerald.utils.helpers import is_class_and_subclass
 from esmerald.utils.url import clean_path
 from esmerald.websockets import WebSocket, WebSocketClose
 
@@ -107,10 +117,16 @@ class Parent:
             if not is_class_and_subclass(route.handler, APIView) and not isinstance(
                 route.handler, APIView
             ):
-                route.handler.create_signature_model()
+                if settings.lazy_handlers and not isinstance(route, WebhookGateway):
+                    route.handler.defer_signature_model()
+                else:
+                    route.handler.create_signature_model()
 
         if isinstance(route, WebSocketGateway):
-            route.handler.create_signature_model(is_websocket=True)
+            if settings.lazy_handlers:
+                route.handler.defer_signature_model(is_websocket=True)
+            else:
+                route.handler.create_signature_model(is_websocket=True)
 
     def validate_root_route_parent(
         self,
@@ -168,7 +184,7 @@ class Parent:
                 self.routes.pop(self.routes.index(value))
 
 
-class Router(Parent, StarletteRouter):
+class Router(Parent, TreeRouter):
     __slots__ = (
         "redirect_slashes",
         "default",
@@ -289,6 +305,14 @@ class Router(Parent, StarletteRouter):
     def activate(self) -> None:
         self.routes = self.reorder_routes()
 
+    @property
+    def is_activation_deferred(self) -> bool:
+        """
+        Returns True while the application of the router is inside a `deferred_activation()`
+        block, the routes being sorted once when the block ends.
+        """
+        return bool(getattr(self.app, "is_activation_deferred", False))
+
     def add_apiview(self, value: Union["Gateway", "WebSocketGateway"]) -> None:
         """Adds a Gateway/WebSocketGateway coming containing the handler of type APIView.
         Generates the signature model for it and sorts the routing list.
@@ -315,7 +339,8 @@ class Router(Parent, StarletteRouter):
 
         for route in routes or []:
             self.create_signature_models(route)
-        self.activate()
+        if not self.is_activation_deferred:
+            self.activate()
 
     def add_route(
         self,
@@ -467,6 +492,13 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         "security",
         "operation_id",
         "raise_exceptions",
+        "thread_pool",
+        "max_concurrency",
+        "run_in_threadpool",
+        "executor",
+        "process_pool",
+        "cache",
+        "_response_cache",
     )
 
     def __init__(
@@ -497,9 +529,25 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         security: Optional[List["SecurityScheme"]] = None,
         operation_id: Optional[str] = None,
         raise_exceptions: Optional[List[Type["HTTPException"]]] = None,
+        thread_pool: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        run_in_threadpool: bool = True,
+        executor: str = ExecutorType.THREAD,
+        process_pool: Optional[str] = None,
+        cache: Optional["CacheType"] = None,
     ) -> None:
         """
         Handles the "handler" or "apiview" of the platform. A handler can be any get, put, patch, post, delete or route.
+
+        Sync handlers run in the thread pool named `thread_pool` (the shared `sync_handlers` pool
+        by default), sized once by the `max_concurrency` of its handlers, unless
+        `run_in_threadpool` is False for the handlers known to be non-blocking.
+
+        With the `process` executor, CPU bound sync handlers run in the worker processes of the
+        `process_pool` instead, receiving their validated arguments pickled.
+
+        The GET responses are cached by the `cache_config` of the application when `cache` is
+        declared, either `True`, a ttl in seconds or a `Cache`.
         """
         if not path:
             path = "/"
@@ -557,6 +605,14 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         self.content_encoding = content_encoding
         self.content_media_type = content_media_type
         self.raise_exceptions = raise_exceptions
+        self.thread_pool = thread_pool
+        self.max_concurrency = max_concurrency
+        self.run_in_threadpool = run_in_threadpool
+        self.executor = executor
+        self.process_pool = process_pool
+        self.cache = cache
+        get_cache_options(cache)
+        self._response_cache: Union[Optional[ResponseCache], VoidType] = Void
 
         self.fn: Optional["AnyCallable"] = None
         self.app: Optional["ASGIApp"] = None
@@ -646,13 +702,37 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         methods = [scope["method"]]
         await self.allowed_methods(scope, receive, send, methods)
 
-        request = Request(scope=scope, receive=receive, send=send)
+        request = Request.from_scope(scope=scope, receive=receive, send=send)
+        self.ensure_signature_model()
         route_handler, parameter_model = self.route_map[scope["method"]]
 
         if self.get_permissions():
             connection = HTTPConnection(scope=scope, receive=receive)
             await self.allow_connection(connection)
 
+        response_cache = self.get_response_cache()
+        cache_config = getattr(scope.get("app"), "cache_config", None)
+        if (
+            response_cache is not None
+            and cache_config is not None
+            and scope["method"] == HttpMethod.GET
+        ):
+            await response_cache(
+                cache_config,
+                request,
+                partial(
+                    self.get_response_for_request,
+                    scope=scope,
+                    request=request,
+                    route=route_handler,
+                    parameter_model=parameter_model,
+                ),
+                scope,
+                receive,
+                send,
+            )
+            return
+
         response = await self.get_response_for_request(
             scope=scope,
             request=request,
@@ -661,6 +741,20 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         )
         await response(scope, receive, send)
 
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """
+        Returns the cache of the responses declared by the handler or the closest APIView,
+        the `cache` of the handler taking precedence.
+        """
+        if self._response_cache is Void:
+            cache: Optional[CacheType] = None
+            for layer in self.parent_levels:
+                if getattr(layer, "cache", None) is not None:
+                    cache = layer.cache
+            options = get_cache_options(cache)
+            self._response_cache = ResponseCache(options) if options is not None else None
+        return cast("Optional[ResponseCache]", self._response_cache)
+
     def __call__(self, fn: "AnyCallable") -> "HTTPHandler":
         self.fn = fn
         self.endpoint = fn
@@ -696,8 +790,7 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
             )
 
         if not settings.enable_sync_handlers:  # pragma: no cover
-            fn = cast("AnyCallable", self.fn)
-            if not is_async_callable(fn):
+            if not self.metadata.is_async:
                 raise ImproperlyConfigured(
                     "Functions decorated with 'route, websocket, get, patch, put, post and delete' must be async functions"
                 )
@@ -706,7 +799,7 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         """
         Validate annotations of the handlers.
         """
-        return_annotation = self.signature.return_annotation
+        return_annotation = self.metadata.return_annotation
 
         if return_annotation is Signature.empty:
             raise ImproperlyConfigured(
@@ -739,16 +832,70 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         """
         Validates if special words are in the signature.
         """
-        if DATA in self.signature.parameters and "GET" in self.methods:
+        if DATA in self.metadata.parameter_kinds and "GET" in self.methods:
             raise ImproperlyConfigured("'data' argument is unsupported for 'GET' request handlers")
 
-        if SOCKET in self.signature.parameters:
+        if SOCKET in self.metadata.parameter_kinds:
             raise ImproperlyConfigured("The 'socket' argument is not supported with http handlers")
 
+    def validate_executor(self) -> None:
+        """
+        Validates if the handler can run in the worker processes, the workers import it by its
+        module and name and its arguments must be picklable.
+        """
+        if self.executor not in {ExecutorType.THREAD, ExecutorType.PROCESS}:
+            raise ImproperlyConfigured(
+                f"Invalid executor {self.executor}. Use either 'thread' or 'process'."
+            )
+        if self.executor != ExecutorType.PROCESS:
+            self.validate_thread_pool()
+            return
+
+        if self.metadata.is_async:
+            raise ImproperlyConfigured("The 'process' executor only supports sync handlers.")
+        if "." in self.fn.__qualname__:
+            raise ImproperlyConfigured(
+                "Handlers using the 'process' executor must be defined at the module level."
+            )
+        if REQUEST in self.metadata.parameter_kinds:
+            raise ImproperlyConfigured(
+                "The 'request' argument is not supported with the 'process' executor."
+            )
+        if self.max_concurrency is not None:
+            register_process_pool(self.process_pool or DEFAULT_PROCESS_POOL, self.max_concurrency)
+
+    def validate_thread_pool(self) -> None:
+        """
+        Sizes the `thread_pool` of the handler with its `max_concurrency`. The shared
+        `sync_handlers` pool is sized by the settings and a named pool is sized once.
+        """
+        if self.max_concurrency is None:
+            return
+
+        if self.thread_pool is None or self.thread_pool == SYNC_HANDLERS_LIMITER:
+            raise ImproperlyConfigured(
+                "`max_concurrency` requires a `thread_pool`, the shared "
+                f"'{SYNC_HANDLERS_LIMITER}' pool is sized by the `sync_handlers_workers` setting."
+            )
+        register_thread_pool(self.thread_pool, self.max_concurrency)
+
     def validate_handler(self) -> None:
         self.check_handler_function()
         self.validate_annotations()
         self.validate_reserved_kwargs()
+        self.validate_executor()
+
+    def get_process_pool(self) -> ProcessPool:
+        """
+        Returns the process pool running the handler, preloading the module of the handler
+        in its workers.
+        """
+        return get_process_pool(
+            self.process_pool or DEFAULT_PROCESS_POOL,
+            max_workers=self.max_concurrency or settings.process_pool_workers,
+            max_queue_size=settings.process_pool_max_queue_size,
+            preload=[*settings.process_pool_preload, self.fn.__module__],
+        )
 
     async def to_response(self, app: "Esmerald", data: Any) -> StarletteResponse:
         response_handler = self.get_response_handler()
@@ -924,12 +1071,12 @@ class WebSocketHandler(BaseHandlerMixin, StarletteWebSocketRoute):
             raise ImproperlyConfigured(
                 "Cannot call check_handler_function without first setting self.fn"
             )
-        signature = Signature.from_callable(self.fn)
+        signature = self.signature
         self.validate_reserved_words(signature=signature)
 
         if SOCKET not in signature.parameters:
             raise ImproperlyConfigured("Websocket handlers must set a 'socket' argument.")
-        if not is_async_callable(self.fn):
+        if not self.metadata.is_async:
             raise ImproperlyConfigured(
                 "Functions decorated with 'asgi, get, patch, put, post and delete' must be async functions."
             )
@@ -937,6 +1084,7 @@ class WebSocketHandler(BaseHandlerMixin, StarletteWebSocketRoute):
     async def handle(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """The handle of a websocket"""
         websocket = WebSocket[Any, Any](scope=scope, receive=receive, send=send)
+        self.ensure_signature_model()
         if self.get_permissions():
             await self.allow_connection(connection=websocket)
 
@@ -961,9 +1109,9 @@ class WebSocketHandler(BaseHandlerMixin, StarletteWebSocketRoute):
 
         signature_model = get_signature(self)
         kwargs = self.websocket_parameter_model.to_kwargs(connection=websocket)
-        for dependency in self.websocket_parameter_model.dependencies:
-            kwargs[dependency.key] = await self.websocket_parameter_model.get_dependencies(
-                dependency=dependency, connection=websocket, **kwargs
+        if self.websocket_parameter_model.dependency_levels:
+            await self.websocket_parameter_model.resolve_dependencies(
+                connection=websocket, kwargs=kwargs
             )
         return signature_model.parse_values_for_connection(connection=websocket, **kwargs)
 
@@ -1054,13 +1202,8 @@ class Include(Mount):
         if routes:
             routes = self.resolve_route_path_handler(routes)
 
-        # Build the middleware from the routes
-        routes_middleware: List["Middleware"] = []
-        for route in routes or []:
-            routes_middleware = cast("List[Middleware]", self.build_routes_middleware(route))
-
-        # Add the middleware to the include
-        self.middleware += routes_middleware
+        # The middleware of the routes is applied by their gateways,
+        # only the middleware of the include wraps the whole include.
         include_middleware: Sequence["Middleware"] = []
 
         for _middleware in self.middleware:
@@ -1072,6 +1215,8 @@ class Include(Mount):
                 )
 
         app = self.resolve_app_parent(app=app)
+        if app is None and routes is not None:
+            app = TreeRouter(routes=routes)
 
         super().__init__(
             self.path,
@@ -1091,29 +1236,6 @@ class Include(Mount):
             app.parent = self
         return app
 
-    def build_routes_middleware(
-        self, route: "RouteParent", middlewares: Optional[Sequence["Middleware"]] = None
-    ) -> Sequence["Middleware"]:
-        """
-        Builds the middleware stack from the top to the bottom of the routes.
-        """
-        from esmerald import ChildEsmerald, Esmerald
-
-        if not middlewares:
-            middlewares = []
-
-        if isinstance(route, Include):
-            app = getattr(route, "app", None)
-            if app and isinstance(app, (Esmerald, ChildEsmerald)):
-                return middlewares
-
-        if isinstance(route, (Gateway, WebSocketGateway)):
-            middlewares.extend(route.middleware)
-            if route.handler.middleware:
-                middlewares.extend(route.handler.middleware)
-
-        return middlewares
-
     def resolve_route_path_handler(
         self, routes: Sequence[Union["APIGateHandler", "Include"]]
     ) -> List[Union["Gateway", "WebSocketGateway", "Include"]]:
@@ -0,0 +1,280 @@
+"""
+Prefix tree used by the Esmerald routers to find the routes that can match a given path
+without scanning and regex matching every registered route.
+
+The tree is built from the `path_format` and the `param_convertors` that every Starlette
+route (and therefore every Gateway, WebSocketGateway and Include) already carries.
+
+* Static segments are resolved with a dictionary lookup.
+* Parameter segments (`{id:int}`, `{name}`...) are resolved with the regex of the convertor.
+* `path` convertors and mounts (Include) are registered as *prefix* routes, meaning they
+  are candidates for any path reaching their node.
+* Anything else that cannot be indexed (Host, custom routes...) is always a candidate.
+
+The tree only narrows down the candidates. The final decision is still made by
+`route.matches(scope)` and the candidates are returned in the original declaration order,
+which keeps the exact same semantics as the linear scan (first full match wins, partial
+matches produce the 405 and the redirect slashes behaviour).
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, SupportsIndex, Tuple, Union
+
+from starlette.convertors import PathConvertor
+from starlette.datastructures import URL
+from starlette.responses import RedirectResponse
+from starlette.routing import BaseRoute, Host, Match, Mount
+from starlette.routing import Route as StarletteRoute
+from starlette.routing import Router as StarletteRouter
+from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
+from starlette.types import Receive, Scope, Send
+
+PARAM_REGEX = re.compile(r"^{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}$")
+
+
+class RouteList(list):
+    """
+    A list of routes keeping track of its own mutations.
+
+    Every time the list changes, the `version` is increased allowing the router to know
+    when the tree needs to be rebuilt without comparing the routes one by one.
+    """
+
+    version: int = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self._changed()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        super().extend(values)
+        self._changed()
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        super().insert(index, value)
+        self._changed()
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        value = super().pop(index)
+        self._changed()
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, values: Iterable[Any]) -> "RouteList":  # type: ignore[override]
+        super().__iadd__(values)
+        self._changed()
+        return self
+
+    def __imul__(self, value: SupportsIndex) -> "RouteList":
+        super().__imul__(value)
+        self._changed()
+        return self
+
+
+class RouteNode:
+    """
+    A node of the routing tree. Represents one segment of a path.
+    """
+
+    __slots__ = ("children", "params", "routes", "prefix_routes")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "RouteNode"] = {}
+        self.params: Dict[str, Tuple[Pattern[str], "RouteNode"]] = {}
+        self.routes: List[int] = []
+        self.prefix_routes: List[int] = []
+
+    def get_static(self, segment: str) -> "RouteNode":
+        node = self.children.get(segment)
+        if node is None:
+            node = self.children[segment] = RouteNode()
+        return node
+
+    def get_param(self, regex: str) -> "RouteNode":
+        value = self.params.get(regex)
+        if value is None:
+            value = self.params[regex] = (re.compile(f"(?:{regex})$"), RouteNode())
+        return value[1]
+
+
+class RouteTree:
+    """
+    The prefix tree of a list of routes.
+    """
+
+    __slots__ = ("routes", "root", "fallback")
+
+    def __init__(self, routes: List[BaseRoute]) -> None:
+        self.routes = list(routes)
+        self.root = RouteNode()
+        self.fallback: List[int] = []
+
+        for index, route in enumerate(self.routes):
+            self.add(index, route)
+
+    def add(self, index: int, route: BaseRoute) -> None:
+        """
+        Indexes the route in the tree. Routes that cannot be indexed are added to the
+        fallback list making them candidates for every lookup.
+        """
+        if isinstance(route, Host) or not isinstance(
+            route, (StarletteRoute, StarletteWebSocketRoute, Mount)
+        ):
+            self.fallback.append(index)
+            return
+
+        path_format: Optional[str] = getattr(route, "path_format", None)
+        convertors: Dict[str, Any] = getattr(route, "param_convertors", None) or {}
+        if not path_format or not path_format.startswith("/"):
+            self.fallback.append(index)
+            return
+
+        node = self.root
+        for segment in path_format[1:].split("/"):
+            if "{" not in segment:
+                node = node.get_static(segment)
+                continue
+
+            param = PARAM_REGEX.match(segment)
+            convertor = convertors.get(param.group(1)) if param else None
+            if convertor is None or isinstance(convertor, PathConvertor):
+                # Everything from here on can be matched by the route.
+                node.prefix_routes.append(index)
+                return
+            node = node.get_param(convertor.regex)
+
+        node.routes.append(index)
+
+    def lookup(self, path: str) -> List[BaseRoute]:
+        """
+        Returns the routes that can possibly match the given path, by declaration order.
+        """
+        if not path.startswith("/"):
+            return self.routes
+
+        found: Set[int] = set(self.fallback)
+        self._search(self.root, path[1:].split("/"), 0, found)
+
+        if len(found) == len(self.routes):
+            return self.routes
+        return [self.routes[index] for index in sorted(found)]
+
+    def _search(self, node: RouteNode, segments: List[str], position: int, found: Set[int]) -> None:
+        if node.prefix_routes:
+            found.update(node.prefix_routes)
+
+        if position == len(segments):
+            found.update(node.routes)
+            return
+
+        segment = segments[position]
+        child = node.children.get(segment)
+        if child is not None:
+            self._search(child, segments, position + 1, found)
+
+        for regex, param_node in node.params.values():
+            if regex.match(segment):
+                self._search(param_node, segments, position + 1, found)
+
+
+class TreeRouter(StarletteRouter):
+    """
+    A Starlette router dispatching the requests using a `RouteTree` instead of trying every
+    registered route in sequence.
+
+    The tree is built lazily and rebuilt only when the list of routes changes.
+    """
+
+    _routes: RouteList
+    _route_tree: Optional[RouteTree] = None
+    _route_tree_version: int = -1
+
+    @property
+    def routes(self) -> RouteList:
+        return self._routes
+
+    @routes.setter
+    def routes(self, value: Union[List[BaseRoute], RouteList]) -> None:
+        self._routes = value if isinstance(value, RouteList) else RouteList(value or [])
+        self._route_tree = None
+
+    @property
+    def route_tree(self) -> RouteTree:
+        """
+        The tree of the current routes, rebuilt if the routes changed in the meantime.
+        """
+        tree = self._route_tree
+        if tree is None or self._route_tree_version != self._routes.version:
+            tree = self._route_tree = RouteTree(self._routes)
+            self._route_tree_version = self._routes.version
+        return tree
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] in ("http", "websocket", "lifespan")
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        if scope["type"] == "lifespan":
+            await self.lifespan(scope, receive, send)
+            return
+
+        tree = self.route_tree
+        partial = None
+
+        for route in tree.lookup(scope["path"]):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and self.redirect_slashes and scope["path"] != "/":
+            redirect_scope = dict(scope)
+            if scope["path"].endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+
+            for route in tree.lookup(redirect_scope["path"]):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        await self.default(scope, receive, send)
@@ -7,6 +7,7 @@ from starlette.types import Receive, Scope, Send
 from esmerald.utils.url import clean_path
 
 if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.cache.core import CacheType
     from esmerald.interceptors.types import Interceptor
     from esmerald.permissions.types import Permission
     from esmerald.routing.gateways import Gateway, WebSocketGateway
@@ -48,6 +49,7 @@ class APIView:
         "route_map",
         "operation_id",
         "methods",
+        "cache",
     )
 
     path: str
@@ -62,6 +64,7 @@ class APIView:
     tags: Optional[List[str]]
     deprecated: Optional[bool]
     include_in_schema: Optional[bool]
+    cache: Optional["CacheType"]
 
     def __init__(self, parent: Union["Gateway", "WebSocketGateway"]) -> None:
         for key in self.__slots__:
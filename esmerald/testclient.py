@@ -24,6 +24,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from typing_extensions import Literal
 
     from esmerald.config import (
+        CacheConfig,
         CORSConfig,
         CSRFConfig,
         OpenAPIConfig,
@@ -106,6 +107,7 @@ def create_client(
     on_startup: Optional[List["LifeSpanHandler"]] = None,
     cors_config: Optional["CORSConfig"] = None,
     session_config: Optional["SessionConfig"] = None,
+    cache_config: Optional["CacheConfig"] = None,
     scheduler_class: Optional["SchedulerType"] = None,
     scheduler_tasks: Optional[Dict[str, str]] = None,
     scheduler_configurations: Optional[Dict[str, Union[str, Dict[str, str]]]] = None,
@@ -158,6 +160,7 @@ def create_client(
             static_files_config=static_files_config,
             template_config=template_config,
             session_config=session_config,
+            cache_config=cache_config,
             lifespan=lifespan,
             redirect_slashes=redirect_slashes,
             enable_openapi=enable_openapi,
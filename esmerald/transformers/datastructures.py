@@ -1,6 +1,6 @@
 from inspect import Parameter as InspectParameter
 from inspect import Signature
-from typing import Any, ClassVar, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Set, Union
 
 from orjson import loads
 from pydantic import ValidationError
@@ -13,15 +13,24 @@ from esmerald.transformers.utils import get_connection_info
 from esmerald.utils.helpers import is_optional_union
 from esmerald.websockets import WebSocket
 
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.transformers.validation import FastPathValidator
+
 
 class EsmeraldSignature(ArbitraryBaseModel):
     dependency_names: ClassVar[Set[str]]
     return_annotation: ClassVar[Any]
+    fast_validator: ClassVar[Optional["FastPathValidator"]] = None
 
     @classmethod
     def parse_values_for_connection(
         cls, connection: Union[Request, WebSocket], **kwargs: Any
     ) -> Any:
+        if cls.fast_validator is not None:
+            values = cls.fast_validator.validate(kwargs)
+            if values is not None:
+                return values
+
         try:
             signature = cls(**kwargs)
             values = {}
@@ -1,9 +1,26 @@
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import anyio
+from anyio.abc import TaskGroup
+from pydantic import BaseModel, ValidationError
 from pydantic.fields import FieldInfo
 
+from esmerald.datastructures.form import DEFAULT_SPOOL_MAX_SIZE, FormStream
 from esmerald.enums import EncodingType, ParamType
-from esmerald.exceptions import ImproperlyConfigured
+from esmerald.exceptions import ImproperlyConfigured, PayloadTooLarge, ValidationErrorException
 from esmerald.parsers import ArbitraryExtraBaseModel, parse_form_data
 from esmerald.requests import Request
 from esmerald.transformers.datastructures import EsmeraldSignature as SignatureModel
@@ -11,11 +28,11 @@ from esmerald.transformers.utils import (
     Dependency,
     ParamSetting,
     create_parameter_setting,
-    get_request_params,
     get_signature,
     merge_sets,
 )
 from esmerald.utils.constants import DATA, RESERVED_KWARGS
+from esmerald.utils.helpers import is_async_callable, is_class_and_subclass
 from esmerald.utils.pydantic.schema import is_field_optional
 
 if TYPE_CHECKING:
@@ -26,6 +43,15 @@ if TYPE_CHECKING:
 MEDIA_TYPES = [EncodingType.MULTI_PART, EncodingType.URL_ENCODED]
 MappingUnion = Mapping[Union[int, str], Any]
 
+# (field_name, field_alias, default_value, is_required)
+ExtractionStep = Tuple[str, str, Any, bool]
+# (connection attribute, steps)
+ExtractionPlan = Tuple[Tuple[str, Tuple[ExtractionStep, ...]], ...]
+# (sync dependencies, async dependencies) of each level of the dependency graph
+DependencyLevel = Tuple[Tuple[Dependency, ...], Tuple[Dependency, ...]]
+
+_missing = object()
+
 
 class TransformerModel(ArbitraryExtraBaseModel):
     def __init__(
@@ -39,6 +65,7 @@ class TransformerModel(ArbitraryExtraBaseModel):
         reserved_kwargs: Set[str],
         query_param_names: Set[ParamSetting],
         is_optional: bool,
+        body_model: Optional[Type[BaseModel]] = None,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
@@ -60,6 +87,64 @@ class TransformerModel(ArbitraryExtraBaseModel):
             or reserved_kwargs
         )
         self.is_optional = is_optional
+        self.body_model = body_model
+        self.extraction_plan = self.compile_extraction_plan()
+        self.dependency_levels = self.compile_dependency_graph()
+
+    def compile_extraction_plan(self) -> ExtractionPlan:
+        """
+        Flattens the parameter settings into a plan containing only the sources of the
+        connection the handler needs (query, path, headers and cookies), so the extraction
+        done on every request does not touch (and parse) the sources that are not declared.
+        """
+        plan = []
+        for source, params in (
+            ("query_params", self.query_params),
+            ("path_params", self.path_params),
+            ("headers", self.headers),
+            ("cookies", self.cookies),
+        ):
+            if not params:
+                continue
+            steps = tuple(
+                dict.fromkeys(
+                    (param.field_name, param.field_alias, param.default_value, param.is_required)
+                    for param in params
+                )
+            )
+            plan.append((source, steps))
+        return tuple(plan)
+
+    def compile_dependency_graph(self) -> Tuple[DependencyLevel, ...]:
+        """
+        Flattens the dependency trees of the handler into a graph sorted topologically.
+
+        Each dependency (identified by its key) appears only once, in the first level after
+        all the dependencies it needs. The dependencies of the same level do not depend on
+        each other and can be resolved concurrently.
+        """
+        levels: Dict[str, int] = {}
+        nodes: Dict[str, Dependency] = {}
+
+        def visit(dependency: Dependency) -> int:
+            if dependency.key not in levels:
+                nodes[dependency.key] = dependency
+                levels[dependency.key] = (
+                    max((visit(child) + 1 for child in dependency.dependencies), default=0)
+                )
+            return levels[dependency.key]
+
+        for dependency in self.dependencies:
+            visit(dependency)
+
+        graph: List[Tuple[List[Dependency], List[Dependency]]] = [
+            ([], []) for _ in range(max(levels.values(), default=-1) + 1)
+        ]
+        for key, level in levels.items():
+            dependency = nodes[key]
+            is_async = is_async_callable(dependency.inject.dependency)
+            graph[level][1 if is_async else 0].append(dependency)
+        return tuple((tuple(sync), tuple(_async)) for sync, _async in graph)
 
     def get_cookie_params(self) -> Set[ParamSetting]:
         return self.cookies
@@ -202,7 +287,18 @@ class TransformerModel(ArbitraryExtraBaseModel):
         if DATA in reserved_kwargs:
             is_optional = is_field_optional(signature_model.model_fields["data"])
 
+        body_model = None
+        if (
+            data_field
+            and not form_data
+            and not data_field.metadata
+            and is_class_and_subclass(data_field.annotation, BaseModel)
+            and not cls.dependencies_require_data(_dependencies)
+        ):
+            body_model = data_field.annotation
+
         return TransformerModel(
+            body_model=body_model,
             form_data=form_data,
             dependencies=_dependencies,
             path_params=path_params,
@@ -214,6 +310,18 @@ class TransformerModel(ArbitraryExtraBaseModel):
             is_optional=is_optional,
         )
 
+    @classmethod
+    def dependencies_require_data(cls, dependencies: Iterable[Dependency]) -> bool:
+        """
+        Checks if any of the dependencies, or of their own dependencies, requires the `data`.
+        """
+        for dependency in dependencies:
+            if DATA in get_signature(dependency.inject).model_fields:
+                return True
+            if cls.dependencies_require_data(dependency.dependencies):
+                return True
+        return False
+
     @classmethod
     def update_parameters(
         cls,
@@ -245,71 +353,52 @@ class TransformerModel(ArbitraryExtraBaseModel):
         return path_params, query_params, cookies, headers, reserved_kwargs
 
     def to_kwargs(self, connection: Union["WebSocket", "Request"]) -> Any:
-        connection_params = {}
-        for key, value in connection.query_params.items():
-            if key not in self.query_param_names and len(value) == 1:
-                value = value[0]
-                connection_params[key] = value
-
-        query_params = get_request_params(
-            params=cast("MappingUnion", connection.query_params),
-            expected=self.query_params,
-            url=connection.url,
-        )
-        path_params = get_request_params(
-            params=cast("MappingUnion", connection.path_params),
-            expected=self.path_params,
-            url=connection.url,
-        )
-        headers = get_request_params(
-            params=cast("MappingUnion", connection.headers),
-            expected=self.headers,
-            url=connection.url,
-        )
-        cookies = get_request_params(
-            params=cast("MappingUnion", connection.cookies),
-            expected=self.cookies,
-            url=connection.url,
-        )
-
-        if not self.reserved_kwargs:
-            return {**query_params, **path_params, **headers, **cookies}
-
-        return self.handle_reserved_kwargs(
-            connection=connection,
-            connection_params=connection_params,
-            path_params=path_params,
-            query_params=query_params,
-            headers=headers,
-            cookies=cookies,
-        )
+        kwargs: Any = {}
+        if self.reserved_kwargs:
+            self.handle_reserved_kwargs(connection=connection, kwargs=kwargs)
+
+        for source, steps in self.extraction_plan:
+            params = getattr(connection, source)
+            missing = None
+            for field_name, field_alias, default_value, is_required in steps:
+                value = params.get(field_alias, _missing)
+                if value is _missing:
+                    if is_required:
+                        if missing is None:
+                            missing = []
+                        missing.append(field_alias)
+                        continue
+                    value = default_value
+                kwargs[field_name] = value
+
+            if missing:
+                raise ValidationErrorException(
+                    f"Missing required parameter(s) {', '.join(missing)} for url {connection.url}."
+                )
+        return kwargs
 
     def handle_reserved_kwargs(
-        self,
-        connection: Union["WebSocket", "Request"],
-        connection_params: Any,
-        path_params: Any,
-        query_params: Any,
-        headers: Any,
-        cookies: Any,
-    ) -> Any:
-        reserved_kwargs: Any = {}
+        self, connection: Union["WebSocket", "Request"], kwargs: Dict[str, Any]
+    ) -> None:
         if "data" in self.reserved_kwargs:
-            reserved_kwargs["data"] = self.get_request_data(request=cast("Request", connection))
+            kwargs["data"] = self.get_request_data(request=cast("Request", connection))
         if "request" in self.reserved_kwargs:
-            reserved_kwargs["request"] = connection
+            kwargs["request"] = connection
         if "socket" in self.reserved_kwargs:
-            reserved_kwargs["socket"] = connection
+            kwargs["socket"] = connection
         if "headers" in self.reserved_kwargs:
-            reserved_kwargs["headers"] = connection.headers
+            kwargs["headers"] = connection.headers
         if "cookies" in self.reserved_kwargs:
-            reserved_kwargs["cookies"] = connection.cookies
+            kwargs["cookies"] = connection.cookies
         if "query" in self.reserved_kwargs:
-            reserved_kwargs["query"] = connection_params
+            connection_params = {}
+            for key, value in connection.query_params.items():
+                if key not in self.query_param_names and len(value) == 1:
+                    value = value[0]
+                    connection_params[key] = value
+            kwargs["query"] = connection_params
         if "state" in self.reserved_kwargs:
-            reserved_kwargs["state"] = connection.app.state.copy()  # pragma: no cover
-
-        return {**reserved_kwargs, **path_params, **query_params, **headers, **cookies}
+            kwargs["state"] = connection.app.state.copy()  # pragma: no cover
 
     @classmethod
     def validate_data(
@@ -375,24 +464,104 @@ class TransformerModel(ArbitraryExtraBaseModel):
     async def get_request_data(self, request: "Request") -> Any:
         # Fast exit principle
         if not self.form_data:
+            if self.body_model is not None:
+                return await self.get_body_model(request)
             return await request.json()
 
         media_type, field = self.form_data
-        form_data = await request.form()
+        if getattr(field, "stream", False):
+            return FormStream(
+                request,
+                max_parts=field.max_parts,
+                max_part_size=field.max_part_size,
+                spool_max_size=field.spool_max_size or DEFAULT_SPOOL_MAX_SIZE,
+                json_fields=field.json_fields,
+            )
+
+        max_parts = getattr(field, "max_parts", None)
+        if max_parts is not None:
+            form_data = await request.form(max_files=max_parts, max_fields=max_parts)
+            if len(form_data.multi_items()) > max_parts:
+                await form_data.close()
+                raise PayloadTooLarge(f"Too many parts. Maximum number of parts is {max_parts}.")
+        else:
+            form_data = await request.form()
         parsed_form = parse_form_data(media_type, form_data, field)
         return parsed_form if parsed_form or not self.is_optional else None
 
-    async def get_dependencies(
+    async def get_body_model(self, request: "Request") -> Any:
+        """
+        Validates the JSON body straight from the raw bytes in a single pass, without
+        building the intermediate python objects.
+
+        When the body is not valid, the parsed body is returned instead, leaving the
+        signature model raise the same errors as for any other body.
+        """
+        body = await request.body()
+        try:
+            return self.body_model.model_validate_json(body)  # type: ignore
+        except ValidationError:
+            return await request.json()
+
+    async def resolve_dependencies(
+        self, connection: Union["WebSocket", "Request"], kwargs: Dict[str, Any]
+    ) -> None:
+        """
+        Resolves all the dependencies of the handler, level by level, adding the values to
+        the `kwargs`.
+
+        The `kwargs` act as the cache of the request, meaning each dependency is resolved at
+        most once even when it is required by more than one dependency. The async dependencies
+        of the same level are awaited concurrently.
+        """
+        for sync_dependencies, async_dependencies in self.dependency_levels:
+            for dependency in sync_dependencies:
+                kwargs[dependency.key] = await self.resolve_dependency(
+                    dependency=dependency, connection=connection, kwargs=kwargs
+                )
+
+            if len(async_dependencies) == 1:
+                dependency = async_dependencies[0]
+                kwargs[dependency.key] = await self.resolve_dependency(
+                    dependency=dependency, connection=connection, kwargs=kwargs
+                )
+            elif async_dependencies:
+                await self.resolve_concurrently(async_dependencies, connection, kwargs)
+
+    async def resolve_concurrently(
         self,
-        dependency: "Dependency",
+        dependencies: Tuple[Dependency, ...],
         connection: Union["WebSocket", "Request"],
-        **kwargs: Any,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        values: Dict[str, Any] = {}
+        errors: List[BaseException] = []
+
+        async def resolve(dependency: Dependency, task_group: TaskGroup) -> None:
+            try:
+                values[dependency.key] = await self.resolve_dependency(
+                    dependency=dependency, connection=connection, kwargs=kwargs
+                )
+            except Exception as e:
+                # Raised outside of the task group to keep the original exception.
+                errors.append(e)
+                task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for dependency in dependencies:
+                task_group.start_soon(resolve, dependency, task_group)
+
+        if errors:
+            raise errors[0]
+        kwargs.update(values)
+
+    async def resolve_dependency(
+        self,
+        dependency: Dependency,
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
     ) -> Any:
         signature_model = get_signature(dependency.inject)
-        for _dependency in dependency.dependencies:
-            kwargs[_dependency.key] = await self.get_dependencies(
-                dependency=_dependency, connection=connection, **kwargs
-            )
         dependency_kwargs = signature_model.parse_values_for_connection(
             connection=connection, **kwargs
         )
@@ -1,5 +1,5 @@
 from inspect import Signature as InspectSignature
-from typing import TYPE_CHECKING, Any, Dict, Generator, Set, Type
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional, Set, Type
 
 from pydantic import create_model
 
@@ -8,6 +8,7 @@ from esmerald.parsers import ArbitraryExtraBaseModel
 from esmerald.transformers.constants import CLASS_SPECIAL_WORDS, VALIDATION_NAMES
 from esmerald.transformers.datastructures import EsmeraldSignature, Parameter
 from esmerald.transformers.utils import get_field_definition_from_param
+from esmerald.transformers.validation import FastPathValidator
 from esmerald.typing import Undefined
 from esmerald.utils.dependency import is_dependency_field, should_skip_dependency_validation
 
@@ -19,10 +20,16 @@ object_setattr = object.__setattr__
 
 
 class SignatureFactory(ArbitraryExtraBaseModel):
-    def __init__(self, fn: "AnyCallable", dependency_names: Set[str], **kwargs: Any) -> None:
+    def __init__(
+        self,
+        fn: "AnyCallable",
+        dependency_names: Set[str],
+        signature: Optional[InspectSignature] = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
         self.fn = fn
-        self.signature = InspectSignature.from_callable(self.fn)
+        self.signature = signature or InspectSignature.from_callable(self.fn)
         self.fn_name = fn.__name__ if hasattr(fn, "__name__") else "anonymous"
         self.defaults: Dict[str, Any] = {}
         self.dependency_names = dependency_names
@@ -79,6 +86,7 @@ class SignatureFactory(ArbitraryExtraBaseModel):
             )
             model.return_annotation = self.signature.return_annotation
             model.dependency_names = self.dependency_names
+            model.fast_validator = FastPathValidator.from_signature(model)
             return model
         except TypeError as e:
             raise ImproperlyConfigured(  # pragma: no cover
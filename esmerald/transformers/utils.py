@@ -4,7 +4,7 @@ from pydantic.fields import FieldInfo
 from starlette.datastructures import URL
 
 from esmerald.enums import ParamType, ScopeType
-from esmerald.exceptions import ImproperlyConfigured, ValidationErrorException
+from esmerald.exceptions import ImproperlyConfigured
 from esmerald.params import Cookie, Header, Path, Query
 from esmerald.parsers import ArbitraryExtraBaseModel, HashableBaseModel
 from esmerald.requests import Request
@@ -98,24 +98,6 @@ def create_parameter_setting(
     return param_settings
 
 
-def get_request_params(params: Any, expected: Set[ParamSetting], url: URL) -> Any:
-    """
-    Gather the parameters from the request.
-    """
-    _params = []
-    for param in expected:
-        if param.is_required and param.field_alias not in params:
-            _params.append(param.field_alias)
-    if _params:
-        raise ValidationErrorException(
-            f"Missing required parameter(s) {', '.join(_params)} for url {url}."
-        )
-    values = {
-        param.field_name: params.get(param.field_alias, param.default_value) for param in expected
-    }
-    return values
-
-
 def get_connection_info(connection: "ConnectionType") -> Tuple[str, "URL"]:
     """
     Extacts the information from the ConnectionType.
@@ -0,0 +1,101 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, get_args, get_origin
+
+from esmerald.utils.helpers import UNION_TYPES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.transformers.datastructures import EsmeraldSignature
+
+NoneType = type(None)
+PRIMITIVE_TYPES = (str, int, float, bool, UUID, date, datetime, time, Decimal)
+
+# (field name, type adapter or None when the value is passed through, field info)
+FieldValidator = Tuple[str, Optional[TypeAdapter], FieldInfo]
+
+
+def is_primitive_annotation(annotation: Any) -> bool:
+    """
+    Checks if the annotation is a primitive type, an Enum or an Optional of those.
+    """
+    if annotation in PRIMITIVE_TYPES:
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return True
+
+    if get_origin(annotation) in UNION_TYPES:
+        return all(
+            arg is NoneType or is_primitive_annotation(arg) for arg in get_args(annotation)
+        )
+    return False
+
+
+class FastPathValidator:
+    """
+    Validates the values of a signature model made only of primitive parameters without
+    building the pydantic model.
+
+    Each field is validated with a precompiled `TypeAdapter` holding the same constraints
+    declared in the field. When the values are not valid (or a required value is missing),
+    the validator gives up and the full model is used instead, making sure the errors keep
+    exactly the same shape.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Tuple[FieldValidator, ...]) -> None:
+        self.fields = fields
+
+    @classmethod
+    def from_signature(
+        cls, signature_model: Type["EsmeraldSignature"]
+    ) -> Optional["FastPathValidator"]:
+        """
+        Creates the validator for the signature model or returns None if any of the fields
+        requires the full model to be validated.
+        """
+        fields = []
+        for name, field in signature_model.model_fields.items():
+            if field.validation_alias is not None or field.alias not in (None, name):
+                return None
+
+            if field.annotation is Any:
+                fields.append((name, None, field))
+                continue
+
+            if not is_primitive_annotation(field.annotation):
+                return None
+
+            annotation = field.annotation
+            if field.metadata:
+                annotation = Annotated[(annotation, *field.metadata)]  # type: ignore
+            fields.append((name, TypeAdapter(annotation), field))
+        return cls(tuple(fields))
+
+    def validate(self, values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the validated values or None if the full model must be used.
+        """
+        validated = {}
+        try:
+            for name, adapter, field in self.fields:
+                if name in values:
+                    value = values[name]
+                elif field.is_required():
+                    return None
+                else:
+                    value = field.get_default(call_default_factory=True)
+                    if not field.validate_default:
+                        validated[name] = value
+                        continue
+
+                validated[name] = value if adapter is None else adapter.validate_python(value)
+        except ValidationError:
+            return None
+        return validated
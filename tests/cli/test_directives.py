@@ -9,7 +9,7 @@ from tests.cli.utils import run_cmd
 app = Esmerald(routes=[])
 
 
-FOUND_DIRECTIVES = ["createapp", "createproject", "runserver", "show_urls"]
+FOUND_DIRECTIVES = ["compile", "createapp", "createproject", "runserver", "show_urls"]
 
 
 @pytest.fixture(scope="module")
@@ -0,0 +1,134 @@
+from typing import Any, Dict
+
+import pytest
+
+from esmerald import Gateway, ImproperlyConfigured, post, status
+from esmerald.datastructures import FormStream
+from esmerald.params import File
+from esmerald.testclient import create_client
+
+
+@post("/stream", status_code=status.HTTP_200_OK)
+async def stream_files(
+    data: FormStream = File(stream=True, spool_max_size=8, json_fields=["meta"])
+) -> Dict[str, Any]:
+    files = {}
+    async for upload in data:
+        files[upload.filename] = (await upload.read()).decode()
+    return {"files": files, "fields": data.fields}
+
+
+@post("/limits", status_code=status.HTTP_200_OK)
+async def limited_files(
+    data: FormStream = File(stream=True, max_parts=2, max_part_size=16)
+) -> Dict[str, Any]:
+    return {"files": [upload.filename async for upload in data]}
+
+
+@post("/form", status_code=status.HTTP_200_OK)
+async def form_fields(data: Dict[str, Any] = File(json_fields=["meta"])) -> Dict[str, Any]:
+    return {"meta": data["meta"], "count": data["count"]}
+
+
+@post("/form-limits", status_code=status.HTTP_200_OK)
+async def limited_form(data: Dict[str, Any] = File(max_parts=2)) -> Dict[str, Any]:
+    return {"count": len(data)}
+
+
+def test_stream_files(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=stream_files)]) as client:
+        response = client.post(
+            "/stream",
+            files=[
+                ("file", ("first.txt", b"a content bigger than the spool")),
+                ("file", ("second.txt", b"second")),
+                ("empty", ("empty.txt", b"")),
+            ],
+            data={"name": "esmerald", "tag": ["one", "two"], "meta": '{"size": 1}'},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.json() == {
+            "files": {
+                "first.txt": "a content bigger than the spool",
+                "second.txt": "second",
+                "empty.txt": "",
+            },
+            "fields": {"name": "esmerald", "tag": ["one", "two"], "meta": {"size": 1}},
+        }
+
+
+@pytest.mark.parametrize(
+    "files,status_code",
+    [
+        ([("file", ("first.txt", b"small"))], 200),
+        ([("file", ("first.txt", b"a content bigger than the limit"))], 413),
+        ([("file", (f"{index}.txt", b"small")) for index in range(3)], 413),
+    ],
+)
+def test_stream_limits(test_client_factory, files, status_code) -> None:
+    with create_client(routes=[Gateway(handler=limited_files)]) as client:
+        response = client.post("/limits", files=files)
+
+        assert response.status_code == status_code, response.text
+
+
+@pytest.mark.parametrize(
+    "files,data,status_code",
+    [
+        ([("file", ("first.txt", b"small"))], {"name": "esmerald"}, 200),
+        ([("file", (f"{index}.txt", b"small")) for index in range(2)], {"name": "esmerald"}, 413),
+    ],
+)
+def test_form_max_parts_counts_files_and_fields(
+    test_client_factory, files, data, status_code
+) -> None:
+    with create_client(routes=[Gateway(handler=limited_form)]) as client:
+        response = client.post("/form-limits", files=files, data=data)
+
+        assert response.status_code == status_code, response.text
+
+
+@pytest.mark.parametrize("limit", ["max_part_size", "spool_max_size"])
+def test_size_limits_require_stream(limit) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        File(**{limit: 1024})
+
+
+def test_stream_requires_multipart(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=stream_files)]) as client:
+        response = client.post("/stream", json={"name": "esmerald"})
+
+        assert response.status_code == 400, response.text
+
+
+def test_stream_invalid_json_field(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=stream_files)]) as client:
+        response = client.post(
+            "/stream", files=[("file", ("first.txt", b"data"))], data={"meta": "{invalid"}
+        )
+
+        assert response.status_code == 400, response.text
+
+
+def test_json_fields_are_opt_in(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=form_fields)]) as client:
+        response = client.post(
+            "/form",
+            files=[("file", ("first.txt", b"data"))],
+            data={"meta": '{"size": 1}', "count": "1"},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.json()["meta"] == {"size": 1}
+        assert response.json()["count"] == "1"
+
+
+def test_stream_openapi(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=stream_files)], enable_openapi=True) as client:
+        response = client.get("/openapi.json")
+
+        assert response.status_code == 200, response.text
+        assert "multipart/form-data" in response.json()["paths"]["/stream"]["post"]["requestBody"][
+            "content"
+        ]
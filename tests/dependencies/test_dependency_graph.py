@@ -0,0 +1,134 @@
+import anyio
+import pytest
+
+from esmerald import Gateway, Inject, get
+from esmerald.exceptions import NotAuthorized
+from esmerald.testclient import create_client
+
+
+def test_dependency_graph_levels() -> None:
+    def config() -> dict:
+        return {}
+
+    async def database(config: dict) -> str:
+        return "db"
+
+    async def cache(config: dict) -> str:
+        return "cache"
+
+    async def service(database: str, cache: str) -> str:
+        return database + cache
+
+    @get(
+        "/",
+        dependencies={
+            "config": Inject(config),
+            "database": Inject(database),
+            "cache": Inject(cache),
+            "service": Inject(service),
+        },
+    )
+    async def handler(service: str, config: dict) -> str:
+        return service
+
+    Gateway(handler=handler)
+    handler.create_signature_model()
+    levels = handler.transformer.dependency_levels
+
+    assert [
+        (
+            sorted(dependency.key for dependency in sync),
+            sorted(dependency.key for dependency in _async),
+        )
+        for sync, _async in levels
+    ] == [(["config"], []), ([], ["cache", "database"]), ([], ["service"])]
+
+
+def test_shared_dependency_resolved_once_per_request(test_client_factory) -> None:
+    calls = []
+
+    async def session() -> int:
+        calls.append(1)
+        return len(calls)
+
+    async def users(session: int) -> int:
+        return session
+
+    async def items(session: int) -> int:
+        return session
+
+    @get(
+        "/",
+        dependencies={
+            "session": Inject(session),
+            "users": Inject(users),
+            "items": Inject(items),
+        },
+    )
+    async def handler(users: int, items: int) -> dict:
+        return {"users": users, "items": items}
+
+    with create_client(routes=[Gateway(handler=handler)]) as client:
+        assert client.get("/").json() == {"users": 1, "items": 1}
+        assert client.get("/").json() == {"users": 2, "items": 2}
+
+    assert len(calls) == 2
+
+
+def test_async_dependencies_resolved_concurrently(test_client_factory) -> None:
+    resolved = []
+
+    async def first() -> str:
+        with anyio.fail_after(1):
+            while not resolved:
+                await anyio.sleep(0)
+        return "first"
+
+    async def second() -> str:
+        resolved.append("second")
+        return "second"
+
+    @get("/", dependencies={"first": Inject(first), "second": Inject(second)})
+    async def handler(first: str, second: str) -> str:
+        return first + second
+
+    with create_client(routes=[Gateway(handler=handler)]) as client:
+        response = client.get("/")
+
+        assert response.json() == "firstsecond"
+
+
+def test_concurrent_dependency_error(test_client_factory) -> None:
+    async def allowed() -> bool:
+        await anyio.sleep(0)
+        return True
+
+    async def denied() -> bool:
+        raise NotAuthorized()
+
+    @get("/", dependencies={"allowed": Inject(allowed), "denied": Inject(denied)})
+    async def handler(allowed: bool, denied: bool) -> bool:
+        return allowed  # pragma: no cover
+
+    with create_client(routes=[Gateway(handler=handler)]) as client:
+        response = client.get("/")
+
+        assert response.status_code == 401
+
+
+@pytest.mark.parametrize("value", ["1", "2"])
+def test_dependencies_with_query_params(test_client_factory, value) -> None:
+    async def number(q: int) -> int:
+        return q
+
+    async def double(number: int) -> int:
+        return number * 2
+
+    @get("/", dependencies={"number": Inject(number), "double": Inject(double)})
+    async def handler(double: int) -> int:
+        return double
+
+    with create_client(routes=[Gateway(handler=handler)]) as client:
+        response = client.get("/", params={"q": value})
+
+        assert response.json() == int(value) * 2
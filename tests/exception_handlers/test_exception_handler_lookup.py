@@ -0,0 +1,107 @@
+from starlette.responses import JSONResponse as StarletteJSONResponse
+from starlette.responses import Response as StarletteResponse
+
+from esmerald import Gateway, Request, get
+from esmerald.exception_handlers import ENCODED_ERROR_BODIES
+from esmerald.exceptions import NotAuthorized, NotFound, PermissionDenied
+from esmerald.middleware._exception_handlers import ExceptionHandlerLookup
+from esmerald.middleware.exceptions import EsmeraldAPIExceptionMiddleware
+from esmerald.testclient import create_client
+
+
+class BaseError(Exception):
+    ...
+
+
+class ChildError(BaseError):
+    ...
+
+
+def base_error_handler(request: Request, exc: Exception) -> StarletteResponse:
+    return StarletteJSONResponse({"handled": exc.__class__.__name__}, status_code=418)
+
+
+def test_lookup_resolves_the_mro_once() -> None:
+    handlers = {BaseError: base_error_handler}
+    lookup = ExceptionHandlerLookup(handlers)
+
+    assert lookup(ChildError()) is base_error_handler
+    assert lookup(ValueError()) is None
+    assert lookup.cache == {ChildError: base_error_handler, ValueError: None}
+
+    handlers[ValueError] = base_error_handler
+
+    assert lookup(ValueError()) is None
+
+    lookup.clear()
+
+    assert lookup(ValueError()) is base_error_handler
+
+
+def test_get_exception_handler_with_subclasses() -> None:
+    middleware = EsmeraldAPIExceptionMiddleware(
+        app=None, debug=False, exception_handlers={BaseError: base_error_handler}
+    )
+
+    assert middleware.get_exception_handler(middleware.exception_handlers, ChildError())
+    assert middleware.get_exception_handler({}, ChildError()) is None
+    assert middleware.get_exception_handler({KeyError: 1}, ChildError()) is None
+
+
+def test_exception_handler_of_a_parent_class(test_client_factory) -> None:
+    @get("/child")
+    async def child() -> None:
+        raise ChildError()
+
+    with create_client(
+        routes=[Gateway(handler=child)],
+        exception_handlers={BaseError: base_error_handler},
+    ) as client:
+        for _ in range(2):
+            response = client.get("/child")
+
+            assert response.status_code == 418
+            assert response.json() == {"handled": "ChildError"}
+
+
+def test_pre_encoded_error_bodies(test_client_factory) -> None:
+    @get("/denied")
+    async def denied() -> None:
+        raise PermissionDenied()
+
+    @get("/unauthorized")
+    async def unauthorized() -> None:
+        raise NotAuthorized(headers={"www-authenticate": "Bearer"})
+
+    @get("/custom")
+    async def custom() -> None:
+        raise NotFound(detail="No such item.")
+
+    assert ENCODED_ERROR_BODIES[(404, "Not Found")] == b'{"detail":"Not Found"}'
+
+    with create_client(
+        routes=[Gateway(handler=denied), Gateway(handler=unauthorized), Gateway(handler=custom)]
+    ) as client:
+        response = client.get("/denied")
+
+        assert response.status_code == 403
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"detail": PermissionDenied.detail}
+
+        response = client.get("/unauthorized")
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+        assert response.json() == {"detail": NotAuthorized.detail}
+
+        response = client.get("/missing")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "The resource cannot be found."}
+
+        response = client.post("/denied")
+
+        assert response.status_code == 405
+        assert response.json()["detail"]
+
+        assert client.get("/custom").json() == {"detail": "No such item."}
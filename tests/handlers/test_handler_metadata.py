@@ -0,0 +1,72 @@
+from inspect import Parameter
+from unittest.mock import patch
+
+from esmerald import Gateway, Request, get, websocket
+from esmerald.routing.base import HandlerMetadata
+from esmerald.websockets import WebSocket
+
+
+@get("/items/{item_id}")
+async def read_item(request: Request, item_id: int, q: str = None) -> str:
+    return q
+
+
+def sync_item(item_id: int) -> str:
+    return str(item_id)
+
+
+def test_metadata_from_fn() -> None:
+    metadata = read_item.metadata
+
+    assert isinstance(metadata, HandlerMetadata)
+    assert metadata.return_annotation is str
+    assert metadata.is_async is True
+    assert metadata.parameter_kinds == {
+        "request": Parameter.POSITIONAL_OR_KEYWORD,
+        "item_id": Parameter.POSITIONAL_OR_KEYWORD,
+        "q": Parameter.POSITIONAL_OR_KEYWORD,
+    }
+    assert metadata.path_parameters == frozenset({"item_id"})
+    assert read_item.signature is metadata.signature
+
+
+def test_metadata_computed_once() -> None:
+    with patch.object(HandlerMetadata, "from_callable") as from_callable:
+        for _ in range(3):
+            read_item.signature
+            read_item.metadata.return_annotation
+
+        from_callable.assert_not_called()
+
+
+def test_metadata_invalidated_when_fn_changes() -> None:
+    handler = get("/items/{item_id}")(sync_item)
+    metadata = handler.metadata
+
+    assert metadata.is_async is False
+
+    handler.fn = read_item.fn
+
+    assert handler.metadata is not metadata
+    assert handler.metadata.is_async is True
+    assert handler.metadata.return_annotation is str
+
+
+def test_path_parameters_follow_the_gateway() -> None:
+    @get("/{name}")
+    async def home(name: str, item_id: int) -> str:
+        return name
+
+    Gateway("/items/{item_id}", handler=home)
+
+    assert home.metadata.path_parameters == frozenset({"item_id", "name"})
+    assert home.path_parameters == {"item_id", "name"}
+
+
+def test_websocket_metadata() -> None:
+    @websocket("/ws")
+    async def socket_handler(socket: WebSocket) -> None:
+        """"""
+
+    assert socket_handler.metadata.is_async is True
+    assert socket_handler.metadata.return_annotation is None
@@ -0,0 +1,164 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import anyio
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Gateway, Request, get, post
+from esmerald.concurrency import ProcessPool, get_process_pool_statistics
+from esmerald.conf import settings
+from esmerald.exceptions import ImproperlyConfigured, NotFound, ServiceUnavailable
+from esmerald.testclient import create_client
+
+
+class Invoice(BaseModel):
+    number: int
+    total: float
+
+
+@get("/render/{number:int}", executor="process", process_pool="render", max_concurrency=2)
+def render(number: int) -> Dict[str, Any]:
+    return {"number": number, "pid": os.getpid()}
+
+
+@post("/invoices", executor="process", process_pool="render", max_concurrency=2)
+def create_invoice(data: Invoice) -> Invoice:
+    if data.number < 0:
+        raise NotFound(detail="No such invoice.")
+    return Invoice(number=data.number, total=round(data.total * 1.23, 2))
+
+
+@get("/slow", executor="process", process_pool="busy", max_concurrency=1)
+def slow() -> Dict[str, bool]:
+    time.sleep(0.5)
+    return {"slow": True}
+
+
+@get("/crash/{code:int}", executor="process", process_pool="crash", max_concurrency=1)
+def crash(code: int) -> Dict[str, int]:
+    if code:
+        os._exit(code)
+    return {"pid": os.getpid()}
+
+
+def test_process_executor() -> None:
+    completed = sum(stats.completed for stats in get_process_pool_statistics("render"))
+
+    with create_client(
+        routes=[Gateway(handler=render), Gateway(handler=create_invoice)]
+    ) as client:
+        statistics = get_process_pool_statistics("render")[0]
+
+        assert statistics.started
+        assert statistics.max_workers == 2
+
+        response = client.get("/render/1")
+
+        assert response.status_code == 200
+        assert response.json()["number"] == 1
+        assert response.json()["pid"] != os.getpid()
+
+        response = client.post("/invoices", json={"number": 1, "total": 100})
+
+        assert response.json() == {"number": 1, "total": 123.0}
+
+        response = client.post("/invoices", json={"number": -1, "total": 100})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No such invoice."
+
+        assert get_process_pool_statistics("render")[0].completed == completed + 3
+
+    assert not get_process_pool_statistics("render")[0].started
+
+
+def test_process_pool_sheds_the_load(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "process_pool_max_queue_size", 0)
+
+    with create_client(routes=[Gateway(handler=slow)]) as client:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(executor.map(lambda _: client.get("/slow"), range(3)))
+
+    status_codes = sorted(response.status_code for response in responses)
+
+    assert status_codes[0] == 200
+    assert 503 in status_codes
+
+    statistics = get_process_pool_statistics("busy")[0]
+
+    assert statistics.max_queue_size == 0
+    assert statistics.rejected == status_codes.count(503)
+    assert statistics.running == statistics.queued == 0
+
+
+def test_process_pool_recovers_from_a_dead_worker() -> None:
+    with create_client(routes=[Gateway(handler=crash)]) as client:
+        response = client.get("/crash/1")
+
+        assert response.status_code == 503
+
+        statistics = get_process_pool_statistics("crash")[0]
+
+        assert not statistics.started
+        assert statistics.running == 0
+
+        response = client.get("/crash/0")
+
+        assert response.status_code == 200
+        assert response.json()["pid"] != os.getpid()
+
+
+@pytest.mark.anyio
+async def test_process_pool_counts_the_cancelled_calls_until_they_finish() -> None:
+    pool = ProcessPool("cancelled", max_workers=1, max_queue_size=0)
+
+    with anyio.move_on_after(0.5):
+        await pool.run(time.sleep, 1)
+
+    assert pool.statistics.running == 1
+
+    with pytest.raises(ServiceUnavailable):
+        await pool.run(time.sleep, 0)
+
+    await pool.shutdown()
+
+    assert pool.statistics.running == 0
+    assert pool.statistics.completed == 1
+
+
+def test_process_executor_validations() -> None:
+    with pytest.raises(ImproperlyConfigured):
+
+        @get(executor="process")
+        async def asynchronous() -> None:
+            ...
+
+    with pytest.raises(ImproperlyConfigured):
+
+        @get(executor="process")
+        def nested() -> None:
+            ...
+
+    with pytest.raises(ImproperlyConfigured):
+        get(executor="process")(take_request)
+
+    with pytest.raises(ImproperlyConfigured):
+        get(executor="greenlet")(render.fn)
+
+
+def test_process_pool_is_sized_once() -> None:
+    get("/same", executor="process", process_pool="render", max_concurrency=2)(render.fn)
+
+    with pytest.raises(ImproperlyConfigured):
+        get("/conflict", executor="process", process_pool="render", max_concurrency=3)(render.fn)
+
+    handler = get("/default", executor="process", process_pool="render")(render.fn)
+
+    assert handler.get_process_pool().max_workers == 2
+
+
+def take_request(request: Request) -> None:
+    ...
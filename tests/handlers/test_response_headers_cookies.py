@@ -0,0 +1,82 @@
+from starlette.responses import Response as StarletteResponse
+
+from esmerald import Gateway, get
+from esmerald.datastructures import Cookie, ResponseHeader
+from esmerald.responses import Response
+from esmerald.routing.base import encode_cookies, encode_headers, merge_headers
+from esmerald.testclient import create_client
+
+
+def test_encode_headers_and_cookies() -> None:
+    cookie = Cookie(key="token", value="granted", max_age=3000, httponly=True)
+    response = StarletteResponse()
+    response.set_cookie(key="token", value="granted", max_age=3000, httponly=True)
+
+    assert encode_headers({"X-Sku": ResponseHeader(value="123")}) == ((b"x-sku", b"123"),)
+    assert encode_cookies([cookie]) == (("token", response.raw_headers[-1]),)
+
+
+def test_merge_headers() -> None:
+    raw_headers = [(b"x-sku", b"data"), (b"allow", b"old")]
+
+    merge_headers(raw_headers, ((b"x-sku", b"handler"), (b"x-other", b"handler")))
+    merge_headers(raw_headers, ((b"allow", b"new"),), override=True)
+
+    assert raw_headers == [(b"x-sku", b"data"), (b"x-other", b"handler"), (b"allow", b"new")]
+
+
+def test_response_headers_and_cookies_precedence(test_client_factory) -> None:
+    @get(
+        "/response",
+        response_headers={
+            "x-sku": ResponseHeader(value="handler"),
+            "x-id": ResponseHeader(value="1"),
+        },
+        response_cookies=[
+            Cookie(key="token", value="handler"),
+            Cookie(key="other", value="handler"),
+        ],
+    )
+    async def response_handler() -> Response:
+        return Response(
+            "ok", headers={"x-sku": "response"}, cookies=[Cookie(key="token", value="response")]
+        )
+
+    with create_client(routes=[Gateway(handler=response_handler)]) as client:
+        response = client.get("/response")
+
+        assert response.headers["x-sku"] == "response"
+        assert response.headers["x-id"] == "1"
+        assert response.headers["allow"] == str(response_handler.methods)
+        assert response.cookies["token"] == "response"
+        assert response.cookies["other"] == "handler"
+        assert len(response.headers.get_list("set-cookie")) == 2
+
+
+def test_response_headers_and_cookies_for_starlette_responses(test_client_factory) -> None:
+    @get("/starlette", response_cookies=[Cookie(key="token", value="handler")])
+    async def starlette_handler() -> StarletteResponse:
+        response = StarletteResponse("ok")
+        response.set_cookie("first", "1")
+        response.set_cookie("second", "2")
+        return response
+
+    with create_client(routes=[Gateway(handler=starlette_handler)]) as client:
+        response = client.get("/starlette")
+
+        assert len(response.headers.get_list("set-cookie")) == 3
+        assert response.cookies["first"] == "1"
+        assert response.cookies["second"] == "2"
+        assert response.cookies["token"] == "handler"
+
+
+def test_response_headers_for_plain_values(test_client_factory) -> None:
+    @get("/plain", response_headers={"x-sku": ResponseHeader(value="123")})
+    async def plain() -> dict:
+        return {"name": "esmerald"}
+
+    with create_client(routes=[Gateway(handler=plain)]) as client:
+        response = client.get("/plain")
+
+        assert response.json() == {"name": "esmerald"}
+        assert response.headers["x-sku"] == "123"
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from esmerald import Gateway, get
+from esmerald.conf import settings
+from esmerald.responses import Response
+from esmerald.responses.encoders import ORJSONResponse
+from esmerald.responses.serializers import get_response_serializer, has_model
+from esmerald.testclient import create_client
+
+T = TypeVar("T")
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+class DiscountedItem(Item):
+    discount: float
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    total: int
+
+
+def test_has_model() -> None:
+    assert has_model(Item)
+    assert has_model(List[Item])
+    assert has_model(Dict[str, Tag])
+    assert has_model(Optional[Tag])
+    assert has_model(Page[Item])
+    assert not has_model(str)
+    assert not has_model(Dict[str, Any])
+    assert not has_model(List[int])
+
+
+def test_serializers_are_shared() -> None:
+    serializer = get_response_serializer(List[Item])
+
+    assert serializer is not None
+    assert get_response_serializer(List[Item]) is serializer
+    assert get_response_serializer(Dict[str, Any]) is None
+
+
+@get("/items")
+async def items() -> List[Item]:
+    return [Item(name="esmerald", price=1.5), Item(name="saffier", price=2)]
+
+
+@get("/tags")
+def tags() -> Dict[str, Tag]:
+    return {"first": Tag(name="esmerald")}
+
+
+@get("/page")
+async def page() -> Page[Item]:
+    return Page[Item](items=[Item(name="esmerald", price=1.5)], total=1)
+
+
+@get("/optional")
+async def optional() -> Optional[Item]:
+    return None
+
+
+def test_response_serializer(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=items),
+            Gateway(handler=tags),
+            Gateway(handler=page),
+            Gateway(handler=optional),
+        ]
+    ) as client:
+        assert client.get("/items").json() == [
+            {"name": "esmerald", "price": 1.5},
+            {"name": "saffier", "price": 2.0},
+        ]
+        assert client.get("/tags").json() == {"first": {"name": "esmerald"}}
+        assert client.get("/page").json() == {
+            "items": [{"name": "esmerald", "price": 1.5}],
+            "total": 1,
+        }
+        assert client.get("/optional").content == b""
+
+
+def test_subclass_fields_are_serialized(test_client_factory) -> None:
+    @get("/item")
+    async def item() -> Item:
+        return DiscountedItem(name="esmerald", price=1.5, discount=0.5)
+
+    @get("/list")
+    async def item_list() -> List[Item]:
+        return [DiscountedItem(name="esmerald", price=1.5, discount=0.5)]
+
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=item_list)]) as client:
+        expected = {"name": "esmerald", "price": 1.5, "discount": 0.5}
+
+        assert client.get("/item").json() == expected
+        assert client.get("/list").json() == [expected]
+
+
+def test_response_without_validation(test_client_factory) -> None:
+    @get("/invalid")
+    async def invalid() -> List[Item]:
+        return [{"name": "esmerald"}]  # type: ignore
+
+    with create_client(routes=[Gateway(handler=invalid)]) as client:
+        response = client.get("/invalid")
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "esmerald"}]
+
+
+def test_response_validation(test_client_factory, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "enable_response_validation", True)
+
+    @get("/invalid")
+    async def invalid() -> List[Item]:
+        return [{"name": "esmerald"}]  # type: ignore
+
+    with create_client(routes=[Gateway(handler=invalid), Gateway(handler=items)]) as client:
+        assert client.get("/invalid").status_code == 500
+        assert client.get("/items").status_code == 200
+
+
+def test_custom_response_class_skips_serializer() -> None:
+    class CustomResponse(Response):
+        def render(self, content: Any) -> bytes:
+            return b"custom"
+
+    assert items.get_response_serializer(Response, "application/json") is not None
+    assert items.get_response_serializer(CustomResponse, "application/json") is None
+    assert items.get_response_serializer(ORJSONResponse, "application/json") is None
+    assert items.get_response_serializer(Response, "text/plain") is None
+
+
+def test_json_encoder_skips_serializer() -> None:
+    class JSONResponse(Response):
+        json_encoder = "json"
+
+    assert items.get_response_serializer(JSONResponse, "application/json") is None
+
+
+class UpperResponse(Response):
+    @staticmethod
+    def transform(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return {key.upper(): str(field).upper() for key, field in value}
+        raise TypeError("unsupported type")
+
+
+def test_custom_transform_skips_serializer(test_client_factory) -> None:
+    @get("/item", response_class=UpperResponse)
+    async def item() -> Item:
+        return Item(name="esmerald", price=1.5)
+
+    @get("/any", response_class=UpperResponse)
+    async def any_item() -> Any:
+        return Item(name="esmerald", price=1.5)
+
+    assert item.get_response_serializer(UpperResponse, "application/json") is None
+
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=any_item)]) as client:
+        expected = {"NAME": "ESMERALD", "PRICE": "1.5"}
+
+        assert client.get("/item").json() == expected
+        assert client.get("/any").json() == expected
@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from esmerald import Gateway, ImproperlyConfigured, Inject, get
+from esmerald.concurrency import SYNC_HANDLERS_LIMITER, get_limiter_statistics
+from esmerald.conf import settings
+from esmerald.testclient import create_client
+
+threads: Dict[str, List[threading.Thread]] = {}
+
+
+def record(name: str) -> None:
+    threads.setdefault(name, []).append(threading.current_thread())
+
+
+def get_value() -> int:
+    record("dependency")
+    return 1
+
+
+def get_inline_value() -> int:
+    record("inline_dependency")
+    return 2
+
+
+@get(
+    "/threaded",
+    dependencies={
+        "value": Inject(get_value),
+        "inline": Inject(get_inline_value, run_in_threadpool=False),
+    },
+)
+def threaded(value: int, inline: int) -> Dict[str, int]:
+    record("handler")
+    return {"value": value + inline}
+
+
+@get("/inline", run_in_threadpool=False)
+def inline() -> Dict[str, bool]:
+    record("inline")
+    return {"inline": True}
+
+
+@get("/reports", thread_pool="reports", max_concurrency=1)
+def reports() -> Dict[str, bool]:
+    record("reports")
+    time.sleep(0.1)
+    return {"report": True}
+
+
+@get("/summary", thread_pool="reports")
+def summary() -> Dict[str, bool]:
+    return {"summary": True}
+
+
+def setup_function() -> None:
+    threads.clear()
+
+
+def test_sync_handlers_and_dependencies_run_in_the_thread_pool(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=threaded), Gateway(handler=inline)]) as client:
+        assert client.get("/threaded").json() == {"value": 3}
+        assert client.get("/inline").json() == {"inline": True}
+
+        event_loop_thread = threads["inline"][0]
+
+        assert event_loop_thread is threads["inline_dependency"][0]
+        assert threads["handler"][0] is not event_loop_thread
+        assert threads["dependency"][0] is not event_loop_thread
+
+    names = {statistics.name for statistics in get_limiter_statistics()}
+
+    assert SYNC_HANDLERS_LIMITER in names
+    assert all(
+        statistics.total_tokens == settings.sync_handlers_workers
+        for statistics in get_limiter_statistics(SYNC_HANDLERS_LIMITER)
+    )
+
+
+def test_route_thread_pool(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=reports)]) as client:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            start = time.perf_counter()
+            responses = list(executor.map(lambda _: client.get("/reports"), range(3)))
+            elapsed = time.perf_counter() - start
+
+    assert [response.json() for response in responses] == [{"report": True}] * 3
+    # With a single worker, the reports are generated one after the other.
+    assert elapsed >= 0.3
+
+    statistics = get_limiter_statistics("reports")
+
+    assert statistics and all(stats.total_tokens == 1 for stats in statistics)
+    assert all(stats.borrowed_tokens == 0 for stats in statistics)
+
+
+def test_route_thread_pool_is_sized_once(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=summary)]) as client:
+        assert client.get("/summary").json() == {"summary": True}
+
+    assert all(stats.total_tokens == 1 for stats in get_limiter_statistics("reports"))
+
+    get("/same", thread_pool="reports", max_concurrency=1)(summary.fn)
+
+    with pytest.raises(ImproperlyConfigured):
+        get("/conflict", thread_pool="reports", max_concurrency=2)(summary.fn)
+
+
+@pytest.mark.parametrize("thread_pool", [None, SYNC_HANDLERS_LIMITER])
+def test_max_concurrency_requires_a_thread_pool(thread_pool) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get("/shared", thread_pool=thread_pool, max_concurrency=2)(summary.fn)
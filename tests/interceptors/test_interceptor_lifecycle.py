@@ -0,0 +1,83 @@
+from starlette.types import Receive, Scope, Send
+
+from esmerald import Gateway, get
+from esmerald.enums import InterceptorLifecycle
+from esmerald.interceptors.interceptor import EsmeraldInterceptor
+from esmerald.testclient import create_client
+
+instances = {"singleton": 0, "per_request": 0}
+calls = []
+
+
+class SingletonInterceptor(EsmeraldInterceptor):
+    def __init__(self) -> None:
+        instances["singleton"] += 1
+
+    async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        calls.append("singleton")
+
+
+class PerRequestInterceptor(EsmeraldInterceptor):
+    lifecycle = InterceptorLifecycle.PER_REQUEST
+
+    def __init__(self) -> None:
+        instances["per_request"] += 1
+
+    async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        calls.append("per_request")
+
+
+class CustomInterceptor:
+    async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        calls.append("custom")
+
+
+@get("/")
+async def home() -> str:
+    return "home"
+
+
+def setup_function() -> None:
+    instances.update(singleton=0, per_request=0)
+    calls.clear()
+
+
+def test_no_interceptors_no_chain() -> None:
+    gateway = Gateway(handler=home)
+
+    assert gateway.get_interceptor_chain() is None
+
+
+def test_singleton_interceptor_instantiated_once(test_client_factory) -> None:
+    with create_client(
+        routes=[Gateway(handler=home, interceptors=[SingletonInterceptor])]
+    ) as client:
+        for _ in range(3):
+            assert client.get("/").json() == "home"
+
+    assert instances["singleton"] == 1
+    assert calls == ["singleton"] * 3
+
+
+def test_per_request_interceptor(test_client_factory) -> None:
+    with create_client(
+        routes=[Gateway(handler=home, interceptors=[PerRequestInterceptor])]
+    ) as client:
+        for _ in range(3):
+            assert client.get("/").json() == "home"
+
+    assert instances["per_request"] == 3
+
+
+def test_mixed_chain_keeps_order(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=home, interceptors=[PerRequestInterceptor, SingletonInterceptor])
+        ],
+        interceptors=[CustomInterceptor],
+    ) as client:
+        client.get("/")
+        client.get("/")
+
+    assert calls == ["custom", "per_request", "singleton"] * 2
+    assert instances == {"singleton": 1, "per_request": 2}
@@ -0,0 +1,158 @@
+from typing import AsyncIterator, List, Optional
+
+import pytest
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware as StarletteMiddleware
+from starlette.responses import StreamingResponse
+from starlette.types import ASGIApp
+
+from esmerald import (
+    BackgroundTask,
+    Gateway,
+    ImproperlyConfigured,
+    WebSocket,
+    WebSocketGateway,
+    get,
+    websocket,
+)
+from esmerald.middleware import EsmeraldMiddleware
+from esmerald.requests import Request
+from esmerald.responses import JSONResponse, Response
+from esmerald.testclient import create_client
+
+events: List[str] = []
+
+
+class HooksMiddleware(EsmeraldMiddleware):
+    async def before_request(self, request: Request) -> Optional[ASGIApp]:
+        events.append(f"before:{request.url.path}")
+        if "blocked" in request.query_params:
+            return JSONResponse({"blocked": True}, status_code=403)
+        request.state.tenant = "acme"
+        return None
+
+    async def on_headers(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        events.append(f"headers:{status_code}")
+        headers["x-tenant"] = request.state.tenant
+
+    async def after_response(self, request: Request, status_code: int) -> None:
+        events.append(f"after:{status_code}")
+
+
+class HeadersOnlyMiddleware(EsmeraldMiddleware):
+    header: str = "x-headers-only"
+
+    async def on_headers(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        headers[self.header] = "true"
+
+
+@get("/tenant")
+async def tenant(request: Request) -> dict:
+    return {"tenant": request.state.tenant}
+
+
+@get("/stream")
+async def stream() -> StreamingResponse:
+    async def numbers() -> AsyncIterator[bytes]:
+        for number in range(3):
+            events.append(f"chunk:{number}")
+            yield str(number).encode()
+
+    return StreamingResponse(numbers())
+
+
+@get("/background")
+async def background() -> Response:
+    return Response("ok", background=BackgroundTask(events.append, "background"))
+
+
+@websocket("/ws")
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"socket": True})
+    await socket.close()
+
+
+def setup_function() -> None:
+    events.clear()
+
+
+def test_esmerald_middleware_hooks(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=tenant)], middleware=[HooksMiddleware]) as client:
+        response = client.get("/tenant")
+
+        assert response.json() == {"tenant": "acme"}
+        assert response.headers["x-tenant"] == "acme"
+        assert events == ["before:/tenant", "headers:200", "after:200"]
+
+
+def test_esmerald_middleware_short_circuits(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=tenant)], middleware=[HooksMiddleware]) as client:
+        response = client.get("/tenant?blocked=1")
+
+        assert response.status_code == 403
+        assert response.json() == {"blocked": True}
+        assert "x-tenant" not in response.headers
+        assert events == ["before:/tenant"]
+
+
+def test_esmerald_middleware_does_not_buffer(test_client_factory) -> None:
+    with create_client(
+        routes=[Gateway(handler=stream), Gateway(handler=background)],
+        middleware=[HooksMiddleware],
+    ) as client:
+        response = client.get("/stream")
+
+        assert response.text == "012"
+        assert response.headers["x-tenant"] == "acme"
+        assert events == [
+            "before:/stream",
+            "headers:200",
+            "chunk:0",
+            "chunk:1",
+            "chunk:2",
+            "after:200",
+        ]
+
+        events.clear()
+        client.get("/background")
+
+        assert events == ["before:/background", "headers:200", "after:200", "background"]
+
+
+def test_esmerald_middleware_only_wires_the_implemented_hooks(test_client_factory) -> None:
+    middleware = HeadersOnlyMiddleware(app=tenant)
+
+    assert not middleware.has_before_request
+    assert middleware.has_on_headers
+    assert not middleware.has_after_response
+
+    with create_client(
+        routes=[Gateway(handler=background), WebSocketGateway(handler=socket_handler)],
+        middleware=[HeadersOnlyMiddleware],
+    ) as client:
+        assert client.get("/background").headers["x-headers-only"] == "true"
+
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == {"socket": True}
+
+
+def test_esmerald_middleware_options(test_client_factory) -> None:
+    with create_client(
+        routes=[Gateway(handler=background)],
+        middleware=[StarletteMiddleware(HeadersOnlyMiddleware, header="x-custom")],
+    ) as client:
+        response = client.get("/background")
+
+        assert response.headers["x-custom"] == "true"
+        assert "x-headers-only" not in response.headers
+
+
+@pytest.mark.parametrize("option", ["on_headers", "has_on_headers", "_private"])
+def test_esmerald_middleware_reserved_options(option) -> None:
+    with pytest.raises(ImproperlyConfigured):
+        HeadersOnlyMiddleware(app=tenant, **{option: None})
@@ -216,8 +216,9 @@ def test_middleware_call_order_with_include() -> None:
             create_test_middleware(1),
         ],
     ) as client:
-        client.get("/router/controller/handler")
+        response = client.get("/controller/handler")
 
+        assert response.status_code == 200
         assert results == [0, 1, 2, 3, 4, 5, 6, 7]
 
 
@@ -269,8 +270,9 @@ def test_middleware_call_order_with_nested_include() -> None:
             create_test_middleware(1),
         ],
     ) as client:
-        client.get("/router/controller/handler")
+        response = client.get("/controller/handler")
 
+        assert response.status_code == 200
         assert results == [0, 1, 2, 3, 4, 5, 6, 7]
 
 
@@ -371,8 +373,9 @@ def test_middleware_call_order_with_heavy_nested_include() -> None:
             create_test_middleware(1),
         ],
     ) as client:
-        client.get("/routes/controller/handler")
+        response = client.get("/controller/handler")
 
+        assert response.status_code == 200
         assert results == [0, 1, 2, 3, 4, 5, 6, 7]
 
 
@@ -0,0 +1,105 @@
+from typing import List
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from esmerald import Gateway, Include, WebSocket, WebSocketGateway, get, websocket
+from esmerald.protocols.middleware import MiddlewareProtocol
+from esmerald.testclient import create_client
+
+calls: List[str] = []
+instances: List[str] = []
+
+
+class AdminMiddleware(MiddlewareProtocol):
+    def __init__(self, app: ASGIApp, name: str = "admin") -> None:
+        self.app = app
+        self.name = name
+        instances.append(name)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        calls.append(self.name)
+        await self.app(scope, receive, send)
+
+
+@get("/home")
+async def home() -> str:
+    return "home"
+
+
+@get("/admin")
+async def admin() -> str:
+    return "admin"
+
+
+@get("/users", middleware=[AdminMiddleware])
+async def users() -> str:
+    return "users"
+
+
+@websocket("/ws")
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"calls": calls})
+    await socket.close()
+
+
+def setup_function() -> None:
+    calls.clear()
+    instances.clear()
+
+
+def test_gateway_middleware_is_scoped_to_the_route(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=home),
+            Gateway(handler=admin, middleware=[AdminMiddleware]),
+            Gateway(handler=users),
+        ]
+    ) as client:
+        assert AdminMiddleware not in [middleware.cls for middleware in client.app.user_middleware]
+        assert instances == ["admin", "admin"]
+
+        assert client.get("/home").text == '"home"'
+        assert client.get("/not-found").status_code == 404
+        assert calls == []
+
+        assert client.get("/admin").text == '"admin"'
+        assert client.get("/users").text == '"users"'
+        assert calls == ["admin", "admin"]
+        assert instances == ["admin", "admin"]
+
+
+def test_include_middleware_is_scoped_to_the_include(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=home),
+            Include(
+                "/api",
+                routes=[Gateway(handler=admin), Gateway(handler=users)],
+                middleware=[AdminMiddleware],
+            ),
+        ]
+    ) as client:
+        assert client.get("/home").status_code == 200
+        assert calls == []
+
+        assert client.get("/api/admin").status_code == 200
+        assert calls == ["admin"]
+
+        calls.clear()
+
+        assert client.get("/api/users").status_code == 200
+        assert calls == ["admin", "admin"]
+
+
+def test_websocket_gateway_middleware(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=home),
+            WebSocketGateway(handler=socket_handler, middleware=[AdminMiddleware]),
+        ]
+    ) as client:
+        client.get("/home")
+
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == {"calls": ["admin"]}
@@ -0,0 +1,244 @@
+import gzip
+from typing import Any, List
+
+import brotli
+from pydantic import BaseModel, ConfigDict
+
+from esmerald import Esmerald, Gateway, Inject, get
+from esmerald.config import openapi as openapi_config
+from esmerald.config.openapi import OpenAPIConfig
+from esmerald.openapi.cache import get_openapi_fingerprint
+from esmerald.testclient import EsmeraldTestClient
+
+
+class Item(BaseModel):
+    name: str
+
+
+@get("/items")
+async def items() -> List[Item]:
+    return []
+
+
+@get("/other")
+async def other() -> str:
+    return "other"
+
+
+def count_generations(monkeypatch: Any) -> List[int]:
+    calls: List[int] = []
+    get_openapi = openapi_config.get_openapi
+
+    def counted(**kwargs: Any) -> Any:
+        calls.append(1)
+        return get_openapi(**kwargs)
+
+    monkeypatch.setattr(openapi_config, "get_openapi", counted)
+    return calls
+
+
+def test_document_is_generated_once(test_client_factory, monkeypatch) -> None:
+    calls = count_generations(monkeypatch)
+    app = Esmerald(routes=[Gateway(handler=items)], enable_openapi=True)
+    client = EsmeraldTestClient(app)
+
+    first = client.get("/openapi.json")
+    second = client.get("/openapi.json")
+
+    assert first.json() == second.json()
+    assert len(calls) == 1
+    assert "/items" in app.openapi_schema["paths"]
+
+    app.add_route(path="/", handler=other)
+
+    assert "/other" in client.get("/openapi.json").json()["paths"]
+    assert len(calls) == 2
+
+
+def test_document_etag_and_encodings(test_client_factory) -> None:
+    app = Esmerald(routes=[Gateway(handler=items)], enable_openapi=True)
+    client = EsmeraldTestClient(app)
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "identity"})
+    etag = response.headers["etag"]
+    content = response.content
+
+    assert "content-encoding" not in response.headers
+
+    response = client.get(
+        "/openapi.json", headers={"accept-encoding": "identity", "if-none-match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+    document = app.openapi_document
+
+    assert document.etag == etag
+    assert gzip.decompress(document.gzip_content) == content
+    assert brotli.decompress(document.brotli_content) == content
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == content
+    assert response.headers["etag"] == etag[:-1] + '-gzip"'
+
+    response = client.get(
+        "/openapi.json", headers={"accept-encoding": "gzip", "if-none-match": etag}
+    )
+
+    assert response.status_code == 200
+
+    response = client.get(
+        "/openapi.json",
+        headers={"accept-encoding": "gzip", "if-none-match": etag[:-1] + '-gzip"'},
+    )
+
+    assert response.status_code == 304
+
+
+def test_document_is_persisted(test_client_factory, monkeypatch, tmp_path) -> None:
+    schema_file = str(tmp_path / "openapi.json")
+    calls = count_generations(monkeypatch)
+
+    def create_app() -> Esmerald:
+        return Esmerald(
+            routes=[Gateway(handler=items)],
+            enable_openapi=True,
+            openapi_config=OpenAPIConfig(
+                title="Cached",
+                version="1.0.0",
+                openapi_url="/openapi.json",
+                schema_file=schema_file,
+            ),
+        )
+
+    schema = EsmeraldTestClient(create_app()).get("/openapi.json").json()
+
+    assert len(calls) == 1
+
+    replica = create_app()
+
+    assert EsmeraldTestClient(replica).get("/openapi.json").json() == schema
+    assert len(calls) == 1
+    assert replica.openapi_document.fingerprint == app_fingerprint(replica)
+
+
+def app_fingerprint(app: Esmerald) -> str:
+    return get_openapi_fingerprint(list(app.routes), **app.openapi_config.get_openapi_config())
+
+
+def test_fingerprint_follows_the_models() -> None:
+    first = get_openapi_fingerprint([Gateway(handler=items)], title="Esmerald")
+
+    assert get_openapi_fingerprint([Gateway(handler=items)], title="Esmerald") == first
+    assert get_openapi_fingerprint([Gateway(handler=items)], title="Other") != first
+
+    class Item(BaseModel):
+        name: str
+        price: float
+
+    @get("/items")
+    async def changed() -> List[Item]:
+        return []
+
+    changed.fn.__qualname__ = items.fn.__qualname__
+
+    gateway = Gateway(handler=changed, name="items")
+
+    assert get_openapi_fingerprint([gateway], title="Esmerald") != first
+
+
+def model_fingerprint(model: Any, **handler_options: Any) -> str:
+    @get("/items", **handler_options)
+    async def handler() -> model:  # type: ignore[valid-type]
+        return None
+
+    handler.fn.__qualname__ = items.fn.__qualname__
+    return get_openapi_fingerprint([Gateway(handler=handler, name="items")], title="Esmerald")
+
+
+def test_fingerprint_follows_the_model_schema() -> None:
+    class Item(BaseModel):
+        """An item."""
+
+        name: str
+
+    first = model_fingerprint(Item)
+
+    class Item(BaseModel):  # type: ignore[no-redef]
+        """A product."""
+
+        name: str
+
+    assert model_fingerprint(Item) != first
+
+    class Item(BaseModel):  # type: ignore[no-redef]
+        """An item."""
+
+        model_config = ConfigDict(title="Product")
+
+        name: str
+
+    assert model_fingerprint(Item) != first
+
+
+def test_fingerprint_follows_the_dependencies() -> None:
+    def get_limit(limit: int = 10) -> int:
+        return limit
+
+    first = model_fingerprint(Item, dependencies={"limit": Inject(get_limit)})
+
+    assert model_fingerprint(Item, dependencies={"limit": Inject(get_limit)}) == first
+
+    def get_limit(limit: int = 10, offset: int = 0) -> int:  # type: ignore[no-redef]
+        return limit
+
+    assert model_fingerprint(Item, dependencies={"limit": Inject(get_limit)}) != first
+
+
+def test_fingerprint_ignores_memory_addresses() -> None:
+    class Limit:
+        pass
+
+    def get_limit(limit: Any = Limit()) -> Any:
+        return limit
+
+    first = model_fingerprint(Item, dependencies={"limit": Inject(get_limit)})
+
+    def get_limit(limit: Any = Limit()) -> Any:  # type: ignore[no-redef]
+        return limit
+
+    assert model_fingerprint(Item, dependencies={"limit": Inject(get_limit)}) == first
+
+
+def test_document_headers_are_parsed(test_client_factory) -> None:
+    app = Esmerald(routes=[Gateway(handler=items)], enable_openapi=True)
+    client = EsmeraldTestClient(app)
+
+    etag = client.get("/openapi.json").headers["etag"]
+
+    response = client.get("/openapi.json", headers={"if-none-match": etag[:-3] + '"'})
+    assert response.status_code == 200
+
+    response = client.get("/openapi.json", headers={"if-none-match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "gzip;q=0, br;q=0"})
+    assert "content-encoding" not in response.headers
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "br;q=0.5, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "gzip;q=1, br;q=0.5"})
+    assert response.headers["content-encoding"] == "gzip"
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "identity, gzip;q=0.5"})
+    assert "content-encoding" not in response.headers
+
+    response = client.get("/openapi.json", headers={"accept-encoding": "*"})
+    assert response.headers["content-encoding"] == "br"
@@ -0,0 +1,116 @@
+import threading
+from functools import partial
+from typing import TYPE_CHECKING
+
+import anyio
+from starlette.status import HTTP_200_OK, HTTP_403_FORBIDDEN
+
+from esmerald.permissions import AllowAny, BasePermission, DenyAll
+from esmerald.permissions.utils import compile_permission
+from esmerald.requests import Request
+from esmerald.routing.gateways import Gateway
+from esmerald.routing.handlers import get
+from esmerald.testclient import create_client
+
+if TYPE_CHECKING:
+    from esmerald.types import APIGateHandler  # pragma: no cover
+
+calls = []
+
+
+class CountedPermission(BasePermission):
+    instances = 0
+
+    def __init__(self) -> None:
+        CountedPermission.instances += 1
+
+    def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return True
+
+
+class AsyncHeaderPermission(BasePermission):
+    async def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        calls.append("async")
+        return bool(request.headers.get("allow"))
+
+
+class TrackedDenyAll(BasePermission):
+    def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        calls.append("sync")
+        return False
+
+
+class BlockingPermission(BasePermission):
+    blocking = True
+
+    def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return threading.current_thread() is not threading.main_thread()
+
+
+class KeywordOnlyPermission(BasePermission):
+    def has_permission(self, *, apiview: "APIGateHandler", request: "Request") -> bool:
+        return True
+
+
+def evaluate(permission, request=None):
+    is_async, evaluator = compile_permission(permission())
+    if is_async:
+        return anyio.run(partial(evaluator, request=request, apiview=None))
+    return evaluator(request=request, apiview=None)
+
+
+def test_compile_sync_composition() -> None:
+    assert compile_permission((AllowAny & DenyAll)())[0] is False
+    assert evaluate(AllowAny & DenyAll) is False
+    assert evaluate(AllowAny | DenyAll) is True
+    assert evaluate(~DenyAll) is True
+    assert evaluate(~(AllowAny & DenyAll) & AllowAny) is True
+
+
+def test_compile_async_composition_short_circuits() -> None:
+    calls.clear()
+
+    assert compile_permission((TrackedDenyAll & AsyncHeaderPermission)())[0] is True
+    assert evaluate(TrackedDenyAll & AsyncHeaderPermission) is False
+    assert calls == ["sync"]
+
+    calls.clear()
+    assert evaluate(AllowAny | AsyncHeaderPermission) is True
+    assert calls == []
+
+
+def test_blocking_permission_runs_in_thread() -> None:
+    assert evaluate(BlockingPermission) is True
+
+
+def test_permissions_are_called_with_keywords() -> None:
+    assert evaluate(KeywordOnlyPermission) is True
+    assert evaluate(KeywordOnlyPermission & ~DenyAll) is True
+    assert evaluate(KeywordOnlyPermission & BlockingPermission) is True
+
+
+def test_permission_instantiated_once(test_client_factory) -> None:
+    CountedPermission.instances = 0
+
+    @get(path="/secret", permissions=[CountedPermission])
+    async def secret() -> None:
+        """"""
+
+    with create_client(routes=[Gateway(handler=secret)]) as client:
+        for _ in range(3):
+            assert client.get("/secret").status_code == HTTP_200_OK
+
+    assert CountedPermission.instances == 1
+
+
+def test_composed_async_permission_on_handler(test_client_factory) -> None:
+    @get(path="/secret", permissions=[AllowAny & ~DenyAll & AsyncHeaderPermission])
+    async def secret() -> None:
+        """"""
+
+    with create_client(routes=[Gateway(handler=secret)]) as client:
+        response = client.get("/secret")
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+        response = client.get("/secret", headers={"allow": "yes"})
+        assert response.status_code == HTTP_200_OK
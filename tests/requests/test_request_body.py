@@ -0,0 +1,122 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Gateway, post
+from esmerald.conf import settings
+from esmerald.exceptions import PayloadTooLarge
+from esmerald.requests import Request
+from esmerald.testclient import create_client
+
+
+def make_scope(content_length: Optional[int] = None) -> Dict[str, Any]:
+    headers = []
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    return {"type": "http", "method": "POST", "path": "/", "headers": headers}
+
+
+def make_receive(chunks: List[bytes]) -> Any:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    return receive
+
+
+def test_from_scope_shares_the_request() -> None:
+    scope = make_scope()
+    receive = make_receive([b"{}"])
+    request = Request.from_scope(scope)
+
+    assert Request.from_scope(scope, receive) is request
+    assert request.receive is receive
+
+
+@pytest.mark.asyncio()
+async def test_from_scope_with_copied_scope() -> None:
+    scope = make_scope()
+    request = Request.from_scope(scope, make_receive([b'{"name": "esmerald"}']))
+    assert await request.json() == {"name": "esmerald"}
+
+    child_scope = {**scope, "root_path": "/api"}
+    child = Request.from_scope(child_scope)
+
+    assert child is not request
+    assert child.scope is child_scope
+    assert child.url.path == "/api/"
+    assert await child.json() == {"name": "esmerald"}
+    assert await child.body() == b'{"name": "esmerald"}'
+    assert Request.from_scope(child_scope) is child
+    assert Request.from_scope(scope) is request
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("limit", [None, 1024])
+@pytest.mark.parametrize(
+    "chunks,content_length",
+    [
+        ([b'{"name": "esmerald"}'], 20),
+        ([b'{"name"', b': "esm', b'erald"}'], 20),
+        ([b'{"name"', b': "esmerald"}'], None),
+        ([b'{"name"', b': "esmerald"}'], 10),
+        ([b'{"name"', b': "esmerald"}', b""], 30),
+    ],
+)
+async def test_body_is_read_once_per_scope(chunks, content_length, limit, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "request_max_body_size", limit)
+    scope = make_scope(content_length)
+    request = Request(scope, make_receive(chunks))
+
+    assert await request.json() == {"name": "esmerald"}
+
+    other = Request(scope)
+
+    assert await other.body() == b'{"name": "esmerald"}'
+    assert [chunk async for chunk in other.stream()] == [b'{"name": "esmerald"}', b""]
+
+
+@pytest.mark.asyncio()
+async def test_max_body_size_from_content_length(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "request_max_body_size", 10)
+    request = Request(make_scope(20), make_receive([b"{}"]))
+
+    with pytest.raises(PayloadTooLarge):
+        await request.body()
+
+
+@pytest.mark.asyncio()
+async def test_max_body_size_while_streaming(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "request_max_body_size", 10)
+    request = Request(make_scope(), make_receive([b"123456", b"789012"]))
+
+    with pytest.raises(PayloadTooLarge):
+        await request.body()
+
+
+class Item(BaseModel):
+    name: str
+
+
+@post("/items")
+async def create_item(data: Item) -> Item:
+    return data
+
+
+def test_max_body_size_response(test_client_factory, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "request_max_body_size", 32)
+
+    with create_client(routes=[Gateway(handler=create_item)]) as client:
+        response = client.post("/items", json={"name": "esmerald"})
+
+        assert response.status_code == 201
+        assert response.json() == {"name": "esmerald"}
+
+        response = client.post("/items", json={"name": "esmerald" * 10})
+
+        assert response.status_code == 413
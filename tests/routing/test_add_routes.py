@@ -0,0 +1,160 @@
+import pytest
+
+from esmerald import (
+    APIView,
+    Esmerald,
+    Gateway,
+    ImproperlyConfigured,
+    Include,
+    WebSocket,
+    WebSocketGateway,
+    get,
+    websocket,
+)
+from esmerald.routing.router import Router
+from esmerald.testclient import EsmeraldTestClient
+
+
+@get()
+async def home() -> str:
+    return "home"
+
+
+@get()
+async def plugin() -> str:
+    return "plugin"
+
+
+@websocket()
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"plugin": True})
+    await socket.close()
+
+
+class PluginView(APIView):
+    path = "/view"
+
+    @get("/")
+    async def view(self) -> str:
+        return "view"
+
+
+def count_activations(monkeypatch) -> list:
+    calls = []
+    activate = Router.activate
+
+    def counted(self: Router) -> None:
+        calls.append(self)
+        activate(self)
+
+    monkeypatch.setattr(Router, "activate", counted)
+    return calls
+
+
+def docs_routes(app: Esmerald) -> list:
+    return [route.path for route in app.routes if route.path == "/openapi.json"]
+
+
+def test_add_route_registers_the_docs_once() -> None:
+    app = Esmerald(enable_openapi=True)
+
+    for number in range(5):
+        app.add_route(path=f"/plugins/{number}", handler=plugin, name=f"plugin-{number}")
+    app.add_include(Include("/api", routes=[Gateway(handler=home)]))
+
+    assert docs_routes(app) == ["/openapi.json"]
+
+    paths = EsmeraldTestClient(app).get("/openapi.json").json()["paths"]
+
+    assert {"/plugins/0", "/plugins/4", "/api"} <= set(paths)
+
+
+def test_add_routes(monkeypatch) -> None:
+    app = Esmerald(routes=[Gateway("/", handler=home)], enable_openapi=True)
+    calls = count_activations(monkeypatch)
+
+    app.add_routes(
+        [
+            Gateway("/plugin", handler=plugin),
+            WebSocketGateway("/ws", handler=socket_handler),
+            Gateway(handler=PluginView),
+            Include("/api", routes=[Gateway(handler=plugin)]),
+        ]
+    )
+
+    assert len(calls) == 1
+    assert app.routes[-1].path == "/"
+    assert docs_routes(app) == ["/openapi.json"]
+
+    client = EsmeraldTestClient(app)
+
+    assert client.get("/").text == '"home"'
+    assert client.get("/plugin").text == '"plugin"'
+    assert client.get("/view").text == '"view"'
+    assert client.get("/api").text == '"plugin"'
+
+    with client.websocket_connect("/ws") as ws:
+        assert ws.receive_json() == {"plugin": True}
+
+    assert {"/plugin", "/view", "/api"} <= set(client.get("/openapi.json").json()["paths"])
+
+
+def test_add_apiview_is_deferred(monkeypatch) -> None:
+    app = Esmerald(routes=[Gateway("/", handler=home)])
+    calls = count_activations(monkeypatch)
+
+    app.add_apiview(Gateway(handler=PluginView))
+
+    assert len(calls) == 1
+
+    with app.deferred_activation():
+        app.add_apiview(Gateway("/other", handler=PluginView))
+        assert len(calls) == 1
+
+    assert len(calls) == 2
+    assert app.routes[-1].path == "/"
+
+
+def test_add_routes_validates_the_routes() -> None:
+    app = Esmerald()
+
+    with pytest.raises(ImproperlyConfigured):
+        app.add_routes([Router(routes=[Gateway(handler=plugin)])])
+
+
+def test_deferred_activation(monkeypatch) -> None:
+    app = Esmerald(routes=[Gateway("/", handler=home)], enable_openapi=True)
+    client = EsmeraldTestClient(app)
+    client.get("/openapi.json")
+    calls = count_activations(monkeypatch)
+
+    with app.deferred_activation():
+        with app.deferred_activation():
+            for number in range(10):
+                app.add_route(path=f"/plugins/{number}", handler=plugin, name=f"plugin-{number}")
+
+        assert app.is_activation_deferred
+        assert app.openapi_document is not None
+        assert calls == []
+
+    assert not app.is_activation_deferred
+    assert len(calls) == 1
+    assert app.openapi_document is None
+    assert app.routes[-1].path == "/"
+    assert client.get("/plugins/9").text == '"plugin"'
+    assert "/plugins/9" in client.get("/openapi.json").json()["paths"]
+
+
+def test_deferred_activation_activates_on_errors(monkeypatch) -> None:
+    app = Esmerald(routes=[Gateway("/", handler=home)])
+    calls = count_activations(monkeypatch)
+
+    with pytest.raises(ValueError):
+        with app.deferred_activation():
+            app.add_route(path="/plugin", handler=plugin)
+            raise ValueError()
+
+    assert len(calls) == 1
+    assert not app.is_activation_deferred
+    assert EsmeraldTestClient(app).get("/plugin").text == '"plugin"'
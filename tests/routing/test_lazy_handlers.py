@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from esmerald import Gateway, Include, Inject, Injects, WebSocket, WebSocketGateway, get, websocket
+from esmerald.conf import settings
+from esmerald.routing.compile import compile_handlers
+from esmerald.testclient import create_client
+
+
+def test_lazy_handlers_are_compiled_on_first_request(test_client_factory, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "lazy_handlers", True)
+
+    @get("/items/{item_id}")
+    async def item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    @websocket("/ws")
+    async def socket_handler(socket: WebSocket) -> None:
+        await socket.accept()
+        await socket.send_json({"lazy": True})
+        await socket.close()
+
+    with create_client(
+        routes=[Gateway(handler=item), WebSocketGateway(handler=socket_handler)]
+    ) as client:
+        assert item.signature_model is None
+        assert socket_handler.signature_model is None
+
+        assert client.get("/items/1").json() == {"id": 1}
+        assert client.get("/items/one").status_code == 400
+        assert item.signature_model is not None
+
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == {"lazy": True}
+        assert socket_handler.websocket_parameter_model is not None
+
+
+def test_lazy_handlers_are_compiled_once(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "lazy_handlers", True)
+
+    @get("/items")
+    async def items() -> dict:
+        return {}
+
+    create_client(routes=[Gateway(handler=items)])
+
+    calls = []
+    create_signature_model = items.create_signature_model
+
+    def counted(is_websocket: bool = False) -> None:
+        calls.append(is_websocket)
+        create_signature_model(is_websocket=is_websocket)
+
+    monkeypatch.setattr(items, "create_signature_model", counted)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(lambda _: items.ensure_signature_model(), range(32)):
+            pass
+
+    assert calls == [False]
+    assert items.transformer is not None
+
+
+def test_lazy_handlers_openapi(test_client_factory, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "lazy_handlers", True)
+
+    @get("/items/{item_id}")
+    async def item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    with create_client(routes=[Gateway(handler=item)], enable_openapi=True) as client:
+        schema = client.get("/openapi.json").json()
+
+        assert schema["paths"]["/items/{item_id}"]["get"]["parameters"][0]["name"] == "item_id"
+
+
+def test_compile_handlers(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "lazy_handlers", True)
+
+    @get("/items")
+    async def items() -> dict:
+        return {}
+
+    @get("/broken", dependencies={"value": Inject(lambda: 1)})
+    async def broken(value: int = Injects(), other: int = Injects()) -> dict:
+        return {}
+
+    @websocket("/ws")
+    async def socket_handler(socket: WebSocket) -> None:
+        await socket.close()
+
+    app = create_client(
+        routes=[
+            Include(
+                "/api",
+                routes=[Gateway(handler=items), Gateway(handler=broken)],
+            ),
+            WebSocketGateway(handler=socket_handler),
+        ],
+        enable_openapi=False,
+    ).app
+
+    compiled = {handler.path: handler for handler in compile_handlers(app)}
+
+    assert set(compiled) == {"/api/items", "/api/broken", "/ws"}
+    assert compiled["/api/items"].type == "GET"
+    assert compiled["/api/items"].error is None
+    assert compiled["/api/items"].deferred
+    assert compiled["/ws"].type == "websocket"
+    assert compiled["/api/broken"].error is not None
+    assert all(handler.elapsed >= 0 for handler in compiled.values())
+    assert items.transformer is not None
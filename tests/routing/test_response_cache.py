@@ -0,0 +1,399 @@
+import time
+from typing import TYPE_CHECKING, Dict
+
+import anyio
+import pytest
+from starlette.responses import StreamingResponse
+
+from esmerald import APIView, Cache, CacheConfig, Gateway, Response, get, route
+from esmerald.cache import CachedResponse, MemoryCache
+from esmerald.datastructures import ResponseHeader
+from esmerald.exceptions import ImproperlyConfigured, NotFound
+from esmerald.permissions import BasePermission
+from esmerald.requests import Request
+from esmerald.testclient import create_client
+
+if TYPE_CHECKING:
+    from esmerald.types import APIGateHandler  # pragma: no cover
+
+calls: Dict[str, int] = {}
+
+
+def count(name: str) -> int:
+    calls[name] = calls.get(name, 0) + 1
+    return calls[name]
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HeaderPermission(BasePermission):
+    def has_permission(self, request: "Request", apiview: "APIGateHandler"):
+        return bool(request.headers.get("allow"))
+
+
+@get("/cached", cache=True)
+def cached() -> Dict[str, int]:
+    return {"calls": count("cached")}
+
+
+@get("/vary", cache=Cache(vary_headers=["accept-language"]))
+def vary(request: Request) -> Dict[str, str]:
+    count("vary")
+    return {"language": request.headers.get("accept-language", "")}
+
+
+@get("/stale", cache=Cache(ttl=10, stale_while_revalidate=30))
+def stale() -> Dict[str, int]:
+    return {"calls": count("stale")}
+
+
+@get("/failing/{error}", cache=Cache(ttl=10, stale_while_revalidate=30))
+def failing(error: str) -> Dict[str, int]:
+    if count(error) > 1:
+        raise NotFound() if error == "not-found" else ValueError("Refresh failed.")
+    return {"calls": 1}
+
+
+@get("/items/{item_id}", cache=Cache(tags=["item:{item_id}"]))
+def item(item_id: int) -> Dict[str, int]:
+    return {"id": item_id, "calls": count(f"item:{item_id}")}
+
+
+@get("/cookie", cache=True)
+def cookie() -> Response:
+    count("cookie")
+    response = Response({"cookie": True})
+    response.set_cookie("session", "value")
+    return response
+
+
+@get("/stream", cache=True)
+def stream() -> StreamingResponse:
+    count("stream")
+    return StreamingResponse(iter([b"a", b"b"]))
+
+
+@get("/missing", cache=True)
+def missing() -> None:
+    count("missing")
+    raise NotFound()
+
+
+@get(
+    "/no-store",
+    cache=True,
+    response_headers={"cache-control": ResponseHeader(value="no-store")},
+)
+def no_store() -> Dict[str, bool]:
+    count("no-store")
+    return {"stored": False}
+
+
+class SessionResponse(Response):
+    async def __call__(self, scope, receive, send) -> None:
+        count("rendered")
+        self.set_cookie("session", "value")
+        await super().__call__(scope, receive, send)
+
+
+@get("/session", cache=True)
+def session() -> SessionResponse:
+    count("session")
+    return SessionResponse({"session": True})
+
+
+@route("/both", methods=["GET", "POST"], cache=True)
+def both(request: Request) -> Dict[str, int]:
+    return {"calls": count(request.method)}
+
+
+@get("/user")
+def user(request: Request) -> Dict[str, str]:
+    count("user")
+    return {"user": request.headers.get("authorization", "anonymous")}
+
+
+@get("/private", cache=True, permissions=[HeaderPermission])
+def private() -> Dict[str, int]:
+    return {"calls": count("private")}
+
+
+class ItemsView(APIView):
+    path = "/view"
+    cache = 30
+
+    @get("/")
+    def list_items(self) -> Dict[str, int]:
+        return {"calls": count("view")}
+
+    @get("/live", cache=False)
+    def live(self) -> Dict[str, int]:
+        return {"calls": count("live")}
+
+
+def test_cached_response_is_served_without_calling_the_handler():
+    with create_client(routes=[Gateway(handler=cached)]) as client:
+        first = client.get("/cached")
+        second = client.get("/cached")
+
+    assert first.json() == second.json() == {"calls": 1}
+    assert calls["cached"] == 1
+    assert first.headers["etag"] == second.headers["etag"]
+    assert second.headers["age"] == "0"
+    assert second.headers["content-type"] == "application/json"
+
+
+def test_if_none_match_returns_not_modified():
+    with create_client(routes=[Gateway(handler=cached)]) as client:
+        etag = client.get("/cached").headers["etag"]
+
+        response = client.get("/cached", headers={"if-none-match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "content-length" not in response.headers
+
+        weak = client.get("/cached", headers={"if-none-match": f'"other", W/{etag}'})
+        assert weak.status_code == 304
+
+        response = client.get("/cached", headers={"if-none-match": '"other"'})
+        assert response.status_code == 200
+
+    assert calls["cached"] == 1
+
+
+def test_query_parameters_are_part_of_the_key():
+    with create_client(routes=[Gateway(handler=cached)]) as client:
+        client.get("/cached?a=1&b=2")
+        client.get("/cached?b=2&a=1")
+        assert calls["cached"] == 1
+
+        client.get("/cached?a=2&b=2")
+        assert calls["cached"] == 2
+
+
+def test_vary_headers():
+    with create_client(routes=[Gateway(handler=vary)]) as client:
+        english = client.get("/vary", headers={"accept-language": "en"})
+        client.get("/vary", headers={"accept-language": "en"})
+        portuguese = client.get("/vary", headers={"accept-language": "pt"})
+
+    assert calls["vary"] == 2
+    assert english.json() == {"language": "en"}
+    assert portuguese.json() == {"language": "pt"}
+    assert english.headers["vary"] == "accept-language"
+
+
+def test_stale_while_revalidate(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+
+    with create_client(routes=[Gateway(handler=stale)]) as client:
+        assert client.get("/stale").json() == {"calls": 1}
+
+        clock.now += 15
+        response = client.get("/stale")
+        assert response.json() == {"calls": 1}
+        assert response.headers["age"] == "15"
+        assert calls["stale"] == 2
+
+        clock.now += 1
+        assert client.get("/stale").json() == {"calls": 2}
+
+        clock.now += 100
+        assert client.get("/stale").json() == {"calls": 3}
+
+
+@pytest.mark.parametrize("error", ["value-error", "not-found"])
+def test_failed_revalidation_keeps_the_stale_response(monkeypatch, error):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+
+    with create_client(routes=[Gateway(handler=failing)]) as client:
+        assert client.get(f"/failing/{error}").json() == {"calls": 1}
+
+        clock.now += 15
+        response = client.get(f"/failing/{error}")
+
+        assert response.status_code == 200
+        assert response.json() == {"calls": 1}
+        assert calls[error] == 2
+
+        response = client.get(f"/failing/{error}")
+
+        assert response.json() == {"calls": 1}
+        assert calls[error] == 3
+
+        clock.now += 100
+
+        # Once expired, the errors are raised to the request as usual.
+        expected = 404 if error == "not-found" else 500
+        assert client.get(f"/failing/{error}").status_code == expected
+
+
+def test_invalidate_by_tag():
+    with create_client(routes=[Gateway(handler=item)]) as client:
+        client.get("/items/1")
+        client.get("/items/1")
+        client.get("/items/2")
+
+        anyio.run(client.app.cache_config.invalidate, "item:1")
+
+        assert client.get("/items/1").json() == {"id": 1, "calls": 2}
+        assert client.get("/items/2").json() == {"id": 2, "calls": 1}
+
+        anyio.run(client.app.cache_config.clear)
+
+        assert client.get("/items/2").json() == {"id": 2, "calls": 2}
+
+
+@pytest.mark.parametrize(
+    "path,status_code",
+    [("/cookie", 200), ("/stream", 200), ("/missing", 404), ("/no-store", 200)],
+)
+def test_uncacheable_responses(path, status_code):
+    routes = [Gateway(handler=handler) for handler in (cookie, stream, missing, no_store)]
+
+    with create_client(routes=routes) as client:
+        first = client.get(path)
+        second = client.get(path)
+
+    assert first.status_code == second.status_code == status_code
+    assert first.content == second.content
+    assert "etag" not in second.headers
+    assert calls[path.strip("/")] == 2
+
+
+def test_uncacheable_responses_are_rendered_once():
+    with create_client(routes=[Gateway(handler=session)]) as client:
+        first = client.get("/session")
+        second = client.get("/session")
+
+    assert first.json() == second.json() == {"session": True}
+    assert "session=value" in second.headers["set-cookie"]
+    assert "etag" not in second.headers
+    assert calls == {"session": 2, "rendered": 2}
+
+
+def test_only_get_requests_are_cached():
+    with create_client(routes=[Gateway(handler=both)]) as client:
+        client.get("/both")
+        client.get("/both")
+        client.post("/both")
+        client.post("/both")
+
+    assert calls == {"GET": 1, "POST": 2}
+
+
+def test_permissions_are_checked_on_cache_hits():
+    with create_client(routes=[Gateway(handler=private)]) as client:
+        assert client.get("/private", headers={"allow": "yes"}).status_code == 200
+        assert client.get("/private").status_code == 403
+
+
+@pytest.mark.parametrize("headers", [{"authorization": "Bearer one"}, {"cookie": "session=1"}])
+def test_requests_with_credentials_are_not_cached(headers):
+    with create_client(routes=[Gateway(handler=cached)]) as client:
+        assert client.get("/cached", headers=headers).json() == {"calls": 1}
+        assert client.get("/cached", headers=headers).json() == {"calls": 2}
+        assert client.get("/cached").json() == {"calls": 3}
+        assert client.get("/cached").json() == {"calls": 3}
+        assert client.get("/cached", headers=headers).json() == {"calls": 4}
+
+
+def test_shared_cache_with_credentials():
+    shared = get("/user", cache=Cache(shared=True, vary_headers=["authorization"]))(user.fn)
+
+    with create_client(routes=[Gateway(handler=shared)]) as client:
+        one = {"authorization": "Bearer one"}
+
+        assert client.get("/user", headers=one).json() == {"user": "Bearer one"}
+        assert client.get("/user", headers=one).json() == {"user": "Bearer one"}
+        assert client.get("/user").json() == {"user": "anonymous"}
+
+    assert calls["user"] == 2
+
+
+def test_apiview_cache():
+    with create_client(routes=[Gateway(handler=ItemsView)]) as client:
+        client.get("/view")
+        client.get("/view")
+        client.get("/view/live")
+        client.get("/view/live")
+
+    assert calls == {"view": 1, "live": 2}
+
+
+def test_custom_backend():
+    backend = MemoryCache()
+
+    with create_client(
+        routes=[Gateway(handler=cached)], cache_config=CacheConfig(backend=backend, ttl=5)
+    ) as client:
+        client.get("/cached")
+
+    assert len(backend.entries) == 1
+    entry = next(iter(backend.entries.values()))
+    assert entry.expires_at - entry.created_at == 5
+
+
+def make_entry(body: bytes, tags=()) -> CachedResponse:
+    return CachedResponse(
+        status_code=200,
+        headers=[(b"content-type", b"application/json")],
+        body=body,
+        etag='"etag"',
+        tags=tags,
+        created_at=time.time(),
+        expires_at=time.time() + 60,
+        stale_until=time.time() + 60,
+    )
+
+
+def test_memory_cache_evicts_the_least_recently_used():
+    entry_size = make_entry(b"x" * 100).size
+    backend = MemoryCache(max_size=entry_size * 2)
+
+    async def fill() -> None:
+        await backend.set("a", make_entry(b"x" * 100), 60)
+        await backend.set("b", make_entry(b"x" * 100), 60)
+        await backend.get("a")
+        await backend.set("c", make_entry(b"x" * 100, tags=["c"]), 60)
+        await backend.set("big", make_entry(b"x" * 1000), 60)
+
+    anyio.run(fill)
+
+    assert list(backend.entries) == ["a", "c"]
+    assert backend.size == entry_size * 2
+
+    anyio.run(backend.invalidate_tags, ["c"])
+
+    assert list(backend.entries) == ["a"]
+    assert backend.tags == {}
+
+
+def test_cached_response_encoding():
+    entry = make_entry(b'{"value":\n1}', tags=["a"])
+
+    decoded = CachedResponse.decode(entry.encode())
+
+    assert decoded.body == entry.body
+    assert decoded.headers == entry.headers
+    assert decoded.tags == ["a"]
+    assert decoded.stale_until == entry.stale_until
+
+
+def test_invalid_cache():
+    with pytest.raises(ImproperlyConfigured):
+        get("/invalid", cache="yes")
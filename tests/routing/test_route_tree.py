@@ -0,0 +1,188 @@
+from starlette.routing import Host
+
+from esmerald import Gateway, Include, Request, Router, WebSocket, WebSocketGateway, get, post
+from esmerald.routing.handlers import websocket
+from esmerald.routing.tree import RouteList, RouteTree
+from esmerald.testclient import create_client
+
+
+@get("/")
+async def home() -> str:
+    return "home"
+
+
+@get("/items")
+async def items() -> str:
+    return "items"
+
+
+@get("/items/{item_id:int}")
+async def item(item_id: int) -> int:
+    return item_id
+
+
+@get("/items/{name}")
+async def item_by_name(name: str) -> str:
+    return name
+
+
+@post("/items/{item_id:int}")
+async def create_item(item_id: int) -> int:
+    return item_id
+
+
+@get("/files/{file_path:path}")
+async def files(file_path: str) -> str:
+    return file_path
+
+
+@get("/{slug}.txt")
+async def text(slug: str) -> str:
+    return slug
+
+
+@websocket("/ws")
+async def socket(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"data": "ok"})
+    await socket.close()
+
+
+def paths(routes):
+    return [route.path for route in routes]
+
+
+def test_lookup_static_and_params() -> None:
+    gateways = [
+        Gateway(handler=home),
+        Gateway(handler=items),
+        Gateway(handler=item),
+        Gateway(handler=item_by_name),
+    ]
+    tree = RouteTree(gateways)
+
+    assert paths(tree.lookup("/")) == ["/"]
+    assert paths(tree.lookup("/items")) == ["/items"]
+    assert paths(tree.lookup("/items/1")) == ["/items/{item_id:int}", "/items/{name}"]
+    assert paths(tree.lookup("/items/name")) == ["/items/{name}"]
+    assert tree.lookup("/unknown") == []
+    assert tree.lookup("/items/1/2") == []
+
+
+def test_lookup_path_convertors_and_mounts() -> None:
+    include = Include("/api", routes=[Gateway(handler=items)])
+    tree = RouteTree([Gateway(handler=files), include, Gateway(handler=home)])
+
+    assert paths(tree.lookup("/files/a/b/c")) == ["/files/{file_path:path}"]
+    assert tree.lookup("/api/items") == [include]
+    assert tree.lookup("/api/anything/else") == [include]
+    assert paths(tree.lookup("/")) == ["/"]
+
+
+def test_lookup_keeps_declaration_order_and_fallback() -> None:
+    host = Host("example.com", app=Router(routes=[Gateway(handler=home)]))
+    routes = [Gateway(handler=text), host, Gateway(handler=item_by_name)]
+    tree = RouteTree(routes)
+
+    assert tree.fallback == [1]
+    assert tree.root.prefix_routes == [0]
+    assert tree.lookup("/items/test") == routes
+    assert tree.lookup("/test.txt") == routes[:2]
+
+
+def test_route_list_tracks_changes() -> None:
+    routes = RouteList([1, 2])
+    version = routes.version
+
+    routes.append(3)
+    routes.pop(0)
+    routes.insert(0, 4)
+    routes[0] = 5
+    del routes[0]
+    routes += [6]
+    routes.sort()
+
+    assert routes == [2, 3, 6]
+    assert routes.version == version + 7
+
+
+def test_router_dispatch(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=home),
+            Gateway(handler=items),
+            Gateway(handler=item),
+            Gateway(handler=item_by_name),
+            Gateway(handler=create_item),
+            Gateway(handler=files),
+            Gateway(handler=text),
+            WebSocketGateway(handler=socket),
+        ]
+    ) as client:
+        assert client.get("/").json() == "home"
+        assert client.get("/items").json() == "items"
+        assert client.get("/items/1").json() == 1
+        assert client.post("/items/1").json() == 1
+        assert client.get("/items/test").json() == "test"
+        assert client.get("/files/a/b.txt").json() == "a/b.txt"
+        assert client.get("/readme.txt").json() == "readme"
+        assert client.get("/unknown").status_code == 404
+
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == {"data": "ok"}
+
+
+def test_router_dispatch_method_not_allowed(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=items), Gateway(handler=create_item)]) as client:
+        response = client.put("/items/1")
+
+        assert response.status_code == 405
+
+
+def test_router_dispatch_redirect_slashes(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=items)]) as client:
+        response = client.get("/items/", follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "http://testserver/items"
+
+
+def test_nested_includes(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Include(
+                "/api",
+                routes=[
+                    Include("/v1", routes=[Gateway(handler=items), Gateway(handler=item)]),
+                    Include("/v2", routes=[Gateway(handler=item_by_name)]),
+                ],
+            ),
+            Gateway(handler=home),
+        ]
+    ) as client:
+        assert client.get("/api/v1/items").json() == "items"
+        assert client.get("/api/v1/items/2").json() == 2
+        assert client.get("/api/v2/items/test").json() == "test"
+        assert client.get("/api/v3/items").status_code == 404
+        assert client.get("/").json() == "home"
+
+
+def test_routes_added_after_dispatch(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        assert client.get("/items").status_code == 404
+
+        client.app.add_route("/", items)
+
+        assert client.get("/items").json() == "items"
+
+
+def test_mount_takes_precedence(test_client_factory) -> None:
+    @get("/other")
+    async def other(request: Request) -> str:
+        return "other"
+
+    with create_client(
+        routes=[Include("/api", routes=[Gateway(handler=items)]), Gateway("/api", handler=other)]
+    ) as client:
+        assert client.get("/api/items").json() == "items"
+        assert client.get("/api/other").status_code == 404
@@ -0,0 +1,212 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+from starlette.middleware import Middleware as StarletteMiddleware
+
+from esmerald import Gateway, Request, get
+from esmerald.config.jwt import JWTConfig
+from esmerald.contrib.auth.common.cache import SharedLookupError, TokenCache, UserCache
+from esmerald.contrib.auth.common.middleware import CommonJWTAuthMiddleware
+from esmerald.exceptions import NotAuthorized
+from esmerald.security.jwt.token import Token
+from esmerald.testclient import create_client
+
+jwt_config = JWTConfig(signing_key="secret", user_cache_ttl=60)
+users: Dict[str, Dict[str, Any]] = {"1": {"id": 1, "name": "esmerald"}}
+lookups: List[Any] = []
+
+
+class JWTAuthMiddleware(CommonJWTAuthMiddleware):
+    async def retrieve_user(self, token_sub: Any) -> Dict[str, Any]:
+        lookups.append(token_sub)
+        return users.get(token_sub)
+
+
+def generate_token(sub: str = "1", minutes: int = 20) -> str:
+    token = Token(sub=sub, exp=datetime.now(timezone.utc) + timedelta(minutes=minutes))
+    return token.encode(key=jwt_config.signing_key, algorithm=jwt_config.algorithm)
+
+
+def setup_function() -> None:
+    lookups.clear()
+
+
+def test_token_cache() -> None:
+    cache = TokenCache(max_size=2)
+    encoded = generate_token()
+    token = Token.decode(encoded, key="secret", algorithms=["HS256"])
+
+    cache.set(encoded, token)
+
+    assert cache.get(encoded) is token
+    assert list(cache.tokens) == [TokenCache.get_key(encoded)]
+
+    for sub in ("2", "3"):
+        other = generate_token(sub)
+        cache.set(other, Token.decode(other, key="secret", algorithms=["HS256"]))
+
+    assert cache.get(encoded) is None
+    assert len(cache.tokens) == 2
+
+
+def test_token_cache_expires_with_the_token() -> None:
+    cache = TokenCache()
+    encoded = generate_token()
+    token = Token.decode(encoded, key="secret", algorithms=["HS256"])
+    token.exp = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+    cache.set(encoded, token)
+
+    assert cache.get(encoded) is None
+    assert not cache.tokens
+
+
+@pytest.mark.anyio
+async def test_user_cache_coalesces_the_lookups() -> None:
+    cache: UserCache = UserCache()
+    calls: List[str] = []
+    results: List[Any] = []
+
+    async def loader() -> Dict[str, Any]:
+        calls.append("1")
+        await anyio.sleep(0.05)
+        return users["1"]
+
+    async def lookup() -> None:
+        results.append(await cache.get_or_load("1", loader))
+
+    async with anyio.create_task_group() as group:
+        for _ in range(10):
+            group.start_soon(lookup)
+
+    assert calls == ["1"]
+    assert results == [users["1"]] * 10
+    assert not cache.pending
+
+    await cache.get_or_load("1", loader)
+
+    assert len(calls) == 2  # no ttl, only the concurrent lookups are shared
+
+
+@pytest.mark.anyio
+async def test_user_cache_shares_the_errors() -> None:
+    cache: UserCache = UserCache(ttl=60)
+    calls: List[str] = []
+    errors: List[Exception] = []
+
+    async def loader() -> Dict[str, Any]:
+        calls.append("1")
+        await anyio.sleep(0.05)
+        raise NotAuthorized()
+
+    async def lookup() -> None:
+        try:
+            await cache.get_or_load("1", loader)
+        except NotAuthorized as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(5):
+            group.start_soon(lookup)
+
+    assert calls == ["1"]
+    assert len(errors) == 5
+    assert len({id(error) for error in errors}) == 5
+    assert all(isinstance(error, NotAuthorized) for error in errors)
+    assert not cache.users
+
+
+@pytest.mark.anyio
+async def test_user_cache_wraps_the_errors_that_cannot_be_copied() -> None:
+    class KeyedError(Exception):
+        def __init__(self, message: str, *, key: str) -> None:
+            super().__init__(message)
+            self.key = key
+
+    cache: UserCache = UserCache()
+    errors: List[Exception] = []
+
+    async def loader() -> Dict[str, Any]:
+        await anyio.sleep(0.05)
+        raise KeyedError("failed", key="1")
+
+    async def lookup() -> None:
+        try:
+            await cache.get_or_load("1", loader)
+        except Exception as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(lookup)
+
+    original = [error for error in errors if isinstance(error, KeyedError)]
+    shared = [error for error in errors if isinstance(error, SharedLookupError)]
+
+    assert len(original) == 1
+    assert len(shared) == 2
+    assert all(error.__cause__ is original[0] for error in shared)
+
+
+@pytest.mark.anyio
+async def test_user_cache_revalidation_window(monkeypatch) -> None:
+    cache: UserCache = UserCache(ttl=10)
+    now = [100.0]
+    monkeypatch.setattr("esmerald.contrib.auth.common.cache.time.monotonic", lambda: now[0])
+
+    async def loader() -> Dict[str, Any]:
+        lookups.append("1")
+        return users["1"]
+
+    await cache.get_or_load("1", loader)
+    await cache.get_or_load("1", loader)
+
+    assert lookups == ["1"]
+
+    now[0] += 10
+
+    await cache.get_or_load("1", loader)
+
+    assert lookups == ["1", "1"]
+
+    await cache.invalidate("1")
+    await cache.get_or_load("1", loader)
+
+    assert lookups == ["1", "1", "1"]
+
+
+def test_jwt_middleware_caches(test_client_factory, monkeypatch) -> None:
+    decodes: List[str] = []
+    decode = Token.decode
+
+    def counted(*args: Any, **kwargs: Any) -> Token:
+        decodes.append(kwargs["token"])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(Token, "decode", staticmethod(counted))
+
+    @get("/me")
+    async def me(request: Request) -> Dict[str, Any]:
+        return request.user
+
+    with create_client(
+        routes=[Gateway(handler=me)],
+        middleware=[
+            StarletteMiddleware(JWTAuthMiddleware, config=jwt_config, user_model=None)
+        ],
+    ) as client:
+        headers = {jwt_config.api_key_header: f"Bearer {generate_token()}"}
+
+        for _ in range(3):
+            response = client.get("/me", headers=headers)
+
+            assert response.json() == users["1"]
+
+        assert len(decodes) == 1
+        assert lookups == ["1"]
+
+        response = client.get("/me", headers={jwt_config.api_key_header: "Bearer invalid"})
+
+        assert response.status_code == 401
@@ -0,0 +1,120 @@
+import threading
+from typing import Any, List
+
+import anyio
+import pytest
+import sniffio
+
+from esmerald.concurrency import get_limiter_statistics, run_in_limiter
+from esmerald.conf import settings
+from esmerald.contrib.auth.edgy.base_user import AbstractUser as EdgyUser
+from esmerald.contrib.auth.hashers import (
+    PASSWORD_HASHERS_LIMITER,
+    acheck_password,
+    amake_password,
+    check_password,
+    make_password,
+)
+from esmerald.contrib.auth.saffier.base_user import AbstractUser as SaffierUser
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_amake_password_and_acheck_password() -> None:
+    encoded = await amake_password("esmerald")
+
+    assert encoded.startswith("pbkdf2_sha256$")
+    assert check_password("esmerald", encoded)
+    assert await acheck_password("esmerald", encoded)
+    assert not await acheck_password("saffier", encoded)
+    assert not await acheck_password(None, encoded)
+    assert not await acheck_password("esmerald", await amake_password(None))
+    assert not await acheck_password("esmerald", "gibberish$hash")
+
+
+async def test_hashing_runs_outside_the_event_loop(monkeypatch) -> None:
+    threads: List[threading.Thread] = []
+    encode = make_password
+
+    def hash_password(*args: str) -> str:
+        threads.append(threading.current_thread())
+        return encode(*args)
+
+    monkeypatch.setattr("esmerald.contrib.auth.hashers.make_password", hash_password)
+
+    await amake_password("esmerald")
+
+    assert threads and threads[0] is not threading.current_thread()
+
+    statistics = get_limiter_statistics(PASSWORD_HASHERS_LIMITER)
+
+    assert statistics[0].total_tokens == settings.password_hashers_workers
+    assert statistics[0].borrowed_tokens == 0
+
+
+async def test_acheck_password_awaits_the_setter() -> None:
+    encoded = make_password("esmerald", "pbkdf2_sha1")
+    updated: List[str] = []
+
+    async def setter(password: str) -> None:
+        updated.append(password)
+
+    assert await acheck_password("esmerald", encoded, setter)
+    assert updated == ["esmerald"]
+
+    assert await acheck_password("esmerald", encoded, updated.append)
+    assert updated == ["esmerald", "esmerald"]
+
+    assert not await acheck_password("saffier", encoded, setter)
+    assert len(updated) == 2
+
+
+class StoredUser:
+    def __init__(self, password: str) -> None:
+        self.password = password
+        self._password = None
+        self.updates: List[Any] = []
+
+    async def update(self, **kwargs: Any) -> None:
+        self.updates.append(kwargs)
+
+
+@pytest.mark.parametrize("model", [EdgyUser, SaffierUser], ids=["edgy", "saffier"])
+async def test_check_password_upgrades_the_hash_once(model) -> None:
+    outdated = make_password("esmerald", "pbkdf2_sha1")
+    user = StoredUser(outdated)
+
+    assert await model.check_password(user, "esmerald")
+    assert user.password != outdated
+    assert user.updates == [{"password": user.password}]
+    assert user._password is None
+    assert check_password("esmerald", user.password)
+
+
+async def test_limiter_statistics_show_the_queue_depth() -> None:
+    release = threading.Event()
+    name = f"queue_depth_{sniffio.current_async_library()}"
+    statistics = []
+
+    async def run() -> None:
+        await run_in_limiter(name, 1, release.wait, 5)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(run)
+        await anyio.sleep(0.1)
+        statistics = get_limiter_statistics(name)
+        release.set()
+
+    assert len(statistics) == 1
+    assert statistics[0].borrowed_tokens == 1
+    assert statistics[0].tasks_waiting == 2
+
+
+async def test_process_executor(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "password_hashers_executor", "process")
+
+    encoded = await amake_password("esmerald")
+
+    assert await acheck_password("esmerald", encoded)
+    assert not await acheck_password("saffier", encoded)
@@ -0,0 +1,121 @@
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List
+
+import anyio
+from pydantic import BaseModel
+
+from esmerald import Gateway, get
+from esmerald.datastructures import NDJSON, JSONStream
+from esmerald.testclient import create_client
+
+
+class Item(BaseModel):
+    name: str
+    value: int
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+def items(total: int) -> Iterator[Item]:
+    for value in range(total):
+        yield Item(name=f"item-{value}", value=value)
+
+
+async def dicts(total: int) -> AsyncIterator[dict]:
+    for value in range(total):
+        yield {"name": f"item-{value}", "value": value}
+
+
+async def collect(container: JSONStream) -> List[bytes]:
+    return [chunk async for chunk in container.stream()]
+
+
+def test_stream_batches() -> None:
+    chunks = anyio.run(collect, JSONStream[Item](iterator=list(items(5)), batch_size=2))
+
+    assert len(chunks) == 5
+    assert chunks[0] == b"["
+    assert chunks[-1] == b"]"
+    assert json.loads(b"".join(chunks)) == [{"name": f"item-{i}", "value": i} for i in range(5)]
+
+
+def test_stream_untyped_items() -> None:
+    values = [Item(name="item", value=1), Tag(name="tag"), {"name": "dict"}]
+    chunks = anyio.run(collect, JSONStream(iterator=values))
+
+    assert json.loads(b"".join(chunks)) == [
+        {"name": "item", "value": 1},
+        {"name": "tag"},
+        {"name": "dict"},
+    ]
+
+
+def test_stream_empty() -> None:
+    assert b"".join(anyio.run(collect, JSONStream(iterator=[]))) == b"[]"
+    assert b"".join(anyio.run(collect, NDJSON(iterator=[]))) == b""
+
+
+@get("/items")
+def json_items() -> JSONStream[Item]:
+    return JSONStream[Item](iterator=items(250))
+
+
+@get("/async")
+async def json_async() -> JSONStream:
+    return JSONStream(iterator=dicts(3), batch_size=2)
+
+
+@get("/ndjson")
+async def ndjson_items() -> NDJSON[Item]:
+    return NDJSON[Item](iterator=lambda: dicts(3))
+
+
+def test_json_stream_response(test_client_factory) -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=json_items),
+            Gateway(handler=json_async),
+            Gateway(handler=ndjson_items),
+        ]
+    ) as client:
+        response = client.get("/items")
+
+        assert response.headers["content-type"] == "application/json"
+        assert len(response.json()) == 250
+        assert response.json()[-1] == {"name": "item-249", "value": 249}
+
+        response = client.get("/async")
+
+        assert response.json() == [{"name": f"item-{i}", "value": i} for i in range(3)]
+
+        response = client.get("/ndjson")
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"name": f"item-{i}", "value": i} for i in range(3)
+        ]
+
+
+def test_json_stream_openapi(test_client_factory) -> None:
+    with create_client(
+        routes=[Gateway(handler=json_items), Gateway(handler=ndjson_items)],
+        enable_openapi=True,
+    ) as client:
+        schema = client.get("/openapi.json").json()
+
+        items_content = schema["paths"]["/items"]["get"]["responses"]["200"]["content"]
+        ndjson_content = schema["paths"]["/ndjson"]["get"]["responses"]["200"]["content"]
+
+        assert items_content["application/json"]["schema"] == {
+            "type": "array",
+            "items": {"$ref": "#/components/schemas/Item"},
+            "title": "Item",
+        }
+        assert ndjson_content["application/x-ndjson"]["schema"] == {
+            "$ref": "#/components/schemas/Item"
+        }
+        assert "Item" in schema["components"]["schemas"]
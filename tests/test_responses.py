@@ -1,5 +1,14 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
 from starlette import status
 
+from esmerald.conf import settings
+from esmerald.enums import JSONEncoderType
+from esmerald.responses import Response
 from esmerald.responses.encoders import ORJSONResponse, UJSONResponse
 from esmerald.routing.gateways import Gateway
 from esmerald.routing.handlers import get
@@ -28,3 +37,72 @@ def test_ujson_orjson(test_client_factory):
         response = client.get("/two")
 
         assert response.json() == {"test": 2}
+
+
+class Item(BaseModel):
+    name: str
+    created_at: datetime
+
+
+@dataclass
+class Tag:
+    name: str
+    value: int
+
+
+def test_render_orjson_encoder() -> None:
+    content = {
+        "item": Item(name="esmerald", created_at=datetime(2023, 1, 1)),
+        "items": [Item(name="test", created_at=datetime(2023, 1, 2))],
+        "tag": Tag(name="tag", value=1),
+        "id": UUID("a3ec7d3c-5c2a-4b45-9a6c-2c4f1a5c2e41"),
+        "day": date(2023, 1, 1),
+        1: "one",
+    }
+
+    assert Response(content).render(content) == (
+        b'{"item":{"name":"esmerald","created_at":"2023-01-01T00:00:00"},'
+        b'"items":[{"name":"test","created_at":"2023-01-02T00:00:00"}],'
+        b'"tag":{"name":"tag","value":1},"id":"a3ec7d3c-5c2a-4b45-9a6c-2c4f1a5c2e41",'
+        b'"day":"2023-01-01","1":"one"}'
+    )
+
+
+def test_render_json_encoder(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "json_encoder", JSONEncoderType.JSON)
+    content = {"tag": Tag(name="tag", value=1), "name": "esmerald"}
+
+    assert Response(content).render(content) == (
+        b'{"tag": {"name": "tag", "value": 1}, "name": "esmerald"}'
+    )
+
+
+def test_render_response_json_encoder() -> None:
+    class JSONResponse(Response):
+        json_encoder = JSONEncoderType.JSON
+
+    content = {"name": "esmerald"}
+
+    assert JSONResponse(content).render(content) == b'{"name": "esmerald"}'
+    assert Response(content).render(content) == b'{"name":"esmerald"}'
+
+
+def test_render_integers_wider_than_64_bits() -> None:
+    content = {"value": 2**70, "tag": Tag(name="tag", value=1)}
+
+    assert Response(content).render(content) == (
+        b'{"value": 1180591620717411303424, "tag": {"name": "tag", "value": 1}}'
+    )
+
+
+def test_render_custom_transform() -> None:
+    class CustomResponse(Response):
+        @staticmethod
+        def transform(value: Any) -> Any:
+            if isinstance(value, BaseModel):
+                return value.model_dump(include={"name"})
+            raise TypeError("unsupported type")
+
+    content = Item(name="esmerald", created_at=datetime(2023, 1, 1))
+
+    assert CustomResponse(content).render(content) == b'{"name":"esmerald"}'
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from esmerald import Form, Gateway, Inject, Injects, Request, post
+from esmerald.testclient import create_client
+from esmerald.transformers.model import TransformerModel
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+@post("/items")
+async def create_item(data: Item) -> Item:
+    return data
+
+
+@post("/raw")
+async def create_raw(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+@post("/optional")
+async def create_optional(data: Optional[Item] = None) -> Optional[Item]:
+    return data
+
+
+@post("/form")
+async def create_form(data: Item = Form()) -> Item:
+    return data
+
+
+def get_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+@post("/depends", dependencies={"raw": Inject(get_data)})
+async def create_with_dependency(data: Item, raw: Dict[str, Any] = Injects()) -> Dict[str, Any]:
+    return raw
+
+
+def get_parameter_model(handler) -> TransformerModel:
+    Gateway(handler=handler)
+    handler.create_signature_model()
+    return handler.transformer
+
+
+def test_body_model() -> None:
+    assert get_parameter_model(create_item).body_model is Item
+    assert get_parameter_model(create_raw).body_model is None
+    assert get_parameter_model(create_optional).body_model is None
+    assert get_parameter_model(create_form).body_model is None
+    assert get_parameter_model(create_with_dependency).body_model is None
+
+
+def test_body_validated_from_the_raw_bytes(test_client_factory, monkeypatch) -> None:
+    parsed: List[Any] = []
+    json = Request.json
+
+    async def count_json(self: Request) -> Any:
+        parsed.append(self.url.path)
+        return await json(self)
+
+    monkeypatch.setattr(Request, "json", count_json)
+
+    with create_client(
+        routes=[Gateway(handler=create_item), Gateway(handler=create_with_dependency)]
+    ) as client:
+        response = client.post("/items", json={"name": "esmerald", "price": 1.5, "tags": ["a"]})
+
+        assert response.status_code == 201
+        assert response.json() == {"name": "esmerald", "price": 1.5, "tags": ["a"]}
+        assert parsed == []
+
+        response = client.post("/depends", json={"name": "esmerald", "price": 1.5})
+
+        assert response.json() == {"name": "esmerald", "price": 1.5}
+        assert parsed == ["/depends"]
+
+
+def test_body_errors_keep_their_structure(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=create_item)]) as client:
+        response = client.post("/items", json={"name": "esmerald", "price": "free"})
+
+        assert response.status_code == 400
+        errors = response.json()["errors"]
+
+        assert [error["loc"] for error in errors] == [["data", "price"]]
+        assert errors[0]["type"] == "float_parsing"
+
+        response = client.post("/items", content=b"")
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["loc"] == ["data"]
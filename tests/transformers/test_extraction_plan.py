@@ -0,0 +1,59 @@
+from esmerald import Cookie, Gateway, Header, Query, get
+from esmerald.testclient import create_client
+from esmerald.transformers.model import TransformerModel
+
+
+@get("/items/{item_id}")
+async def item(item_id: int, q: str = Query(default="query")) -> dict:
+    return {"item_id": item_id, "q": q}
+
+
+@get("/headers")
+async def headers(
+    token: str = Header(value="X-Token"), session: str = Cookie(value="session")
+) -> dict:
+    return {"token": token, "session": session}
+
+
+def get_parameter_model(handler) -> TransformerModel:
+    Gateway(handler=handler)
+    handler.create_signature_model()
+    return handler.transformer
+
+
+def test_plan_only_contains_declared_sources() -> None:
+    plan = get_parameter_model(item).extraction_plan
+    sources = [source for source, _ in plan]
+
+    assert sources == ["query_params", "path_params"]
+    assert dict(plan)["query_params"] == (("q", "q", "query", False),)
+    assert [step[0] for step in dict(plan)["path_params"]] == ["item_id"]
+
+
+def test_plan_with_headers_and_cookies() -> None:
+    plan = get_parameter_model(headers).extraction_plan
+
+    assert dict(plan) == {
+        "headers": (("token", "X-Token", None, False),),
+        "cookies": (("session", "session", None, False),),
+    }
+
+
+def test_extraction(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=headers)]) as client:
+        response = client.get("/items/1")
+        assert response.json() == {"item_id": 1, "q": "query"}
+
+        response = client.get("/items/1", params={"q": "test"})
+        assert response.json() == {"item_id": 1, "q": "test"}
+
+        response = client.get("/headers", headers={"X-Token": "abc"}, cookies={"session": "s"})
+        assert response.json() == {"token": "abc", "session": "s"}
+
+
+def test_extraction_missing_required(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=headers)]) as client:
+        response = client.get("/headers", cookies={"session": "s"})
+
+        assert response.status_code == 400
+        assert response.json()["errors"][0]["loc"] == ["token"]
@@ -0,0 +1,111 @@
+from datetime import date
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from esmerald import Gateway, Query, Request, get, post
+from esmerald.testclient import create_client
+from esmerald.transformers.datastructures import EsmeraldSignature
+from esmerald.transformers.validation import FastPathValidator, is_primitive_annotation
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Item(BaseModel):
+    name: str
+
+
+@get("/items/{item_id}")
+async def read_item(
+    request: Request,
+    item_id: int,
+    color: Color,
+    uid: Optional[UUID] = None,
+    day: Optional[date] = None,
+    limit: int = Query(default=10, gt=0),
+) -> dict:
+    return {
+        "item_id": item_id,
+        "color": color.value,
+        "uid": str(uid) if uid else None,
+        "day": day.isoformat() if day else None,
+        "limit": limit,
+    }
+
+
+@post("/items")
+async def create_item(data: Item) -> Item:
+    return data
+
+
+def get_signature_model(handler) -> EsmeraldSignature:
+    Gateway(handler=handler)
+    handler.create_signature_model()
+    return handler.signature_model
+
+
+def test_is_primitive_annotation() -> None:
+    assert is_primitive_annotation(int)
+    assert is_primitive_annotation(Optional[UUID])
+    assert is_primitive_annotation(Color)
+    assert not is_primitive_annotation(Item)
+    assert not is_primitive_annotation(Optional[Item])
+    assert not is_primitive_annotation(list)
+
+
+def test_fast_validator_only_for_primitives() -> None:
+    assert isinstance(get_signature_model(read_item).fast_validator, FastPathValidator)
+    assert get_signature_model(create_item).fast_validator is None
+
+
+def test_fast_validator_matches_model() -> None:
+    signature_model = get_signature_model(read_item)
+    values = {
+        "request": None,
+        "item_id": "1",
+        "color": "red",
+        "uid": "0b4d3c4e-5d0c-4bf8-a2b4-3c5c07c6b0f1",
+        "day": "2023-10-10",
+    }
+
+    validated = signature_model.fast_validator.validate(values)
+    model = signature_model(**values)
+
+    assert validated == {key: getattr(model, key) for key in signature_model.model_fields}
+
+
+def test_fast_validator_gives_up_on_errors() -> None:
+    validator = get_signature_model(read_item).fast_validator
+
+    assert validator.validate({"request": None, "item_id": "a", "color": "red"}) is None
+    assert validator.validate({"request": None, "item_id": 1, "color": "red", "limit": 0}) is None
+    assert validator.validate({"request": None, "color": "red"}) is None
+
+
+def test_fast_path_requests(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=read_item)]) as client:
+        response = client.get("/items/1", params={"color": "blue", "day": "2023-10-10"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "item_id": 1,
+            "color": "blue",
+            "uid": None,
+            "day": "2023-10-10",
+            "limit": 10,
+        }
+
+
+def test_fast_path_error_shape(test_client_factory) -> None:
+    with create_client(routes=[Gateway(handler=read_item)]) as client:
+        response = client.get("/items/1", params={"color": "green", "limit": 0})
+
+        assert response.status_code == 400
+        errors = response.json()["errors"]
+        assert [error["loc"] for error in errors] == [["color"], ["limit"]]
+        assert [error["type"] for error in errors] == ["enum", "greater_than"]